@@ -0,0 +1,304 @@
+"""
+Calibration Snapshot for Conduit Monism
+
+Compiles the calibration sources into one versioned binary snapshot so that
+short-lived scripts can load the calibrated state table without rebuilding
+every GroundedState from the Python definitions.
+
+Files (written next to this module):
+    calibration_snapshot.bin   Raw structured array, one row per state,
+                               memory-mapped read-only on load
+    calibration_snapshot.json  Metadata sidecar: format version, array dtype,
+                               source fingerprints, thresholds from
+                               calibration_table.json
+
+The snapshot is only used while it matches its sources (mapping_functions.py,
+calibration_table.json, grounded_states.json). Any change to those files makes
+it stale, and the library falls back to the Python definitions until it is
+rebuilt.
+
+Usage:
+    python calibration/calibration_snapshot.py build
+    python calibration/calibration_snapshot.py status
+
+Version: 1.0
+Date: 2026-01-21
+Framework: Conduit Monism v9.2
+"""
+
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mapping_functions import (
+    CONFIDENCE_CODES,
+    CalibrationRegistry,
+    build_calibration_registry,
+    get_calibrated_states,
+)
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+CALIBRATION_DIR = Path(__file__).parent
+SNAPSHOT_NAME = "calibration_snapshot"
+
+# Files whose contents determine the snapshot
+SOURCE_FILES = ("mapping_functions.py", "calibration_table.json", "grounded_states.json")
+
+
+def snapshot_paths(directory: Path = CALIBRATION_DIR) -> Tuple[Path, Path]:
+    """Return (array_path, sidecar_path) for a snapshot directory."""
+    directory = Path(directory)
+    return directory / f"{SNAPSHOT_NAME}.bin", directory / f"{SNAPSHOT_NAME}.json"
+
+
+def _sha256(path: Path) -> str:
+    """Content hash of a file (hashlib is imported lazily to keep loads cheap)."""
+    import hashlib
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _fingerprint(path: Path) -> Dict:
+    """Size, mtime and content hash of a source file."""
+    stat = path.stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _sha256(path),
+    }
+
+
+def _grounded_json_drift(directory: Path, registry: CalibrationRegistry) -> List[str]:
+    """States whose values in grounded_states.json differ from the Python definitions."""
+    path = directory / "grounded_states.json"
+    if not path.exists():
+        return []
+    exported = json.loads(path.read_text()).get("states", {})
+    drift = []
+    for i, name in enumerate(registry.names):
+        entry = exported.get(name)
+        if entry is None:
+            drift.append(name)
+            continue
+        values = [entry[v]["value"] for v in ("phi", "tau", "rho", "H", "kappa")]
+        if not np.allclose(values, registry.values[i]):
+            drift.append(name)
+    return drift
+
+
+# =============================================================================
+# Build
+# =============================================================================
+
+def build_snapshot(directory: Path = CALIBRATION_DIR) -> Dict:
+    """
+    Compile the calibration sources into a snapshot.
+
+    Args:
+        directory: Directory holding the sources; the snapshot is written here
+
+    Returns:
+        The metadata written to the JSON sidecar
+    """
+    from datetime import datetime
+
+    directory = Path(directory)
+    array_path, sidecar_path = snapshot_paths(directory)
+
+    registry = build_calibration_registry(get_calibrated_states())
+    states = registry.states
+
+    key_len = max(len(n) for n in registry.names)
+    label_len = max(len(l) for l in registry.labels)
+    dtype = np.dtype([
+        ("key", f"U{key_len}"),
+        ("label", f"U{label_len}"),
+        ("values", "f8", (5,)),
+        ("density", "f8"),
+        ("confidence", "i1"),
+        ("value_confidence", "i1", (5,)),
+        ("empirical_range", "f8", (5, 2)),
+    ])
+
+    table = np.zeros(len(registry), dtype=dtype)
+    table["key"] = registry.names
+    table["label"] = registry.labels
+    table["values"] = registry.values
+    table["density"] = registry.density
+    table["confidence"] = registry.confidence
+    table["value_confidence"] = [
+        [CONFIDENCE_CODES[cv.confidence] for cv in (s.phi, s.tau, s.rho, s.H, s.kappa)]
+        for s in states.values()
+    ]
+    table["empirical_range"] = registry.empirical_range
+
+    calibration_table = {}
+    table_path = directory / "calibration_table.json"
+    if table_path.exists():
+        calibration_table = json.loads(table_path.read_text())
+
+    metadata = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "built_at": datetime.now().isoformat(),
+        "n_states": len(registry),
+        "dtype": np.lib.format.dtype_to_descr(dtype),
+        "calibration_version": calibration_table.get("metadata", {}).get("version"),
+        "key_thresholds": {
+            key: entry.get("value")
+            for key, entry in calibration_table.get("key_thresholds", {}).items()
+        },
+        "grounded_states_json_drift": _grounded_json_drift(directory, registry),
+        "sources": {
+            name: _fingerprint(directory / name)
+            for name in SOURCE_FILES
+            if (directory / name).exists()
+        },
+    }
+
+    # Write the array first so a sidecar never points at a missing table
+    tmp_array = array_path.with_suffix(".tmp")
+    table.tofile(tmp_array)
+    os.replace(tmp_array, array_path)
+    tmp_sidecar = sidecar_path.with_suffix(".tmp.json")
+    tmp_sidecar.write_text(json.dumps(metadata, indent=2))
+    os.replace(tmp_sidecar, sidecar_path)
+
+    return metadata
+
+
+# =============================================================================
+# Load
+# =============================================================================
+
+def _read_sidecar(sidecar_path: Path) -> Optional[Dict]:
+    """Parse the JSON sidecar, or None when missing or unreadable."""
+    try:
+        return json.loads(sidecar_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _check_fresh(directory: Path, metadata: Optional[Dict]) -> Tuple[bool, str]:
+    """Compare sidecar metadata against the current source files."""
+    if metadata is None:
+        return False, "snapshot not built"
+
+    if metadata.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return False, f"format version {metadata.get('format_version')} != {SNAPSHOT_FORMAT_VERSION}"
+
+    recorded = metadata.get("sources", {})
+    for name in SOURCE_FILES:
+        path = directory / name
+        if not path.exists():
+            if name in recorded:
+                return False, f"{name} removed"
+            continue
+        if name not in recorded:
+            return False, f"{name} not in snapshot"
+        stat = path.stat()
+        entry = recorded[name]
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            continue
+        # Stat differs (e.g. fresh checkout): fall back to the content hash
+        if _sha256(path) != entry["sha256"]:
+            return False, f"{name} changed"
+
+    return True, "fresh"
+
+
+def snapshot_status(directory: Path = CALIBRATION_DIR) -> Tuple[bool, str]:
+    """
+    Check whether the snapshot in `directory` matches its sources.
+
+    Compares file sizes and modification times first, and only hashes a
+    source when its stat fingerprint differs.
+
+    Returns:
+        (fresh, reason)
+    """
+    directory = Path(directory)
+    array_path, sidecar_path = snapshot_paths(directory)
+    if not array_path.exists():
+        return False, "snapshot not built"
+    return _check_fresh(directory, _read_sidecar(sidecar_path))
+
+
+def _descr_to_dtype(descr: List) -> np.dtype:
+    """Rebuild a structured dtype from its JSON-decoded descr."""
+    return np.dtype([
+        (field[0], field[1], tuple(field[2])) if len(field) == 3 else (field[0], field[1])
+        for field in descr
+    ])
+
+
+def load_snapshot_registry(directory: Path = CALIBRATION_DIR) -> Optional[CalibrationRegistry]:
+    """
+    Load a CalibrationRegistry from the snapshot.
+
+    The columnar arrays are read-only views into a memory map of the
+    snapshot file; full GroundedState objects are built lazily on first
+    access to `registry.states`.
+
+    Returns:
+        CalibrationRegistry, or None when the snapshot is missing or stale
+    """
+    directory = Path(directory)
+    array_path, sidecar_path = snapshot_paths(directory)
+    metadata = _read_sidecar(sidecar_path)
+    fresh, _ = _check_fresh(directory, metadata)
+    if not fresh:
+        return None
+
+    try:
+        dtype = _descr_to_dtype(metadata["dtype"])
+        with open(array_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        table = np.frombuffer(buffer, dtype=dtype)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if table.shape[0] != metadata.get("n_states"):
+        return None
+
+    names = tuple(table["key"].tolist())
+    return CalibrationRegistry(
+        names=names,
+        labels=tuple(table["label"].tolist()),
+        index=MappingProxyType({name: i for i, name in enumerate(names)}),
+        values=table["values"],
+        density=table["density"],
+        confidence=table["confidence"],
+        empirical_range=table["empirical_range"],
+        value_confidence=table["value_confidence"],
+        source="snapshot",
+    )
+
+
+# =============================================================================
+# Main Execution
+# =============================================================================
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+
+    if command == "build":
+        meta = build_snapshot()
+        array_path, sidecar_path = snapshot_paths()
+        print(f"Built snapshot: {meta['n_states']} states")
+        print(f"  {array_path}")
+        print(f"  {sidecar_path}")
+        if meta["grounded_states_json_drift"]:
+            print("  Warning: grounded_states.json differs from Python definitions for: "
+                  f"{', '.join(meta['grounded_states_json_drift'])}")
+    elif command == "status":
+        fresh, reason = snapshot_status()
+        print(f"Snapshot: {'FRESH' if fresh else 'STALE'} ({reason})")
+    else:
+        print("Usage: python calibration/calibration_snapshot.py [build|status]")
+        sys.exit(1)
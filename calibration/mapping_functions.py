@@ -10,12 +10,17 @@ Framework: Conduit Monism v9.2
 Updated: Integrated Compass research data (Ketamine PCI = 0.44 mean)
 """
 
+import functools
 import json
 import math
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
 
 
 class Confidence(Enum):
@@ -25,7 +30,13 @@ class Confidence(Enum):
     THEORETICAL = "THEORETICAL"
 
 
-@dataclass
+# Ordinal codes for columnar storage (higher = more confident)
+CONFIDENCE_ORDER = (Confidence.THEORETICAL, Confidence.LOW,
+                    Confidence.MODERATE, Confidence.HIGH)
+CONFIDENCE_CODES = {c: i for i, c in enumerate(CONFIDENCE_ORDER)}
+
+
+@dataclass(frozen=True)
 class CalibratedValue:
     """A framework variable value with empirical grounding."""
     value: float
@@ -34,6 +45,7 @@ class CalibratedValue:
     empirical_measure: Optional[float] = None
     empirical_range: Optional[tuple] = None
     notes: str = ""
+    derivation: str = field(default="", compare=False)  # Producing mapping function
 
     def to_dict(self) -> dict:
         return {
@@ -46,10 +58,19 @@ class CalibratedValue:
         }
 
 
+def _derived(func):
+    """Record the producing mapping function in CalibratedValue.derivation."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return replace(func(*args, **kwargs), derivation=func.__name__)
+    return wrapper
+
+
 # =============================================================================
 # ρ (Rho): Re-entrant Binding ← PCI
 # =============================================================================
 
+@_derived
 def pci_to_rho(pci: float) -> CalibratedValue:
     """
     Map Perturbational Complexity Index to ρ (binding).
@@ -86,6 +107,7 @@ def _clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     return max(min_val, min(max_val, value))
 
 
+@_derived
 def pci_range_to_rho(pci_min: float, pci_max: float) -> CalibratedValue:
     """
     Map PCI range to ρ using midpoint.
@@ -116,6 +138,7 @@ def pci_range_to_rho(pci_min: float, pci_max: float) -> CalibratedValue:
 # Baseline LZc for normalization (waking state)
 LZC_BASELINE = 0.50  # Normalized baseline
 
+@_derived
 def lzc_to_H(lzc_normalized: float) -> CalibratedValue:
     """
     Map Lempel-Ziv Complexity to H (entropy).
@@ -146,6 +169,7 @@ def lzc_to_H(lzc_normalized: float) -> CalibratedValue:
     )
 
 
+@_derived
 def lzc_percent_change_to_H(percent_change: float, baseline: float = LZC_BASELINE) -> CalibratedValue:
     """
     Map LZc percent change from baseline to H.
@@ -177,6 +201,7 @@ def lzc_percent_change_to_H(percent_change: float, baseline: float = LZC_BASELIN
 # Baseline temporal integration window in milliseconds (Pöppel 1997)
 TAU_BASELINE_MS = 3000  # 3 seconds
 
+@_derived
 def temporal_window_to_tau(window_ms: float) -> CalibratedValue:
     """
     Map temporal integration window to τ (temporal depth).
@@ -210,6 +235,7 @@ def temporal_window_to_tau(window_ms: float) -> CalibratedValue:
     )
 
 
+@_derived
 def subjective_time_to_tau(description: str) -> CalibratedValue:
     """
     Map subjective time descriptions to τ.
@@ -255,6 +281,7 @@ def subjective_time_to_tau(description: str) -> CalibratedValue:
 # Baseline effective connectivity (waking state = 1.0 for relative measures)
 PHI_BASELINE = 0.80  # Waking baseline in framework units
 
+@_derived
 def effective_connectivity_to_phi(
     connectivity_ratio: float,
     baseline: float = PHI_BASELINE
@@ -283,6 +310,7 @@ def effective_connectivity_to_phi(
     )
 
 
+@_derived
 def connectivity_reduction_to_phi(
     percent_reduction: float,
     baseline: float = PHI_BASELINE
@@ -315,6 +343,7 @@ def connectivity_reduction_to_phi(
 # κ (Kappa): Coherence ← Phase-Locking / Fractal Dimension
 # =============================================================================
 
+@_derived
 def coherence_descriptive_to_kappa(description: str) -> CalibratedValue:
     """
     Map coherence descriptions to κ.
@@ -355,11 +384,297 @@ def coherence_descriptive_to_kappa(description: str) -> CalibratedValue:
     )
 
 
+# MSE slope anchors (SampEn vs ln(scale) relative to SampEn at scale 1;
+# m=2, r=0.15 SD, scales 1-20): white noise decays, 1/f noise is flat
+MSE_SLOPE_WHITE = -0.20
+MSE_SLOPE_PINK = 0.00
+KAPPA_WHITE = 0.20   # "random" in coherence_descriptive_to_kappa
+KAPPA_PINK = 0.85    # "fractal"
+
+@_derived
+def mse_to_kappa(mse_slope: float) -> CalibratedValue:
+    """
+    Map the multiscale-entropy slope to κ.
+
+    Structured complexity keeps its entropy across coarse-graining scales
+    (1/f noise), while unstructured noise loses it (white noise), so κ is
+    interpolated linearly between those two anchors and clamped to [0, 1].
+    See multiscale_entropy.py for computing the slope from signals.
+
+    Args:
+        mse_slope: Slope of SampEn vs ln(scale), relative to SampEn at scale 1
+
+    Returns:
+        CalibratedValue with κ
+    """
+    if not math.isfinite(mse_slope):
+        raise ValueError(f"MSE slope must be finite, got {mse_slope}")
+
+    fraction = (mse_slope - MSE_SLOPE_WHITE) / (MSE_SLOPE_PINK - MSE_SLOPE_WHITE)
+    kappa_value = _clamp(KAPPA_WHITE + fraction * (KAPPA_PINK - KAPPA_WHITE))
+
+    return CalibratedValue(
+        value=kappa_value,
+        confidence=Confidence.MODERATE,
+        source="MSE slope",
+        empirical_measure=mse_slope,
+        notes=f"κ from MSE slope {mse_slope:+.3f} (white {MSE_SLOPE_WHITE}, 1/f {MSE_SLOPE_PINK}; Costa et al. 2002)"
+    )
+
+
+# =============================================================================
+# Batch Mapping (array in / array out)
+# =============================================================================
+
+# Source ids stored in batch results (index into SOURCE_NAMES)
+SOURCE_NAMES = (
+    "no data",
+    "manual override",
+    "PCI direct mapping",
+    "PCI range midpoint",
+    "LZc normalized",
+    "LZc percent change",
+    "Temporal window normalization",
+    "Connectivity reduction",
+    "MSE slope",
+)
+SOURCE_CODES = {name: i for i, name in enumerate(SOURCE_NAMES)}
+
+# One element per measurement: the calibrated value, its confidence code
+# (see CONFIDENCE_ORDER) and its source id (see SOURCE_NAMES)
+CALIBRATED_DTYPE = np.dtype([
+    ("value", np.float64),
+    ("confidence", np.int8),
+    ("source", np.uint8),
+])
+
+
+def _calibrated_array(values: np.ndarray, confidence, source: str) -> np.ndarray:
+    """Pack values, confidence code(s) and a source into a CALIBRATED_DTYPE array."""
+    out = np.empty(values.shape, dtype=CALIBRATED_DTYPE)
+    out["value"] = values
+    out["confidence"] = confidence
+    out["source"] = SOURCE_CODES[source]
+    return out
+
+
+def _as_measurements(values, label: str) -> np.ndarray:
+    """Measurements as a float64 array; NaN and infinities are rejected."""
+    values = np.asarray(values, dtype=np.float64)
+    bad = ~np.isfinite(values)
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"{label} must be finite, got {values.flat[i]} at index {i}")
+    return values
+
+
+def _check_unit_interval(values: np.ndarray, label: str) -> None:
+    """Raise ValueError naming the first element outside [0, 1]."""
+    bad = (values < 0) | (values > 1)
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"{label} must be between 0 and 1, got {values.flat[i]} at index {i}")
+
+
+def pci_to_rho_batch(pci) -> np.ndarray:
+    """
+    Vectorized pci_to_rho().
+
+    Args:
+        pci: Array of PCI values (0-1)
+
+    Returns:
+        CALIBRATED_DTYPE array with the shape of pci
+    """
+    pci = _as_measurements(pci, "PCI")
+    _check_unit_interval(pci, "PCI")
+    return _calibrated_array(pci, CONFIDENCE_CODES[Confidence.HIGH], "PCI direct mapping")
+
+
+def pci_range_to_rho_batch(pci_min, pci_max) -> np.ndarray:
+    """
+    Vectorized pci_range_to_rho().
+
+    Args:
+        pci_min: Array of PCI range lower bounds
+        pci_max: Array of PCI range upper bounds
+
+    Returns:
+        CALIBRATED_DTYPE array of clamped midpoints
+    """
+    pci_min = _as_measurements(pci_min, "PCI range minimum")
+    pci_max = _as_measurements(pci_max, "PCI range maximum")
+    midpoint = np.clip((pci_min + pci_max) / 2, 0.0, 1.0)
+    return _calibrated_array(midpoint, CONFIDENCE_CODES[Confidence.HIGH], "PCI range midpoint")
+
+
+def lzc_to_H_batch(lzc_normalized) -> np.ndarray:
+    """
+    Vectorized lzc_to_H().
+
+    Args:
+        lzc_normalized: Array of normalized Lempel-Ziv complexity values (0-1)
+
+    Returns:
+        CALIBRATED_DTYPE array with the shape of lzc_normalized
+    """
+    lzc = _as_measurements(lzc_normalized, "Normalized LZc")
+    _check_unit_interval(lzc, "Normalized LZc")
+    return _calibrated_array(lzc, CONFIDENCE_CODES[Confidence.HIGH], "LZc normalized")
+
+
+def lzc_percent_change_to_H_batch(percent_change, baseline: float = LZC_BASELINE) -> np.ndarray:
+    """
+    Vectorized lzc_percent_change_to_H().
+
+    Args:
+        percent_change: Array of percent changes from baseline
+        baseline: Baseline H value (default 0.50)
+
+    Returns:
+        CALIBRATED_DTYPE array; confidence is HIGH within ±30%, else MODERATE
+    """
+    percent_change = _as_measurements(percent_change, "LZc percent change")
+    h_value = np.clip(baseline * (1 + percent_change / 100), 0.0, 1.0)
+    confidence = np.where(
+        np.abs(percent_change) <= 30,
+        CONFIDENCE_CODES[Confidence.HIGH],
+        CONFIDENCE_CODES[Confidence.MODERATE]
+    )
+    return _calibrated_array(h_value, confidence, "LZc percent change")
+
+
+def temporal_window_to_tau_batch(window_ms) -> np.ndarray:
+    """
+    Vectorized temporal_window_to_tau().
+
+    Args:
+        window_ms: Array of temporal integration windows in milliseconds
+
+    Returns:
+        CALIBRATED_DTYPE array; confidence falls with distance from baseline
+    """
+    window_ms = _as_measurements(window_ms, "Temporal window")
+    tau_value = np.clip(window_ms / TAU_BASELINE_MS, 0.0, 1.0)
+    confidence = np.select(
+        [(window_ms >= 2000) & (window_ms <= 4000), (window_ms >= 1000) & (window_ms <= 6000)],
+        [CONFIDENCE_CODES[Confidence.HIGH], CONFIDENCE_CODES[Confidence.MODERATE]],
+        default=CONFIDENCE_CODES[Confidence.LOW]
+    )
+    return _calibrated_array(tau_value, confidence, "Temporal window normalization")
+
+
+def connectivity_reduction_to_phi_batch(percent_reduction, baseline: float = PHI_BASELINE) -> np.ndarray:
+    """
+    Vectorized connectivity_reduction_to_phi().
+
+    Args:
+        percent_reduction: Array of percent reductions from baseline (0-100)
+        baseline: Framework baseline for waking
+
+    Returns:
+        CALIBRATED_DTYPE array with the shape of percent_reduction
+    """
+    percent_reduction = _as_measurements(percent_reduction, "Connectivity reduction")
+    phi_value = np.clip(baseline * (1 - percent_reduction / 100), 0.0, 1.0)
+    return _calibrated_array(phi_value, CONFIDENCE_CODES[Confidence.MODERATE], "Connectivity reduction")
+
+
+def mse_to_kappa_batch(mse_slope) -> np.ndarray:
+    """
+    Vectorized mse_to_kappa().
+
+    Args:
+        mse_slope: Array of MSE slopes
+
+    Returns:
+        CALIBRATED_DTYPE array with the shape of mse_slope
+    """
+    mse_slope = _as_measurements(mse_slope, "MSE slope")
+    fraction = (mse_slope - MSE_SLOPE_WHITE) / (MSE_SLOPE_PINK - MSE_SLOPE_WHITE)
+    kappa_value = np.clip(KAPPA_WHITE + fraction * (KAPPA_PINK - KAPPA_WHITE), 0.0, 1.0)
+    return _calibrated_array(kappa_value, CONFIDENCE_CODES[Confidence.MODERATE], "MSE slope")
+
+
+# Measurement columns per invariant, highest priority first, and the
+# default used when a row has none of them (matches create_grounded_state)
+MEASUREMENT_COLUMNS = {
+    "phi": ((("connectivity_reduction",), connectivity_reduction_to_phi_batch), 0.80),
+    "tau": ((("window_ms",), temporal_window_to_tau_batch), 0.50),
+    "rho": ((("pci",), pci_to_rho_batch), (("pci_min", "pci_max"), pci_range_to_rho_batch), 0.50),
+    "H": ((("lzc",), lzc_to_H_batch), (("lzc_change",), lzc_percent_change_to_H_batch), 0.50),
+    "kappa": ((("mse_slope",), mse_to_kappa_batch), 0.50),
+}
+
+
+def calibrate_measurements(table) -> Dict[str, np.ndarray]:
+    """
+    Map a table of measurements to calibrated invariants in one pass.
+
+    Each invariant is taken, per row, from the first of its measurement
+    columns that is present and not NaN:
+        φ ← connectivity_reduction
+        τ ← window_ms
+        ρ ← pci, then (pci_min, pci_max)
+        H ← lzc, then lzc_change
+        κ ← mse_slope
+    then from a manual override column named after the invariant ('phi',
+    'tau', 'rho', 'H', 'kappa'; LOW confidence), and otherwise from the
+    THEORETICAL default used by create_grounded_state().
+
+    Args:
+        table: Mapping of column name to 1-D array, or a structured array
+
+    Returns:
+        Dict of invariant name to (N,) CALIBRATED_DTYPE array
+
+    Raises:
+        ValueError on unknown columns, mismatched lengths or invalid values
+    """
+    if isinstance(table, np.ndarray) and table.dtype.names:
+        table = {name: table[name] for name in table.dtype.names}
+    columns = {name: np.asarray(col, dtype=np.float64) for name, col in table.items()}
+
+    known = {c for spec in MEASUREMENT_COLUMNS.values() for rule in spec[:-1] for c in rule[0]}
+    known.update(MEASUREMENT_COLUMNS)
+    unknown = set(columns) - known
+    if unknown:
+        raise ValueError(f"Unknown measurement columns: {sorted(unknown)}. Valid: {sorted(known)}")
+    lengths = {col.shape for col in columns.values()}
+    if len(lengths) > 1 or any(len(shape) != 1 for shape in lengths):
+        raise ValueError(f"Measurement columns must be 1-D with equal lengths, got {sorted(lengths)}")
+    n = lengths.pop()[0] if lengths else 0
+
+    result = {}
+    for invariant, spec in MEASUREMENT_COLUMNS.items():
+        *rules, default = spec
+        out = _calibrated_array(
+            np.full(n, default), CONFIDENCE_CODES[Confidence.THEORETICAL], "no data"
+        )
+        missing = np.ones(n, dtype=bool)
+        for names, mapper in rules:
+            if not all(name in columns for name in names):
+                continue
+            have = missing.copy()
+            for name in names:
+                have &= ~np.isnan(columns[name])
+            if have.any():
+                out[have] = mapper(*(columns[name][have] for name in names))
+                missing &= ~have
+        if invariant in columns:
+            have = missing & ~np.isnan(columns[invariant])
+            out[have] = _calibrated_array(
+                columns[invariant][have], CONFIDENCE_CODES[Confidence.LOW], "manual override"
+            )
+        result[invariant] = out
+    return result
+
+
 # =============================================================================
 # Composite Functions
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class GroundedState:
     """A consciousness state with empirically grounded variable values."""
     name: str
@@ -384,6 +699,16 @@ class GroundedState:
         entropy_gate = (1 - math.sqrt(h)) + (h * kappa)
         return structure * entropy_gate
 
+    def derivations(self) -> Dict[str, str]:
+        """Mapping function that produced each invariant (see recalibration.py)."""
+        return {
+            "phi": self.phi.derivation,
+            "tau": self.tau.derivation,
+            "rho": self.rho.derivation,
+            "H": self.H.derivation,
+            "kappa": self.kappa.derivation
+        }
+
     def overall_confidence(self) -> Confidence:
         """Return lowest confidence among all variables."""
         confidences = [
@@ -393,9 +718,7 @@ class GroundedState:
             self.H.confidence,
             self.kappa.confidence
         ]
-        order = [Confidence.THEORETICAL, Confidence.LOW,
-                 Confidence.MODERATE, Confidence.HIGH]
-        return min(confidences, key=lambda c: order.index(c))
+        return min(confidences, key=CONFIDENCE_CODES.__getitem__)
 
     def to_dict(self) -> dict:
         return {
@@ -452,41 +775,51 @@ def create_grounded_state(
         else:
             rho = pci_to_rho(pci)
     elif rho_override is not None:
-        rho = CalibratedValue(rho_override, Confidence.LOW, "manual override")
+        rho = CalibratedValue(rho_override, Confidence.LOW, "manual override",
+                              derivation="create_grounded_state")
     else:
-        rho = CalibratedValue(0.50, Confidence.THEORETICAL, "no data")
+        rho = CalibratedValue(0.50, Confidence.THEORETICAL, "no data",
+                              derivation="create_grounded_state")
 
     # H from LZc
     if lzc_change is not None:
         H = lzc_percent_change_to_H(lzc_change)
     elif H_override is not None:
-        H = CalibratedValue(H_override, Confidence.LOW, "manual override")
+        H = CalibratedValue(H_override, Confidence.LOW, "manual override",
+                            derivation="create_grounded_state")
     else:
-        H = CalibratedValue(0.50, Confidence.THEORETICAL, "no data")
+        H = CalibratedValue(0.50, Confidence.THEORETICAL, "no data",
+                            derivation="create_grounded_state")
 
     # τ from temporal description
     if temporal_desc is not None:
         tau = subjective_time_to_tau(temporal_desc)
     elif tau_override is not None:
-        tau = CalibratedValue(tau_override, Confidence.LOW, "manual override")
+        tau = CalibratedValue(tau_override, Confidence.LOW, "manual override",
+                              derivation="create_grounded_state")
     else:
-        tau = CalibratedValue(0.50, Confidence.THEORETICAL, "no data")
+        tau = CalibratedValue(0.50, Confidence.THEORETICAL, "no data",
+                              derivation="create_grounded_state")
 
     # φ from connectivity
     if connectivity_reduction is not None:
         phi = connectivity_reduction_to_phi(connectivity_reduction)
     elif phi_override is not None:
-        phi = CalibratedValue(phi_override, Confidence.LOW, "manual override")
+        phi = CalibratedValue(phi_override, Confidence.LOW, "manual override",
+                              derivation="create_grounded_state")
     else:
-        phi = CalibratedValue(0.80, Confidence.THEORETICAL, "no data")
+        phi = CalibratedValue(0.80, Confidence.THEORETICAL, "no data",
+                              derivation="create_grounded_state")
 
     # κ from coherence description
     if coherence_desc is not None:
         kappa = coherence_descriptive_to_kappa(coherence_desc)
     elif kappa_override is not None:
-        kappa = CalibratedValue(kappa_override, Confidence.LOW, "manual override")
+        kappa = CalibratedValue(kappa_override, Confidence.LOW, "manual override",
+                                derivation="create_grounded_state")
     else:
-        kappa = CalibratedValue(0.50, Confidence.THEORETICAL, "no data")
+        kappa = CalibratedValue(0.50, Confidence.THEORETICAL, "no data",
+                                derivation="create_grounded_state")
 
     return GroundedState(
         name=name,
@@ -505,7 +838,12 @@ def create_grounded_state(
 # =============================================================================
 
 def get_calibrated_states() -> dict:
-    """Return dictionary of pre-calibrated consciousness states."""
+    """
+    Return dictionary of pre-calibrated consciousness states.
+
+    Rebuilds every state on each call. Use get_calibration_registry() for
+    cached, read-only access.
+    """
 
     states = {}
 
@@ -736,13 +1074,220 @@ def get_calibrated_states() -> dict:
     return states
 
 
+# =============================================================================
+# Calibration Registry (Cached)
+# =============================================================================
+
+@dataclass(frozen=True)
+class CalibrationRegistry:
+    """
+    Frozen, process-wide view of the pre-calibrated states.
+
+    Built once by get_calibration_registry() and shared by every caller.
+    The columnar arrays are always present; the full GroundedState objects
+    (sources, notes, citations) are materialized on first access to
+    `states` when the registry was loaded from a snapshot.
+
+    Attributes:
+        names: State keys in table order
+        labels: Display names (GroundedState.name) in table order
+        index: State key to row number
+        values: (N, 5) read-only array with columns [φ, τ, ρ, H, κ]
+        density: (N,) read-only array of v9.2 densities
+        confidence: (N,) read-only int8 array of overall confidence codes
+                    (see CONFIDENCE_ORDER)
+        empirical_range: (N, 5, 2) read-only array of [lo, hi] per invariant,
+                         NaN where no empirical range is recorded
+        value_confidence: (N, 5) read-only int8 array of per-invariant
+                          confidence codes
+        source: 'python' or 'snapshot'
+    """
+    names: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    index: Mapping[str, int]
+    values: np.ndarray
+    density: np.ndarray
+    confidence: np.ndarray
+    empirical_range: np.ndarray
+    value_confidence: np.ndarray
+    source: str = "python"
+    _states: Optional[Mapping[str, GroundedState]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    @property
+    def states(self) -> Mapping[str, GroundedState]:
+        """Read-only mapping of state key to GroundedState."""
+        if self._states is None:
+            # Lazily materialized cache; the registry stays logically immutable
+            object.__setattr__(self, "_states", MappingProxyType(get_calibrated_states()))
+        return self._states
+
+    def get(self, name: str) -> GroundedState:
+        """
+        Look up a state by key.
+
+        Raises:
+            ValueError if the state is not found
+        """
+        return self.states[self.names[self.row(name)]]
+
+    def row(self, name: str) -> int:
+        """
+        Row number of a state in the columnar arrays.
+
+        Raises:
+            ValueError if the state is not found
+        """
+        if name not in self.index:
+            raise ValueError(f"State '{name}' not found. Available: {list(self.names)}")
+        return self.index[name]
+
+    def confidence_of(self, name: str) -> Confidence:
+        """Overall confidence of a state, read from the columnar view."""
+        return CONFIDENCE_ORDER[self.confidence[self.row(name)]]
+
+    @property
+    def phi(self) -> np.ndarray:
+        return self.values[:, 0]
+
+    @property
+    def tau(self) -> np.ndarray:
+        return self.values[:, 1]
+
+    @property
+    def rho(self) -> np.ndarray:
+        return self.values[:, 2]
+
+    @property
+    def H(self) -> np.ndarray:
+        return self.values[:, 3]
+
+    @property
+    def kappa(self) -> np.ndarray:
+        return self.values[:, 4]
+
+
+def _value_range(cv: CalibratedValue) -> Tuple[float, float]:
+    """Empirical [lo, hi] of a calibrated value, or NaNs when absent."""
+    if cv.empirical_range is None:
+        return (math.nan, math.nan)
+    lo, hi = cv.empirical_range
+    return (float(lo), float(hi))
+
+
+def build_calibration_registry(states: Optional[Dict[str, GroundedState]] = None) -> CalibrationRegistry:
+    """
+    Build a CalibrationRegistry from a dict of grounded states.
+
+    Args:
+        states: Grounded states keyed by name (default: get_calibrated_states())
+
+    Returns:
+        A new, uncached CalibrationRegistry
+    """
+    if states is None:
+        states = get_calibrated_states()
+
+    names = tuple(states.keys())
+    n = len(names)
+    values = np.array(
+        [[s.phi.value, s.tau.value, s.rho.value, s.H.value, s.kappa.value]
+         for s in states.values()],
+        dtype=np.float64
+    ).reshape(n, 5)
+    density = np.array([s.density() for s in states.values()], dtype=np.float64)
+    confidence = np.array(
+        [CONFIDENCE_CODES[s.overall_confidence()] for s in states.values()],
+        dtype=np.int8
+    )
+    empirical_range = np.array(
+        [[_value_range(cv) for cv in (s.phi, s.tau, s.rho, s.H, s.kappa)]
+         for s in states.values()],
+        dtype=np.float64
+    ).reshape(n, 5, 2)
+    value_confidence = np.array(
+        [[CONFIDENCE_CODES[cv.confidence] for cv in (s.phi, s.tau, s.rho, s.H, s.kappa)]
+         for s in states.values()],
+        dtype=np.int8
+    ).reshape(n, 5)
+    for arr in (values, density, confidence, empirical_range, value_confidence):
+        arr.setflags(write=False)
+
+    return CalibrationRegistry(
+        names=names,
+        labels=tuple(s.name for s in states.values()),
+        index=MappingProxyType({name: i for i, name in enumerate(names)}),
+        values=values,
+        density=density,
+        confidence=confidence,
+        empirical_range=empirical_range,
+        value_confidence=value_confidence,
+        source="python",
+        _states=MappingProxyType(dict(states))
+    )
+
+
+_REGISTRY: Optional[CalibrationRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _load_registry() -> CalibrationRegistry:
+    """Load the compiled snapshot when it is fresh, else build from Python."""
+    try:
+        from calibration_snapshot import load_snapshot_registry
+    except ImportError:
+        return build_calibration_registry()
+    registry = load_snapshot_registry()
+    return registry if registry is not None else build_calibration_registry()
+
+
+def get_calibration_registry() -> CalibrationRegistry:
+    """
+    Return the process-wide calibration registry, building it on first use.
+
+    Uses the compiled calibration snapshot (see calibration_snapshot.py)
+    when it is up to date with its sources, and the Python definitions
+    otherwise.
+    Lookups against the returned registry are O(1). Call
+    invalidate_calibration_registry() after changing mapping constants or
+    state definitions to force a rebuild.
+    """
+    global _REGISTRY
+    registry = _REGISTRY
+    if registry is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = _load_registry()
+            registry = _REGISTRY
+    return registry
+
+
+def invalidate_calibration_registry() -> None:
+    """Drop the cached registry; the next access rebuilds it."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        _REGISTRY = None
+
+
+def get_calibrated_state(name: str) -> GroundedState:
+    """Return one pre-calibrated state from the cached registry."""
+    return get_calibration_registry().get(name)
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
 def export_grounded_states_json(output_path: str = None) -> str:
     """Export all grounded states to JSON."""
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     output = {
         "metadata": {
@@ -775,7 +1320,7 @@ def compare_grounded_vs_estimated(name: str, estimated_values: dict) -> dict:
     Returns:
         Comparison dict with deltas and density difference
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     if name not in states:
         raise ValueError(f"State '{name}' not found in calibrated states")
@@ -824,7 +1369,7 @@ if __name__ == "__main__":
     print("CONDUIT MONISM: Empirically Grounded States")
     print("=" * 60)
 
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     for name, state in states.items():
         print(f"\n{state.name}")
@@ -0,0 +1,379 @@
+"""
+Incremental Recalibration for Conduit Monism
+
+Tracks which mapping functions and constants in mapping_functions.py
+produced each calibrated invariant, so that editing one constant (e.g.
+LZC_BASELINE or a τ lookup) identifies exactly the states that need new
+densities, verdicts and stored metadata.
+
+Dependency graph:
+    Nodes are the module-level constants (UPPER_CASE names) and functions
+    of mapping_functions.py. A node's digest hashes its own definition (the
+    function source, or the constant value); its closure hash also covers
+    every node it references, recursively. References to other producing
+    functions (those that return CalibratedValues) are not followed: a value
+    depends on the producer that made it, not on the producers it could have
+    called instead.
+
+Manifest (calibration_manifest.json, written next to this module):
+    The dependency graph plus, per state and invariant, the producing
+    function (CalibratedValue.derivation), its dependency hash, an inputs
+    hash (source, empirical measure, range, notes) and the value. The
+    recalibration command (scripts/recalibrate.py) adds densities and
+    validation verdicts. Comparing the stored manifest with a fresh one
+    gives the changed nodes and the affected states.
+
+Version: 1.0
+Date: 2026-02-05
+Framework: Conduit Monism v9.2
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import re
+import textwrap
+import types
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import mapping_functions
+from mapping_functions import CONFIDENCE_CODES, GroundedState
+
+
+MANIFEST_FORMAT_VERSION = 1
+
+CALIBRATION_DIR = Path(__file__).parent
+MANIFEST_PATH = CALIBRATION_DIR / "calibration_manifest.json"
+
+INVARIANT_FIELDS = ("phi", "tau", "rho", "H", "kappa")
+
+_CONSTANT_NAME = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+
+def _digest(text: str) -> str:
+    """Short content hash used throughout the manifest."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+# =============================================================================
+# Dependency Graph
+# =============================================================================
+
+@dataclass(frozen=True)
+class DependencyNode:
+    """A constant or function of the mapping module."""
+    name: str
+    kind: str                 # 'constant' or 'function'
+    digest: str               # Hash of this definition alone
+    deps: Tuple[str, ...]     # Referenced nodes
+    closure: str              # Hash over this node and its followed deps
+    value: Optional[str] = None  # Stable repr, for constants
+
+
+def _stable_repr(value) -> str:
+    """repr() that does not leak memory addresses (functions, dtypes, enums)."""
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType)):
+        return f"<function {value.__name__}>"
+    if isinstance(value, Enum):
+        return str(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (tuple, list)):
+        inner = ", ".join(_stable_repr(v) for v in value)
+        return f"({inner})" if isinstance(value, tuple) else f"[{inner}]"
+    if isinstance(value, np.dtype):
+        return str(value.descr)
+    return repr(value)
+
+
+def _referenced_names(func) -> set:
+    """Global names referenced anywhere in a function's source (defaults included)."""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+
+def _is_producer(func) -> bool:
+    """Whether a function returns CalibratedValues (records a derivation)."""
+    return func.__name__ == "create_grounded_state" or hasattr(func, "__wrapped__")
+
+
+def build_dependency_graph(module=mapping_functions) -> Dict[str, DependencyNode]:
+    """
+    Build the dependency graph of a mapping module.
+
+    Args:
+        module: Module to inspect (default: mapping_functions)
+
+    Returns:
+        Dict of node name to DependencyNode
+    """
+    functions, constants = {}, {}
+    for name, value in vars(module).items():
+        if isinstance(value, types.FunctionType) and inspect.unwrap(value).__module__ == module.__name__:
+            functions[name] = value
+        elif _CONSTANT_NAME.match(name) and not isinstance(value, (type, types.ModuleType)):
+            constants[name] = value
+
+    digests, deps, values = {}, {}, {}
+    for name, value in constants.items():
+        values[name] = _stable_repr(value)
+        digests[name] = _digest(values[name])
+        deps[name] = ()
+    for name, func in functions.items():
+        source = inspect.getsource(inspect.unwrap(func))
+        digests[name] = _digest(source)
+        deps[name] = tuple(sorted(
+            n for n in _referenced_names(inspect.unwrap(func))
+            if n != name and (n in constants or n in functions)
+        ))
+
+    closures: Dict[str, str] = {}
+
+    def closure(name: str, visiting: frozenset) -> str:
+        if name in closures:
+            return closures[name]
+        followed = [
+            d for d in deps[name]
+            if d not in visiting and not (d in functions and _is_producer(functions[d]))
+        ]
+        parts = [digests[name]] + [f"{d}={closure(d, visiting | {name})}" for d in followed]
+        closures[name] = _digest("|".join(parts))
+        return closures[name]
+
+    return {
+        name: DependencyNode(
+            name=name,
+            kind="function" if name in functions else "constant",
+            digest=digests[name],
+            deps=deps[name],
+            closure=closure(name, frozenset()),
+            value=values.get(name),
+        )
+        for name in digests
+    }
+
+
+def dependency_set(graph: Dict[str, DependencyNode], name: str) -> List[str]:
+    """Every node a producer's output depends on, the producer included."""
+    seen, stack = set(), [name]
+    while stack:
+        current = stack.pop()
+        if current in seen or current not in graph:
+            continue
+        seen.add(current)
+        for dep in graph[current].deps:
+            node = graph.get(dep)
+            if node is None:
+                continue
+            func = getattr(mapping_functions, dep, None)
+            if node.kind == "function" and func is not None and _is_producer(func):
+                continue
+            stack.append(dep)
+    return sorted(seen)
+
+
+# =============================================================================
+# Manifest
+# =============================================================================
+
+def _inputs_digest(cv) -> str:
+    """Hash of what a state definition feeds into its producer (notes are derived output)."""
+    return _digest(_stable_repr((cv.source, cv.empirical_measure, cv.empirical_range)))
+
+
+def build_manifest(
+    states: Dict[str, GroundedState],
+    graph: Optional[Dict[str, DependencyNode]] = None
+) -> Dict:
+    """
+    Manifest of the current calibration (without densities or verdicts).
+
+    Args:
+        states: Grounded states keyed by name
+        graph: Dependency graph (default: build_dependency_graph())
+
+    Returns:
+        JSON-serializable manifest dict
+    """
+    if graph is None:
+        graph = build_dependency_graph()
+
+    manifest_states = {}
+    for key, state in states.items():
+        invariants = {}
+        for field_name in INVARIANT_FIELDS:
+            cv = getattr(state, field_name)
+            producer = graph.get(cv.derivation)
+            invariants[field_name] = {
+                "value": cv.value,
+                "confidence": CONFIDENCE_CODES[cv.confidence],
+                "derivation": cv.derivation,
+                "dependency": producer.closure if producer is not None else None,
+                "depends_on": dependency_set(graph, cv.derivation) if producer is not None else [],
+                "inputs": _inputs_digest(cv),
+            }
+        manifest_states[key] = {"label": state.name, "invariants": invariants, "densities": {}}
+
+    return {
+        "format_version": MANIFEST_FORMAT_VERSION,
+        "built_at": datetime.now().isoformat(),
+        "nodes": {
+            name: {"kind": node.kind, "digest": node.digest, "closure": node.closure,
+                   "deps": list(node.deps), "value": node.value}
+            for name, node in graph.items()
+        },
+        "states": manifest_states,
+        "verdicts": {},
+    }
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Optional[Dict]:
+    """The stored manifest, or None when missing, unreadable or outdated."""
+    try:
+        manifest = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format_version") != MANIFEST_FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(manifest: Dict, path: Path = MANIFEST_PATH) -> None:
+    """Write a manifest atomically."""
+    path = Path(path)
+    tmp = path.with_suffix(".tmp.json")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, path)
+
+
+# =============================================================================
+# Diff
+# =============================================================================
+
+def diff_manifests(old: Optional[Dict], new: Dict) -> Dict:
+    """
+    Compare two manifests.
+
+    Args:
+        old: Stored manifest (None: everything counts as added)
+        new: Freshly built manifest
+
+    Returns:
+        Dict containing:
+        - 'changed_nodes': [{name, kind, change, old, new}] for added,
+          removed or modified constants and functions
+        - 'affected': {state: {invariant: {old, new, reasons}}}
+        - 'added_states', 'removed_states': state keys
+    """
+    old_nodes = (old or {}).get("nodes", {})
+    new_nodes = new["nodes"]
+    changed_nodes = []
+    for name in sorted(set(old_nodes) | set(new_nodes)):
+        before, after = old_nodes.get(name), new_nodes.get(name)
+        if before is not None and after is not None and before["digest"] == after["digest"]:
+            continue
+        change = "added" if before is None else "removed" if after is None else "modified"
+        entry = after or before
+        changed_nodes.append({
+            "name": name,
+            "kind": entry["kind"],
+            "change": change,
+            "old": before.get("value") if before else None,
+            "new": after.get("value") if after else None,
+        })
+    changed_names = {entry["name"] for entry in changed_nodes}
+
+    old_states = (old or {}).get("states", {})
+    affected = {}
+    for key, state in new["states"].items():
+        previous = old_states.get(key)
+        if previous is None:
+            continue
+        changes = {}
+        for field_name, now in state["invariants"].items():
+            before = previous["invariants"].get(field_name, {})
+            reasons = []
+            if before.get("derivation") != now["derivation"]:
+                reasons.append(f"derivation {before.get('derivation')} -> {now['derivation']}")
+            elif before.get("dependency") != now["dependency"]:
+                reasons.extend(sorted(changed_names & set(now["depends_on"])) or ["dependency"])
+            if before.get("inputs") != now["inputs"]:
+                reasons.append("state definition")
+            if (before.get("value") != now["value"] or before.get("confidence") != now["confidence"]) and not reasons:
+                reasons.append("value")
+            if reasons:
+                changes[field_name] = {"old": before.get("value"), "new": now["value"], "reasons": reasons}
+        if changes:
+            affected[key] = changes
+
+    return {
+        "changed_nodes": changed_nodes,
+        "affected": affected,
+        "added_states": sorted(set(new["states"]) - set(old_states)),
+        "removed_states": sorted(set(old_states) - set(new["states"])),
+    }
+
+
+def format_report(diff: Dict, densities: Optional[Dict] = None, verdicts: Optional[Dict] = None) -> str:
+    """
+    Human-readable diff report.
+
+    Args:
+        diff: diff_manifests() result
+        densities: {state: {version: (old, new)}} for recomputed states
+        verdicts: {criterion: (old, new)} for re-evaluated criteria
+    """
+    lines = []
+    if not diff["changed_nodes"] and not diff["affected"] and not diff["added_states"] \
+            and not diff["removed_states"]:
+        return "No calibration changes."
+
+    if diff["changed_nodes"]:
+        lines.append("Changed definitions:")
+        for entry in diff["changed_nodes"]:
+            if entry["kind"] == "constant" and entry["change"] == "modified":
+                lines.append(f"  {entry['name']}: {entry['old']} -> {entry['new']}")
+            else:
+                lines.append(f"  {entry['name']} ({entry['kind']}, {entry['change']})")
+    for label, keys in (("Added states", diff["added_states"]), ("Removed states", diff["removed_states"])):
+        if keys:
+            lines.append(f"{label}: {', '.join(keys)}")
+
+    if diff["affected"]:
+        lines.append(f"Affected states ({len(diff['affected'])}):")
+        for key, changes in diff["affected"].items():
+            lines.append(f"  {key}")
+            for field_name, change in changes.items():
+                old, new = change["old"], change["new"]
+                old_text = "—" if old is None else f"{old:.4f}"
+                lines.append(f"    {field_name:<6} {old_text} -> {new:.4f}   ({', '.join(change['reasons'])})")
+            for version, (old, new) in (densities or {}).get(key, {}).items():
+                old_text = "—" if old is None else f"{old:.4f}"
+                lines.append(f"    D[{version}] {old_text} -> {new:.4f}")
+
+    if verdicts:
+        lines.append("Validation verdicts:")
+        for name, (old, new) in verdicts.items():
+            flag = "   CHANGED" if old is not None and old != new else ""
+            lines.append(f"  {name}: {_verdict_text(old)} -> {_verdict_text(new)}{flag}")
+    return "\n".join(lines)
+
+
+def _verdict_text(verdict: Optional[bool]) -> str:
+    return "—" if verdict is None else ("PASS" if verdict else "FAIL")
+
+
+def affected_states(diff: Dict, new: Dict, full: bool = False) -> List[str]:
+    """State keys needing recomputation: affected, added, or all when full."""
+    if full:
+        return list(new["states"])
+    keys = set(diff["affected"]) | set(diff["added_states"])
+    return [key for key in new["states"] if key in keys]
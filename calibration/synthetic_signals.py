@@ -0,0 +1,446 @@
+"""
+Synthetic Signals for Conduit Monism κ/H Calibration
+
+Batch generators for signals with known structure, used to check and
+calibrate the signal-based mappings (complexity.signal_to_H,
+multiscale_entropy.signal_to_kappa):
+
+    colored_noise               1/f^β noise for any β (0 white, 1 pink, 2 brown)
+    fractional_gaussian_noise   fGn with Hurst exponent h (exact, Davies-Harte)
+    fractional_brownian_motion  fBm, the cumulative sum of fGn
+    logistic_map                x ← r·x·(1 - x), chaotic for r near 4
+    periodic                    Sinusoids with octave harmonics (reference)
+
+Every generator fills a (n_signals, n_samples) float64 array (optionally
+preallocated) and is vectorized across signals: spectra are shaped with one
+batched FFT, the logistic map iterates all signals at once. Signal i draws
+from its own stream, SeedSequence(seed, spawn_key=(i,)), so a signal does
+not depend on the batch or chunk it was generated in; `start` gives the
+index of the first row.
+
+calibration_curve() sweeps one generator parameter (e.g. β) over thousands
+of signals and measures LZc → H and MSE slope → κ for each, spread over
+worker processes in chunks.
+
+Version: 1.0
+Date: 2026-02-05
+Framework: Conduit Monism v9.2
+"""
+
+import os
+from multiprocessing import get_context
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from complexity import signal_lzc
+from mapping_functions import lzc_to_H_batch, mse_to_kappa_batch
+from multiscale_entropy import DEFAULT_M, DEFAULT_R, multiscale_entropy
+
+
+# Rows per FFT call; bounds the complex spectrum workspace
+GENERATION_CHUNK = 256
+
+# Signals per calibration_curve() task
+CURVE_CHUNK = 128
+
+
+# =============================================================================
+# Seeded Streams
+# =============================================================================
+
+def signal_stream(seed: Optional[int], index: int) -> np.random.Generator:
+    """Random stream of signal `index` of a batch generated with `seed`."""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+
+
+def _output(out: Optional[np.ndarray], n_signals: int, n_samples: int) -> np.ndarray:
+    """Validate or allocate the (n_signals, n_samples) output array."""
+    if n_signals < 1 or n_samples < 2:
+        raise ValueError("n_signals must be >= 1 and n_samples >= 2")
+    if out is None:
+        return np.empty((n_signals, n_samples), dtype=np.float64)
+    if out.shape != (n_signals, n_samples) or out.dtype != np.float64:
+        raise ValueError(
+            f"out must be a float64 array of shape {(n_signals, n_samples)}, "
+            f"got {out.dtype} {out.shape}"
+        )
+    return out
+
+
+def _per_signal(value, n_signals: int, label: str) -> np.ndarray:
+    """Broadcast a scalar or per-signal parameter to shape (n_signals,)."""
+    value = np.asarray(value, dtype=np.float64)
+    if value.ndim > 1 or (value.ndim == 1 and value.size != n_signals):
+        raise ValueError(f"{label} must be a scalar or have {n_signals} values, got shape {value.shape}")
+    if not np.all(np.isfinite(value)):
+        raise ValueError(f"{label} must be finite")
+    return np.broadcast_to(value, (n_signals,))
+
+
+def _fill_normal(out: np.ndarray, seed: Optional[int], start: int) -> np.ndarray:
+    """Fill each row of `out` with standard normals from its signal stream."""
+    for i, row in enumerate(out):
+        signal_stream(seed, start + i).standard_normal(out=row)
+    return out
+
+
+def _standardize(out: np.ndarray) -> np.ndarray:
+    """Zero mean, unit variance per row, in place."""
+    out -= out.mean(axis=1, keepdims=True)
+    std = out.std(axis=1, keepdims=True)
+    np.divide(out, std, out=out, where=std > 0)
+    return out
+
+
+# =============================================================================
+# Generators
+# =============================================================================
+
+def colored_noise(
+    n_signals: int,
+    n_samples: int,
+    beta=1.0,
+    seed: Optional[int] = 0,
+    start: int = 0,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    1/f^β noise: white noise with its spectrum scaled by f^(-β/2).
+
+    Args:
+        n_signals: Number of signals
+        n_samples: Samples per signal
+        beta: Spectral exponent, scalar or one per signal
+        seed: Batch seed
+        start: Index of the first signal (selects its stream)
+        out: Optional preallocated (n_signals, n_samples) float64 array
+
+    Returns:
+        (n_signals, n_samples) array, zero mean and unit variance per signal
+    """
+    out = _output(out, n_signals, n_samples)
+    beta = _per_signal(beta, n_signals, "beta")
+    log_f = np.log(np.fft.rfftfreq(n_samples)[1:])
+
+    for lo in range(0, n_signals, GENERATION_CHUNK):
+        hi = min(lo + GENERATION_CHUNK, n_signals)
+        block = _fill_normal(out[lo:hi], seed, start + lo)
+        spectrum = np.fft.rfft(block, axis=1)
+        spectrum[:, 0] = 0.0
+        spectrum[:, 1:] *= np.exp(-0.5 * beta[lo:hi, None] * log_f)
+        block[:] = np.fft.irfft(spectrum, n=n_samples, axis=1)
+    return _standardize(out)
+
+
+def _davies_harte_sqrt_eigenvalues(hurst: float, n_samples: int) -> np.ndarray:
+    """√(λ / M) of the 2N circulant embedding of the fGn autocovariance."""
+    k = np.arange(n_samples + 1, dtype=np.float64)
+    two_h = 2.0 * hurst
+    gamma = 0.5 * (np.abs(k + 1) ** two_h - 2.0 * k ** two_h + np.abs(k - 1) ** two_h)
+    row = np.concatenate([gamma, gamma[-2:0:-1]])
+    eigenvalues = np.fft.fft(row).real
+    # Non-negative in exact arithmetic for 0 < h < 1; clip rounding error
+    return np.sqrt(np.clip(eigenvalues, 0.0, None) / row.size)
+
+
+def fractional_gaussian_noise(
+    n_signals: int,
+    n_samples: int,
+    hurst=0.5,
+    seed: Optional[int] = 0,
+    start: int = 0,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Fractional Gaussian noise by circulant embedding (Davies & Harte 1987).
+
+    Exact in distribution: unit-variance increments with autocovariance
+    γ(k) = ½(|k+1|^2h - 2|k|^2h + |k-1|^2h). h = 0.5 is white noise.
+
+    Args:
+        hurst: Hurst exponent in (0, 1), scalar or one per signal
+        Other args: See colored_noise
+
+    Returns:
+        (n_signals, n_samples) array
+    """
+    out = _output(out, n_signals, n_samples)
+    hurst = _per_signal(hurst, n_signals, "hurst")
+    if np.any((hurst <= 0) | (hurst >= 1)):
+        raise ValueError("hurst must be in (0, 1)")
+
+    size = 2 * n_samples
+    values, inverse = np.unique(hurst, return_inverse=True)
+    scales = np.stack([_davies_harte_sqrt_eigenvalues(h, n_samples) for h in values])
+
+    noise = np.empty((min(GENERATION_CHUNK, n_signals), 2, size), dtype=np.float64)
+    for lo in range(0, n_signals, GENERATION_CHUNK):
+        hi = min(lo + GENERATION_CHUNK, n_signals)
+        block = noise[:hi - lo]
+        for i in range(hi - lo):
+            signal_stream(seed, start + lo + i).standard_normal(out=block[i])
+        weights = (block[:, 0] + 1j * block[:, 1]) * scales[inverse[lo:hi]]
+        out[lo:hi] = np.fft.fft(weights, axis=1).real[:, :n_samples]
+    return out
+
+
+def fractional_brownian_motion(
+    n_signals: int,
+    n_samples: int,
+    hurst=0.5,
+    seed: Optional[int] = 0,
+    start: int = 0,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Fractional Brownian motion: cumulative sums of fractional_gaussian_noise().
+
+    The spectrum falls as 1/f^(2h+1). Arguments are those of
+    fractional_gaussian_noise(); a signal with the same seed and index is
+    the running sum of the corresponding fGn signal.
+    """
+    out = fractional_gaussian_noise(n_signals, n_samples, hurst, seed, start, out)
+    np.cumsum(out, axis=1, out=out)
+    return out
+
+
+def logistic_map(
+    n_signals: int,
+    n_samples: int,
+    r=4.0,
+    seed: Optional[int] = 0,
+    start: int = 0,
+    burn_in: int = 1000,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Logistic-map orbits x ← r·x·(1 - x), all signals iterated together.
+
+    Args:
+        r: Growth rate in [0, 4], scalar or one per signal (chaotic above
+           about 3.57, with periodic windows)
+        burn_in: Iterations discarded before recording
+        Other args: See colored_noise
+
+    Returns:
+        (n_signals, n_samples) array of orbit values in [0, 1]
+    """
+    out = _output(out, n_signals, n_samples)
+    r = _per_signal(r, n_signals, "r")
+    if np.any((r < 0) | (r > 4)):
+        raise ValueError("r must be in [0, 4]")
+
+    x = np.array([signal_stream(seed, start + i).uniform(0.01, 0.99) for i in range(n_signals)])
+    scratch = np.empty_like(x)
+    for t in range(burn_in + n_samples):
+        np.subtract(1.0, x, out=scratch)
+        scratch *= r
+        x *= scratch
+        if t >= burn_in:
+            out[:, t - burn_in] = x
+    return out
+
+
+def periodic(
+    n_signals: int,
+    n_samples: int,
+    frequency=0.01,
+    harmonics: int = 1,
+    noise: float = 0.0,
+    seed: Optional[int] = 0,
+    start: int = 0,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Periodic reference: a sinusoid plus octave harmonics, with random phase.
+
+    Harmonic k (k = 0 .. harmonics - 1) has frequency frequency·2^k and
+    amplitude 1/(k + 1), a truncated self-similar series.
+
+    Args:
+        frequency: Fundamental in cycles per sample, scalar or one per signal
+        harmonics: Number of octave components
+        noise: Standard deviation of added white noise
+        Other args: See colored_noise
+
+    Returns:
+        (n_signals, n_samples) array
+    """
+    out = _output(out, n_signals, n_samples)
+    frequency = _per_signal(frequency, n_signals, "frequency")
+    if harmonics < 1:
+        raise ValueError("harmonics must be >= 1")
+
+    streams = [signal_stream(seed, start + i) for i in range(n_signals)]
+    phases = np.array([s.uniform(0.0, 2 * np.pi) for s in streams])
+    t = np.arange(n_samples, dtype=np.float64)
+    out[:] = 0.0
+    for k in range(harmonics):
+        angle = np.multiply.outer(2 * np.pi * frequency * 2 ** k, t)
+        angle += phases[:, None]
+        out += np.sin(angle) / (k + 1)
+    if noise > 0:
+        for row, stream in zip(out, streams):
+            row += noise * stream.standard_normal(n_samples)
+    return out
+
+
+# Generator and name of its swept parameter, by kind
+SIGNAL_GENERATORS = {
+    "colored": (colored_noise, "beta"),
+    "fgn": (fractional_gaussian_noise, "hurst"),
+    "fbm": (fractional_brownian_motion, "hurst"),
+    "logistic": (logistic_map, "r"),
+    "periodic": (periodic, "frequency"),
+}
+
+
+def generate(kind: str, n_signals: int, n_samples: int, parameter, **kwargs) -> np.ndarray:
+    """Generate a batch with the generator registered under `kind`."""
+    if kind not in SIGNAL_GENERATORS:
+        raise ValueError(f"Unknown signal kind: {kind}. Valid: {list(SIGNAL_GENERATORS)}")
+    generator, name = SIGNAL_GENERATORS[kind]
+    return generator(n_signals, n_samples, **{name: parameter}, **kwargs)
+
+
+# =============================================================================
+# Calibration Curves
+# =============================================================================
+
+def _curve_task(payload):
+    """Generate one chunk of signals and measure LZc and MSE slope (pool worker)."""
+    kind, parameter, n_samples, seed, start, scales, m, r, normalization = payload
+    signals = generate(kind, parameter.size, n_samples, parameter, seed=seed, start=start)
+    lzc = signal_lzc(signals, mode="temporal", normalization=normalization, seed=seed)
+    slope = multiscale_entropy(signals, scales=scales, m=m, r=r, workers=1)["slope"]
+    return lzc, slope
+
+
+def calibration_curve(
+    kind: str,
+    values: Sequence[float],
+    n_per_value: int = 100,
+    n_samples: int = 4096,
+    seed: Optional[int] = 0,
+    scales: Sequence[int] = tuple(range(1, 11)),
+    m: int = DEFAULT_M,
+    r: float = DEFAULT_R,
+    normalization: str = "shuffle",
+    workers: Optional[int] = None,
+    chunk_size: int = CURVE_CHUNK
+) -> Dict[str, np.ndarray]:
+    """
+    Measured H and κ as a function of a generator parameter.
+
+    For each parameter value, n_per_value signals are generated and each
+    one's normalized LZc (→ lzc_to_H) and MSE slope (→ mse_to_kappa) is
+    measured. Signals are numbered across the whole sweep, so results do
+    not depend on workers or chunk_size.
+
+    Args:
+        kind: Generator kind (see SIGNAL_GENERATORS)
+        values: Parameter values to sweep (β, h, r or frequency)
+        n_per_value: Signals per value
+        n_samples: Samples per signal
+        seed: Sweep seed
+        scales, m, r: MSE settings (see multiscale_entropy)
+        normalization: LZc normalization (see lz76_normalized)
+        workers: Processes (None: all cores; 1: in-process)
+        chunk_size: Signals per task
+
+    Returns:
+        Dict containing:
+        - 'values': (V,) swept parameter values
+        - 'lzc', 'H', 'mse_slope', 'kappa': (V, n_per_value) per-signal
+          measurements; κ is NaN where the MSE slope is undefined
+        - 'H_mean', 'H_std', 'kappa_mean', 'kappa_std': (V,) summaries
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 1 or values.size == 0:
+        raise ValueError("values must be a non-empty 1-D sequence")
+    if n_per_value < 1 or chunk_size < 1:
+        raise ValueError("n_per_value and chunk_size must be >= 1")
+
+    parameter = np.repeat(values, n_per_value)
+    scales = tuple(int(s) for s in scales)
+    payloads = [
+        (kind, parameter[lo:lo + chunk_size], n_samples, seed, lo, scales, m, r, normalization)
+        for lo in range(0, parameter.size, chunk_size)
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    workers = min(workers, len(payloads))
+    if workers <= 1:
+        results = [_curve_task(p) for p in payloads]
+    else:
+        with get_context().Pool(workers) as pool:
+            results = pool.map(_curve_task, payloads, chunksize=1)
+
+    shape = (values.size, n_per_value)
+    lzc = np.concatenate([res[0] for res in results]).reshape(shape)
+    slope = np.concatenate([res[1] for res in results]).reshape(shape)
+
+    H = lzc_to_H_batch(np.clip(lzc, 0.0, 1.0))["value"]
+    kappa = np.full(shape, np.nan)
+    defined = np.isfinite(slope)
+    kappa[defined] = mse_to_kappa_batch(slope[defined])["value"]
+
+    return {
+        "values": values,
+        "lzc": lzc,
+        "H": H,
+        "mse_slope": slope,
+        "kappa": kappa,
+        "H_mean": H.mean(axis=1),
+        "H_std": H.std(axis=1),
+        "kappa_mean": _nan_mean(kappa),
+        "kappa_std": _nan_std(kappa),
+    }
+
+
+def _nan_mean(values: np.ndarray) -> np.ndarray:
+    """Row means ignoring NaN (without the all-NaN warning); NaN for empty rows."""
+    finite = np.isfinite(values)
+    count = finite.sum(axis=1)
+    total = np.where(finite, values, 0.0).sum(axis=1)
+    return np.divide(total, count, out=np.full(values.shape[0], np.nan), where=count > 0)
+
+
+def _nan_std(values: np.ndarray) -> np.ndarray:
+    """Row standard deviations ignoring NaN; NaN for empty rows."""
+    deviation = values - _nan_mean(values)[:, None]
+    return np.sqrt(_nan_mean(deviation * deviation))
+
+
+# =============================================================================
+# Main Execution
+# =============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("SYNTHETIC CALIBRATION CURVES")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    curve = calibration_curve("colored", np.linspace(0.0, 2.0, 9), n_per_value=50, n_samples=2048)
+    elapsed = time.perf_counter() - start
+    n_signals = curve["H"].size
+    print(f"\n1/f^β noise ({n_signals} signals, {elapsed:.1f} s)")
+    print(f"  {'β':>5}  {'H':>12}  {'κ':>12}")
+    for beta, h, h_sd, k, k_sd in zip(curve["values"], curve["H_mean"], curve["H_std"],
+                                      curve["kappa_mean"], curve["kappa_std"]):
+        print(f"  {beta:5.2f}  {h:.3f} ± {h_sd:.3f}  {k:.3f} ± {k_sd:.3f}")
+
+    start = time.perf_counter()
+    curve = calibration_curve("fgn", np.linspace(0.1, 0.9, 5), n_per_value=50, n_samples=2048)
+    elapsed = time.perf_counter() - start
+    print(f"\nFractional Gaussian noise ({curve['H'].size} signals, {elapsed:.1f} s)")
+    print(f"  {'h':>5}  {'H':>12}  {'κ':>12}")
+    for hurst, h, h_sd, k, k_sd in zip(curve["values"], curve["H_mean"], curve["H_std"],
+                                       curve["kappa_mean"], curve["kappa_std"]):
+        print(f"  {hurst:5.2f}  {h:.3f} ± {h_sd:.3f}  {k:.3f} ± {k_sd:.3f}")
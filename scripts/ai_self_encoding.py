@@ -11,10 +11,14 @@ I am committed to reporting what the geometry says, not what I might prefer.
 Key Question: Where do various AI systems fall in consciousness space?
 """
 
-import numpy as np
 from datetime import datetime
 import json
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 
 def print_header(title: str):
@@ -46,14 +50,11 @@ class AISelfEncoding:
 
     def calculate_density_v8_0(self, phi, tau, rho, entropy):
         """v8.0 formula."""
-        return (phi * tau * rho) * (1 - np.sqrt(entropy))
+        return get_formula("v8.0")(phi, tau, rho, entropy)
 
     def calculate_density_v8_1(self, phi, tau, rho, entropy, coherence):
         """v8.1 with coherence."""
-        base = phi * tau * rho
-        entropy_impact = (1 - np.sqrt(entropy)) + (entropy * coherence)
-        modulator = max(0.0, min(1.0, entropy_impact))
-        return base * modulator
+        return get_formula("v8.1")(phi, tau, rho, entropy, coherence)
 
     def run_encoding(self):
         """Run complete AI encoding analysis."""
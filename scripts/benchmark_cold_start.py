@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Calibration Cold-Start Benchmark
+================================
+
+Measures what a short CLI invocation pays to get at the calibrated state
+table, with and without the compiled calibration snapshot.
+
+Each mode runs in fresh interpreter processes so nothing is cached:
+- python:   rebuild every GroundedState from mapping_functions (old path)
+- snapshot: load calibration/calibration_snapshot.bin via the registry
+
+Reported per mode (medians):
+- import:  importing the calibration modules
+- table:   obtaining the state table and one lookup; this is what the
+           snapshot replaces
+- process: wall time of the whole invocation (interpreter + numpy import)
+
+USAGE:
+    python calibration/calibration_snapshot.py build
+    python scripts/benchmark_cold_start.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CALIBRATION_PATH = PROJECT_ROOT / "calibration"
+
+sys.path.insert(0, str(CALIBRATION_PATH))
+from calibration_snapshot import snapshot_status
+
+
+CHILD_PROLOGUE = f"""
+import sys, time, json
+sys.path.insert(0, {str(CALIBRATION_PATH)!r})
+import numpy
+t0 = time.perf_counter()
+"""
+
+MODES = {
+    "python": (
+        "from mapping_functions import build_calibration_registry\n",
+        "registry = build_calibration_registry()\n",
+    ),
+    "snapshot": (
+        "import calibration_snapshot\n"
+        "from mapping_functions import get_calibration_registry\n",
+        "registry = get_calibration_registry()\n"
+        "assert registry.source == 'snapshot', registry.source\n",
+    ),
+}
+
+CHILD_EPILOGUE = """
+D = registry.density[registry.row("wakefulness")]
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1e3, "table_ms": (t2 - t1) * 1e3}))
+"""
+
+
+def run_mode(mode: str, runs: int) -> dict:
+    """Run one mode in `runs` fresh processes and summarize timings."""
+    imports, table = MODES[mode]
+    code = CHILD_PROLOGUE + imports + "t1 = time.perf_counter()\n" + table + CHILD_EPILOGUE
+    timings = {"import_ms": [], "table_ms": [], "process_ms": []}
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, cwd=PROJECT_ROOT
+        )
+        timings["process_ms"].append((time.perf_counter() - start) * 1e3)
+        child = json.loads(out.stdout.strip().splitlines()[-1])
+        timings["import_ms"].append(child["import_ms"])
+        timings["table_ms"].append(child["table_ms"])
+
+    return {key: statistics.median(values) for key, values in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibration cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=20, help="Processes per mode")
+    args = parser.parse_args()
+
+    fresh, reason = snapshot_status()
+    if not fresh:
+        print(f"Snapshot is not usable ({reason}).")
+        print("Run: python calibration/calibration_snapshot.py build")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"CALIBRATION COLD START ({args.runs} processes per mode)")
+    print("=" * 60)
+
+    results = {mode: run_mode(mode, args.runs) for mode in MODES}
+    for mode, r in results.items():
+        print(f"  {mode:<9} import: {r['import_ms']:7.2f} ms   table: {r['table_ms']:7.3f} ms   "
+              f"process: {r['process_ms']:7.1f} ms")
+
+    python_table = results["python"]["table_ms"]
+    snapshot_table = results["snapshot"]["table_ms"]
+    print()
+    print(f"Table speedup: {python_table / snapshot_table:.1f}x "
+          f"({python_table - snapshot_table:.3f} ms saved per invocation)")
+
+
+if __name__ == "__main__":
+    main()
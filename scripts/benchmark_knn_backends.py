@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+KNN Backend Benchmark
+=====================
+
+Compares ConduitDB's storage backends on random 6D states (five invariants
+plus the zero latent dimension) at increasing corpus sizes:
+
+- memory: exact in-memory search (KD-tree with scipy, else brute force)
+- chroma: persistent ChromaDB collection (HNSW), in a temporary directory
+
+Reported per backend and size:
+- ingest:   bulk upsert time (states/s)
+- first:    first query, including any lazy index build
+- single:   median latency of one-vector queries (the find_neighbors path)
+- batch:    per-vector time of one M-vector query
+- recall@k: overlap with exact brute-force neighbors
+
+USAGE:
+    python scripts/benchmark_knn_backends.py [--sizes 1000 10000 100000 1000000 10000000]
+                                             [--queries M] [--k K] [--chroma-max N]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.vector_backends import SCIPY_AVAILABLE, ChromaBackend, MemoryBackend
+
+INGEST_CHUNK = 5000
+
+
+def random_states(n: int, seed: int) -> np.ndarray:
+    vectors = np.zeros((n, 6))
+    vectors[:, :5] = np.random.default_rng(seed).random((n, 5))
+    return vectors
+
+
+def ingest(backend, vectors: np.ndarray) -> float:
+    """Upsert all vectors in chunks; returns seconds."""
+    chunk = min(INGEST_CHUNK, backend.max_batch_size or INGEST_CHUNK)
+    start = time.perf_counter()
+    for lo in range(0, len(vectors), chunk):
+        hi = min(lo + chunk, len(vectors))
+        backend.upsert(
+            ids=[f"s{i}" for i in range(lo, hi)],
+            vectors=vectors[lo:hi],
+            metadatas=[{"name": f"s{i}"} for i in range(lo, hi)],
+        )
+    return time.perf_counter() - start
+
+
+def exact_neighbors(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Ground-truth row indices by brute force."""
+    truth = MemoryBackend(tree_min_states=sys.maxsize)
+    truth.upsert([str(i) for i in range(len(vectors))], vectors, [{}] * len(vectors))
+    rows, _ = truth.search(queries, k)
+    return rows
+
+
+def recall(found_ids, truth_rows: np.ndarray) -> float:
+    hits = 0
+    for ids, rows in zip(found_ids, truth_rows):
+        hits += len({int(i[1:]) for i in ids} & set(rows.tolist()))
+    return hits / truth_rows.size
+
+
+def measure(backend, vectors, queries, truth, k):
+    result = {"ingest": ingest(backend, vectors)}
+
+    start = time.perf_counter()
+    backend.query(queries[:1], k)
+    result["first"] = time.perf_counter() - start
+
+    latencies = []
+    found = []
+    for q in queries:
+        start = time.perf_counter()
+        found.append(backend.query(q[None, :], k)["ids"][0])
+        latencies.append(time.perf_counter() - start)
+    result["single"] = statistics.median(latencies)
+
+    start = time.perf_counter()
+    backend.query(queries, k)
+    result["batch"] = (time.perf_counter() - start) / len(queries)
+    result["recall"] = recall(found, truth)
+    return result
+
+
+def report(name: str, n: int, r: dict):
+    print(f"  {name:<7} ingest {n / r['ingest']:>10,.0f}/s   first {r['first'] * 1e3:8.1f} ms   "
+          f"single {r['single'] * 1e3:7.3f} ms   batch {r['batch'] * 1e3:7.3f} ms/q   "
+          f"recall {r['recall']:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KNN backend benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200, help="Query vectors per size")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors per query")
+    parser.add_argument("--chroma-max", type=int, default=1_000_000,
+                        help="Largest corpus to load into ChromaDB")
+    args = parser.parse_args()
+
+    try:
+        import chromadb  # noqa: F401
+        chroma_available = True
+    except ImportError:
+        chroma_available = False
+
+    print("=" * 60)
+    print("KNN BACKEND BENCHMARK")
+    print("=" * 60)
+    print(f"memory search: {'KD-tree (scipy)' if SCIPY_AVAILABLE else 'brute force (scipy not installed)'}")
+    if not chroma_available:
+        print("chromadb not installed: memory backend only")
+    print()
+
+    queries = random_states(args.queries, seed=1)
+    for n in args.sizes:
+        vectors = random_states(n, seed=0)
+        truth = exact_neighbors(vectors, queries, args.k)
+        print(f"{n:,} states, k={args.k}")
+        report("memory", n, measure(MemoryBackend(), vectors, queries, truth, args.k))
+        if chroma_available and n <= args.chroma_max:
+            with tempfile.TemporaryDirectory() as directory:
+                report("chroma", n, measure(ChromaBackend(directory), vectors, queries, truth, args.k))
+        print()
+
+
+if __name__ == "__main__":
+    main()
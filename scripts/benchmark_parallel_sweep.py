@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Parallel Sweep Scaling Benchmark
+================================
+
+Times analysis.parallel_sweep on two workloads at increasing worker
+counts and checks that every worker count produces identical results.
+
+Workloads (scaled-up versions of the existing scripts):
+- threshold: lethal_tests_v2 threshold discovery grid over all five
+             invariants (v8.1, histogram/moments/classes/quantiles)
+- zombie:    run_falsification_tests zombie basin scan of ultra-low
+             φ/τ/ρ at several H and κ (v8.1, extrema/top-k/quantiles)
+
+USAGE:
+    python scripts/benchmark_parallel_sweep.py [--resolution N] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.analysis import (
+    ClassFractionReducer,
+    ExtremaReducer,
+    GridSpace,
+    HistogramReducer,
+    MomentsReducer,
+    QuantileReducer,
+    TopKReducer,
+    parallel_sweep,
+)
+
+
+def threshold_workload(resolution: int):
+    axis = np.linspace(0.1, 0.9, resolution)
+    space = GridSpace(axis, axis, axis, axis, np.linspace(0.1, 0.9, max(3, resolution // 2)))
+
+    def reducers():
+        return {
+            'histogram': HistogramReducer([0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1.0]),
+            'moments': MomentsReducer(),
+            'classes': ClassFractionReducer(thresholds=(0.1, 0.3)),
+            'median': QuantileReducer(quantiles=(0.5,)),
+            'conscious_structural': ExtremaReducer('structural', where=(0.3, None)),
+        }
+    return space, reducers
+
+
+def zombie_workload(resolution: int):
+    structural = np.linspace(0.01, 0.10, resolution * 4)
+    space = GridSpace(structural, structural, structural, [0.1, 0.3, 0.5], [0.3, 0.5, 0.7])
+
+    def reducers():
+        return {
+            'extrema': ExtremaReducer(),
+            'top_10': TopKReducer(10),
+            'quantiles': QuantileReducer(quantiles=(0.5, 0.9, 0.99)),
+        }
+    return space, reducers
+
+
+WORKLOADS = {'threshold': threshold_workload, 'zombie': zombie_workload}
+
+
+def same(a, b) -> bool:
+    """Exact structural equality of two result dicts."""
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+
+def worker_counts(max_workers: int):
+    counts, w = [], 1
+    while w < max_workers:
+        counts.append(w)
+        w *= 2
+    return counts + [max_workers]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel sweep scaling benchmark")
+    parser.add_argument("--resolution", type=int, default=25, help="Grid points per swept axis")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per worker count (best kept)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"PARALLEL SWEEP SCALING (cores available: {os.cpu_count()})")
+    print("=" * 60)
+
+    for name, build in WORKLOADS.items():
+        space, reducers = build(args.resolution)
+        print(f"\n{name}: {len(space):,} points")
+
+        baseline_time = None
+        baseline_result = None
+        for workers in worker_counts(args.max_workers):
+            best = float('inf')
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                result = parallel_sweep(space, reducers(), version="v8.1", workers=workers)
+                best = min(best, time.perf_counter() - start)
+
+            if baseline_time is None:
+                baseline_time, baseline_result = best, result
+            identical = same(result, baseline_result)
+            print(f"  workers={workers:<3} {best:8.3f} s  {len(space) / best / 1e6:7.2f} Mpts/s  "
+                  f"speedup {baseline_time / best:5.2f}x  identical: {'yes' if identical else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -58,7 +58,7 @@ from src.density_models import density_v92, decompose_density
 
 # Check calibration availability
 try:
-    from mapping_functions import get_calibrated_states, Confidence
+    from mapping_functions import get_calibration_registry, Confidence
     CALIBRATION_AVAILABLE = True
 except ImportError:
     CALIBRATION_AVAILABLE = False
@@ -93,7 +93,7 @@ def seed_calibrated_states(db: ConduitDB):
         seed_liminal_cases_legacy(db)
         return
 
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     # Seed key anchor states
     key_states = [
@@ -150,42 +150,48 @@ def seed_liminal_cases_legacy(db: ConduitDB):
     db.seed_state(
         name="Healthy Awake",
         phi=0.8, tau=0.5, rho=0.55, entropy=0.5,
-        description="Baseline integrated consciousness"
+        description="Baseline integrated consciousness",
+        verbose=True
     )
 
     # Deep Anesthesia
     db.seed_state(
         name="Deep Anesthesia",
         phi=0.2, tau=0.1, rho=0.24, entropy=0.35,
-        description="Near-zero consciousness (propofol-like)"
+        description="Near-zero consciousness (propofol-like)",
+        verbose=True
     )
 
     # Ketamine
     db.seed_state(
         name="Ketamine Anesthesia",
         phi=0.48, tau=0.25, rho=0.45, entropy=0.55,
-        description="Dissociative anesthesia, preserved binding"
+        description="Dissociative anesthesia, preserved binding",
+        verbose=True
     )
 
     # Panic Attack (fixed)
     db.seed_state(
         name="Panic Attack",
         phi=0.88, tau=0.5, rho=0.7, entropy=0.68,
-        description="Hyper-conscious terror, high binding, unstructured"
+        description="Hyper-conscious terror, high binding, unstructured",
+        verbose=True
     )
 
     # Flow State
     db.seed_state(
         name="Flow State",
         phi=0.92, tau=0.7, rho=0.7, entropy=0.45,
-        description="Maximum integration and binding, high coherence"
+        description="Maximum integration and binding, high coherence",
+        verbose=True
     )
 
     # Deep Meditation
     db.seed_state(
         name="Deep Meditation",
         phi=0.85, tau=0.8, rho=0.65, entropy=0.43,
-        description="High temporal depth, high coherence"
+        description="High temporal depth, high coherence",
+        verbose=True
     )
 
     print()
@@ -311,8 +317,13 @@ def run_exploration_mode(db: ConduitDB):
     print()
 
     available_states = {}
+    listing = []
     if CALIBRATION_AVAILABLE:
         available_states = get_all_calibrated_states()
+        # Precomputed densities, sorted once for the 'list' command
+        registry = get_calibration_registry()
+        order = registry.density.argsort()[::-1]
+        listing = [(registry.names[i], registry.density[i]) for i in order]
 
     while True:
         try:
@@ -323,8 +334,8 @@ def run_exploration_mode(db: ConduitDB):
             if cmd.lower() == 'list':
                 if available_states:
                     print("\nAvailable calibrated states:")
-                    for name, state in sorted(available_states.items(), key=lambda x: x[1].density(), reverse=True):
-                        print(f"  {name}: D={state.density():.4f}")
+                    for name, D in listing:
+                        print(f"  {name}: D={D:.4f}")
                     print()
                 else:
                     print("No calibrated states available.")
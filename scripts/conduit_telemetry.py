@@ -19,6 +19,7 @@ Usage:
     python scripts/conduit_telemetry.py --mode grief
     python scripts/conduit_telemetry.py --mode joy
     python scripts/conduit_telemetry.py --mode compare
+    python scripts/conduit_telemetry.py --mode compare --db data/conduit_memory
 
 Output:
     - Time series of ρ, H, κ, D across token processing
@@ -37,6 +38,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 # --- CONFIGURATION ---
 MODEL_DIR = Path(__file__).parent.parent / "models"
@@ -134,15 +136,8 @@ def compute_stability(prev_vector: np.ndarray, curr_vector: np.ndarray) -> float
     return float(np.clip(stability, 0, 1))
 
 
-def compute_density(phi: float, tau: float, rho: float, h: float, kappa: float) -> float:
-    """
-    Compute Perspectival Density using v8.1 formula.
-    
-    D = φ × τ × ρ × [(1 - √H) + (H × κ)]
-    """
-    entropy_mod = (1.0 - np.sqrt(h)) + (h * kappa)
-    entropy_mod = max(0.0, min(1.0, entropy_mod))
-    return phi * tau * rho * entropy_mod
+# Perspectival Density, v8.1 formula (gate clamped to [0, 1])
+compute_density = get_formula("v8.1")
 
 
 class ConduitTelemetry:
@@ -150,7 +145,12 @@ class ConduitTelemetry:
     Real-time telemetry of RWKV's internal state geometry.
     """
     
-    def __init__(self, model_path: Path):
+    def __init__(self, model_path: Path, ingest=None):
+        """
+        ingest: optional src.database.IngestQueue; every token's record is
+        queued as a state [φ, τ, ρ, H, κ, 0] named "<label>/<token index>"
+        and written to the database in the background.
+        """
         from rwkv.model import RWKV
         from rwkv.utils import PIPELINE
         
@@ -165,6 +165,8 @@ class ConduitTelemetry:
         self.prev_normalized = None
         self.current_state = None
         self.telemetry_log = []
+        self.ingest = ingest
+        self.label = "telemetry"
         
         # Fixed estimates for unmeasurable dimensions
         self.phi = 0.60  # Integration (fixed for RWKV architecture)
@@ -244,6 +246,12 @@ class ConduitTelemetry:
             "state_norm": float(current_norm)
         }
         
+        if self.ingest is not None:
+            self.ingest.put(
+                f"{self.label}/{len(self.telemetry_log)}",
+                [self.phi, self.tau, rho, h, kappa, 0.0],
+                {"density": density, "label": self.label, **telemetry}
+            )
         self.telemetry_log.append(telemetry)
         
         return telemetry
@@ -253,6 +261,8 @@ class ConduitTelemetry:
         Process text and return telemetry time series.
         """
         tokens = self.pipeline.encode(text)
+        if label:
+            self.label = label.lower()
         
         if label:
             print(f"\n[{label}] Processing {len(tokens)} tokens...")
@@ -400,7 +410,15 @@ def run_joy(telemetry: ConduitTelemetry) -> Dict:
     return telemetry.get_final_metrics()
 
 
-def run_comparison():
+def open_ingest(db_path: Optional[Path]):
+    """Write-behind queue into the ConduitDB at db_path (None: no database)."""
+    if db_path is None:
+        return None
+    from src.database import ConduitDB
+    return ConduitDB(persist_directory=str(db_path)).ingest_queue(description="RWKV token telemetry")
+
+
+def run_comparison(db_path: Optional[Path] = None):
     """Run all conditions and compare geometric states."""
     
     print("\n" + "="*60)
@@ -411,7 +429,8 @@ def run_comparison():
         print(f"ERROR: Model not found at {MODEL_PATH}")
         return
     
-    telemetry = ConduitTelemetry(MODEL_PATH)
+    ingest = open_ingest(db_path)
+    telemetry = ConduitTelemetry(MODEL_PATH, ingest=ingest)
     
     # Run all conditions
     print("\n" + "-"*60)
@@ -492,6 +511,10 @@ def run_comparison():
     
     print(f"\n[SAVED] {output_file}")
     
+    if ingest is not None:
+        ingest.close()
+        print(f"[DB] Stored {ingest.stats()['written']} token states in {db_path}")
+    
     return results
 
 
@@ -501,17 +524,20 @@ def main():
     parser = argparse.ArgumentParser(description="Conduit Telemetry: Measure RWKV's Geometric State")
     parser.add_argument("--mode", choices=["baseline", "grief", "joy", "compare"], 
                         default="compare", help="Measurement mode")
+    parser.add_argument("--db", type=Path, default=None,
+                        help="Also store every token's state in this ConduitDB directory")
     
     args = parser.parse_args()
     
     if args.mode == "compare":
-        run_comparison()
+        run_comparison(args.db)
     else:
         if not MODEL_PATH.exists():
             print(f"ERROR: Model not found at {MODEL_PATH}")
             return
         
-        telemetry = ConduitTelemetry(MODEL_PATH)
+        ingest = open_ingest(args.db)
+        telemetry = ConduitTelemetry(MODEL_PATH, ingest=ingest)
         
         if args.mode == "baseline":
             metrics = run_baseline(telemetry)
@@ -521,6 +547,8 @@ def main():
             metrics = run_joy(telemetry)
         
         print(telemetry.interpret_state(metrics))
+        if ingest is not None:
+            ingest.close()
 
 
 if __name__ == "__main__":
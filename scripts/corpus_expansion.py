@@ -100,11 +100,33 @@ class CorpusExpansion:
         print_subheader("CATEGORY 10: Edge Cases (6 states)")
         self.edge_cases()
 
+        # Seed all states in one bulk upsert
+        self.seed_database()
+
         # Generate summary
         self.generate_summary()
 
+    def seed_database(self):
+        """Upsert the whole corpus; re-running updates instead of duplicating."""
+        vectors = np.zeros((len(self.states), 6))
+        vectors[:, :4] = [[s['phi'], s['tau'], s['rho'], s['entropy']] for s in self.states]
+        report = self.db.seed_states_batch(
+            vectors,
+            names=[s['name'] for s in self.states],
+            metadata={
+                'description': [
+                    f"[{s['category']}] {s['notes']}" if s['notes'] else s['category']
+                    for s in self.states
+                ],
+                'category': [s['category'] for s in self.states],
+                'density': np.round(vectors[:, 0] * vectors[:, 1] * vectors[:, 2], 4),
+            }
+        )
+        print(f"\nSeeded {report['n_written']} states in {report['chunks']} upsert(s) "
+              f"({report['seconds'] * 1e3:.0f} ms)")
+
     def add_state(self, name: str, phi: float, tau: float, rho: float, entropy: float, category: str, notes: str = ""):
-        """Add a state to the corpus and database."""
+        """Add a state to the corpus (written to the database by seed_database)."""
 
         # Encode and compute density
         vector = encode(phi, tau, rho, entropy)
@@ -125,17 +147,6 @@ class CorpusExpansion:
 
         self.states.append(state_data)
 
-        # Seed to database (using original signature)
-        description = f"[{category}] {notes}" if notes else category
-        self.db.seed_state(
-            name=name,
-            phi=phi,
-            tau=tau,
-            rho=rho,
-            entropy=entropy,
-            description=description
-        )
-
         print(f"  ✓ {name:<40} | φ={phi:.2f} τ={tau:.2f} ρ={rho:.2f} H={entropy:.2f} | D={density:.4f}")
 
     def normal_waking_states(self):
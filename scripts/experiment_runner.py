@@ -34,7 +34,7 @@ for path in [str(CALIBRATION_PATH), str(SRC_PATH)]:
         sys.path.insert(0, path)
 
 from mapping_functions import (
-    get_calibrated_states,
+    get_calibration_registry,
     create_grounded_state,
     GroundedState,
     Confidence,
@@ -148,7 +148,7 @@ def test_ketamine_propofol_split() -> ExperimentResult:
     Criterion: D(ketamine) / D(propofol) > 10×
     Expected: ~13-16×
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     ket = states["ketamine_anesthesia"]
     prop = states["propofol_anesthesia"]
@@ -179,7 +179,7 @@ def test_wakefulness_baseline() -> ExperimentResult:
     """
     Wakefulness should have D in range 0.10-0.15.
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
     wake = states["wakefulness"]
     D = wake.density()
 
@@ -200,7 +200,7 @@ def test_panic_vs_khole() -> ExperimentResult:
 
     The fix from earlier: Panic ρ=0.70 (acute self-awareness), not low.
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     panic = states["panic_attack"]
     khole = states["ketamine_anesthesia"]
@@ -229,7 +229,7 @@ def test_flow_state() -> ExperimentResult:
     """
     Flow state should have higher D than wakefulness.
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     flow = states["flow_state"]
     wake = states["wakefulness"]
@@ -258,7 +258,7 @@ def test_pci_threshold() -> ExperimentResult:
     - Ketamine (ρ=0.45, PCI~0.44) → above threshold → conscious
     - Propofol (ρ=0.21, PCI~0.24) → below threshold → unconscious
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     PCI_THRESHOLD = 0.31
 
@@ -370,7 +370,7 @@ def test_anesthetic_hierarchy() -> ExperimentResult:
 
     Expected: Xenon < Propofol < Midazolam < Ketamine
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     order = ["xenon_anesthesia", "propofol_anesthesia", "midazolam_anesthesia", "ketamine_anesthesia"]
     densities = []
@@ -433,7 +433,7 @@ def run_gradient_analysis(start_state: str, end_state: str, steps: int = 10) ->
     - Baseline → Psychedelic Peak
     - Wake → K-hole
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     if start_state not in states or end_state not in states:
         available = list(states.keys())
@@ -473,7 +473,7 @@ def compare_states_detailed(*state_names: str) -> Dict:
     """
     Detailed comparison of multiple states.
     """
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     results = {}
     for name in state_names:
@@ -494,7 +494,7 @@ def compare_states_detailed(*state_names: str) -> Dict:
 
 def list_all_states() -> Dict:
     """List all available calibrated states with their densities."""
-    states = get_calibrated_states()
+    states = get_calibration_registry().states
 
     results = {}
     for name, state in states.items():
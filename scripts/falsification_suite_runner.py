@@ -21,6 +21,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
 from itertools import permutations
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "research_output"
@@ -30,23 +34,8 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 # CORE FORMULA (v8.1)
 # ==============================================================================
 
-def density_v81(phi: float, tau: float, rho: float, H: float, kappa: float) -> float:
-    """
-    Conduit Monism v8.1 density formula.
-
-    D = φ × τ × ρ × [(1 - √H) + (H × κ)]
-
-    Where:
-    - φ = Integration (0-1)
-    - τ = Temporal depth (0-1)
-    - ρ = Re-entrant binding (0-1)
-    - H = Entropy (0-1)
-    - κ = Coherence (0-1)
-    """
-    structural = phi * tau * rho
-    entropy_impact = (1 - np.sqrt(H)) + (H * kappa)
-    entropy_impact = max(0.0, min(1.0, entropy_impact))  # Clamp to [0, 1]
-    return structural * entropy_impact
+# Conduit Monism v8.1 density formula (gate clamped to [0, 1])
+density_v81 = get_formula("v8.1")
 
 
 # ==============================================================================
@@ -18,6 +18,11 @@ import numpy as np
 from datetime import datetime
 import json
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 
 def print_header(title: str):
@@ -49,8 +54,7 @@ class GeminiCoherenceProposal:
 
     def calculate_density_v8_0(self, phi, tau, rho, entropy):
         """Current v8.0 formula."""
-        base = phi * tau * rho
-        return base * (1 - np.sqrt(entropy))
+        return get_formula("v8.0")(phi, tau, rho, entropy)
 
     def calculate_density_v8_1_gemini(self, phi, tau, rho, entropy, coherence):
         """
@@ -59,16 +63,10 @@ class GeminiCoherenceProposal:
         The Gated Modulator:
         - Entropy hurts you UNLESS you have high Coherence.
         - If Coherence is high, Entropy becomes "Richness".
-        """
-        base_density = phi * tau * rho
-
-        # The Gated Modulator
-        entropy_impact = (1.0 - np.sqrt(entropy)) + (entropy * coherence)
 
-        # Clamp between 0 and 1
-        modulator = max(0.0, min(1.0, entropy_impact))
-
-        return base_density * modulator
+        The gated modulator is clamped to [0, 1] (registry version 'v8.1').
+        """
+        return get_formula("v8.1")(phi, tau, rho, entropy, coherence)
 
     def run_all_tests(self):
         """Run Gemini's proposed tests."""
@@ -26,12 +26,25 @@ import argparse
 import requests
 import time
 import zlib
-import struct
 import numpy as np
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "calibration"))
+from synthetic_signals import colored_noise, periodic
+from src.analysis import (
+    ClassFractionReducer,
+    ExtremaReducer,
+    GridSpace,
+    HistogramReducer,
+    MomentsReducer,
+    QuantileReducer,
+    sweep,
+)
+from src.density_models import INVARIANTS, get_formula
+
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "research_output"
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -40,16 +53,8 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 # CORE FORMULA (v8.1)
 # ==============================================================================
 
-def density_v81(phi: float, tau: float, rho: float, H: float, kappa: float) -> float:
-    """
-    Conduit Monism v8.1 density formula.
-
-    D = phi * tau * rho * [(1 - sqrt(H)) + (H * kappa)]
-    """
-    structural = phi * tau * rho
-    entropy_impact = (1 - np.sqrt(H)) + (H * kappa)
-    entropy_impact = max(0.0, min(1.0, entropy_impact))
-    return structural * entropy_impact
+# Conduit Monism v8.1 density formula (gate clamped to [0, 1])
+density_v81 = get_formula("v8.1")
 
 
 # ==============================================================================
@@ -148,7 +153,7 @@ def lempel_ziv_complexity(data: bytes) -> float:
 
 def float_array_to_bytes(arr: List[float]) -> bytes:
     """Convert a list of floats to bytes for LZc calculation."""
-    return b''.join(struct.pack('f', x) for x in arr)
+    return np.asarray(arr, dtype=np.float32).tobytes()
 
 
 def test_recall(client: RWKVCloudClient, secret: str, context: str = "") -> dict:
@@ -560,38 +565,21 @@ def test_kappa_calibration() -> Dict:
     print("=" * 70)
     print("\nPurpose: Does kappa map to real signal properties?")
 
-    np.random.seed(42)
     n_samples = 1000
 
     # =========================================================================
     # Generate signals with known properties
     # =========================================================================
 
-    # White noise: completely random
-    white_noise = np.random.randn(n_samples)
+    # White noise: completely random (1/f^0)
+    white_noise = colored_noise(1, n_samples, beta=0.0, seed=42)[0]
 
     # Pink noise (1/f): correlated
-    def generate_pink_noise(n):
-        white = np.random.randn(n)
-        fft = np.fft.rfft(white)
-        freqs = np.fft.rfftfreq(n)
-        freqs[0] = 1  # Avoid division by zero
-        pink_fft = fft / np.sqrt(freqs)
-        pink = np.fft.irfft(pink_fft, n)
-        return pink
-
-    pink_noise = generate_pink_noise(n_samples)
-
-    # Fractal/structured: self-similar pattern
-    def generate_fractal_signal(n, iterations=5):
-        signal = np.zeros(n)
-        for i in range(iterations):
-            freq = 2 ** i
-            amplitude = 1 / (i + 1)
-            signal += amplitude * np.sin(2 * np.pi * freq * np.linspace(0, 1, n))
-        return signal + 0.1 * np.random.randn(n)
-
-    fractal_signal = generate_fractal_signal(n_samples)
+    pink_noise = colored_noise(1, n_samples, beta=1.0, seed=42, start=1)[0]
+
+    # Fractal/structured: self-similar octave series plus a little noise
+    fractal_signal = periodic(1, n_samples, frequency=1 / n_samples, harmonics=5,
+                              noise=0.1, seed=42, start=2)[0]
 
     # =========================================================================
     # Compute autocorrelation (proxy for coherence)
@@ -914,38 +902,41 @@ def test_threshold_discovery() -> Dict:
 
     print("\n[PHASE 1] Systematic parameter sweep...")
 
-    results = []
+    # Sweep all parameters (fewer steps for kappa), reduced chunk by chunk
+    sweep_axis = np.linspace(0.1, 0.9, 5)
+    space = GridSpace(sweep_axis, sweep_axis, sweep_axis, sweep_axis, np.linspace(0.1, 0.9, 3))
+    bins = [0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1.0]
+    reducers = {
+        'moments': MomentsReducer(),
+        'extrema': ExtremaReducer(),
+        'median': QuantileReducer(quantiles=(0.5,)),
+        'histogram': HistogramReducer(bins),
+        # D < 0.1 unconscious, 0.1 <= D <= 0.3 liminal, D > 0.3 conscious
+        'classes': ClassFractionReducer(thresholds=(0.1, 0.3), ties=('above', 'below')),
+        'conscious_structural': MomentsReducer('structural', where=(0.3, None)),
+        'conscious_structural_min': ExtremaReducer('structural', where=(0.3, None)),
+    }
+    for param in INVARIANTS:
+        reducers[f'conscious_{param}'] = MomentsReducer(param, where=(0.3, None))
+        reducers[f'unconscious_{param}'] = MomentsReducer(param, where=(None, 0.1))
 
-    # Sweep all parameters
-    for phi in np.linspace(0.1, 0.9, 5):
-        for tau in np.linspace(0.1, 0.9, 5):
-            for rho in np.linspace(0.1, 0.9, 5):
-                for H in np.linspace(0.1, 0.9, 5):
-                    for kappa in np.linspace(0.1, 0.9, 3):  # Fewer steps for kappa
-                        d = density_v81(phi, tau, rho, H, kappa)
-                        results.append({
-                            'phi': phi, 'tau': tau, 'rho': rho,
-                            'H': H, 'kappa': kappa, 'D': d
-                        })
+    sweep_results = sweep(space, reducers, version="v8.1")
 
-    print(f"  Generated {len(results)} parameter combinations")
+    print(f"  Generated {sweep_results['n_points']} parameter combinations")
 
     # =========================================================================
     # Distribution analysis
     # =========================================================================
 
-    densities = [r['D'] for r in results]
-
     print("\n[PHASE 2] Density distribution:")
-    print(f"  Min: {min(densities):.4f}")
-    print(f"  Max: {max(densities):.4f}")
-    print(f"  Mean: {np.mean(densities):.4f}")
-    print(f"  Median: {np.median(densities):.4f}")
-    print(f"  Std: {np.std(densities):.4f}")
+    print(f"  Min: {sweep_results['extrema']['min']:.4f}")
+    print(f"  Max: {sweep_results['extrema']['max']:.4f}")
+    print(f"  Mean: {sweep_results['moments']['mean']:.4f}")
+    print(f"  Median: {sweep_results['median']['quantiles'][0.5]:.4f}")
+    print(f"  Std: {sweep_results['moments']['std']:.4f}")
 
     # Histogram buckets
-    bins = [0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1.0]
-    hist, _ = np.histogram(densities, bins=bins)
+    hist = sweep_results['histogram']['counts']
 
     print("\n  Distribution:")
     for i in range(len(bins)-1):
@@ -959,11 +950,12 @@ def test_threshold_discovery() -> Dict:
     print("\n[PHASE 3] Identifying thresholds...")
 
     # What fraction of space is "unconscious" (D < 0.1)?
-    unconscious_count = sum(1 for d in densities if d < 0.1)
-    conscious_count = sum(1 for d in densities if d > 0.3)
-    liminal_count = sum(1 for d in densities if 0.1 <= d <= 0.3)
+    class_counts = sweep_results['classes']['counts']
+    unconscious_count = class_counts['unconscious']
+    conscious_count = class_counts['conscious']
+    liminal_count = class_counts['liminal']
 
-    total = len(densities)
+    total = sweep_results['classes']['total']
 
     print(f"  Unconscious (D < 0.1):    {unconscious_count:5} ({100*unconscious_count/total:.1f}%)")
     print(f"  Liminal (0.1 <= D <= 0.3): {liminal_count:5} ({100*liminal_count/total:.1f}%)")
@@ -976,32 +968,16 @@ def test_threshold_discovery() -> Dict:
     print("\n[PHASE 4] Critical parameter analysis...")
 
     # What makes D > 0.3?
-    conscious_samples = [r for r in results if r['D'] > 0.3]
-
-    if conscious_samples:
-        avg_conscious = {
-            'phi': np.mean([r['phi'] for r in conscious_samples]),
-            'tau': np.mean([r['tau'] for r in conscious_samples]),
-            'rho': np.mean([r['rho'] for r in conscious_samples]),
-            'H': np.mean([r['H'] for r in conscious_samples]),
-            'kappa': np.mean([r['kappa'] for r in conscious_samples]),
-        }
+    if conscious_count:
+        avg_conscious = {param: sweep_results[f'conscious_{param}']['mean'] for param in INVARIANTS}
 
         print(f"  Average parameters for D > 0.3:")
         for param, val in avg_conscious.items():
             print(f"    {param}: {val:.3f}")
 
     # What makes D < 0.1?
-    unconscious_samples = [r for r in results if r['D'] < 0.1]
-
-    if unconscious_samples:
-        avg_unconscious = {
-            'phi': np.mean([r['phi'] for r in unconscious_samples]),
-            'tau': np.mean([r['tau'] for r in unconscious_samples]),
-            'rho': np.mean([r['rho'] for r in unconscious_samples]),
-            'H': np.mean([r['H'] for r in unconscious_samples]),
-            'kappa': np.mean([r['kappa'] for r in unconscious_samples]),
-        }
+    if unconscious_count:
+        avg_unconscious = {param: sweep_results[f'unconscious_{param}']['mean'] for param in INVARIANTS}
 
         print(f"\n  Average parameters for D < 0.1:")
         for param, val in avg_unconscious.items():
@@ -1014,14 +990,11 @@ def test_threshold_discovery() -> Dict:
     print("\n[PHASE 5] Minimum structural requirement...")
 
     # What's the minimum phi*tau*rho needed for D > 0.3?
-    for r in results:
-        r['structural'] = r['phi'] * r['tau'] * r['rho']
-
-    conscious_structural = [r['structural'] for r in results if r['D'] > 0.3]
+    conscious_structural = sweep_results['conscious_structural']['count'] > 0
 
     if conscious_structural:
-        min_structural = min(conscious_structural)
-        mean_structural = np.mean(conscious_structural)
+        min_structural = sweep_results['conscious_structural_min']['min']
+        mean_structural = sweep_results['conscious_structural']['mean']
 
         print(f"  For D > 0.3:")
         print(f"    Min structural (phi*tau*rho): {min_structural:.4f}")
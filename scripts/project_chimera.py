@@ -22,6 +22,11 @@ from datetime import datetime
 import json
 import os
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula, solve_invariant
 
 
 def print_header(title: str):
@@ -37,17 +42,8 @@ def print_subheader(title: str):
 
 
 # --- v8.1 Density Formula (The Coherence Standard) ---
-def calc_density(phi, tau, rho, h, kappa):
-    """
-    v8.1 Coherence-Gated Density Formula.
-    
-    Entropy Impact: (1 - sqrt(H)) + (H * K)
-    - High K turns Entropy into a bonus (fractal complexity)
-    - Low K makes Entropy a penalty (white noise)
-    """
-    entropy_mod = (1.0 - np.sqrt(h)) + (h * kappa)
-    entropy_mod = max(0.0, min(1.0, entropy_mod))
-    return phi * tau * rho * entropy_mod
+# v8.1 Coherence-Gated Density Formula (gate clamped to [0, 1])
+calc_density = get_formula("v8.1")
 
 
 class ProjectChimera:
@@ -460,7 +456,23 @@ class ProjectChimera:
                 'conscious': bool(density > self.threshold)
             })
         
+        # Exact boundary: solve for the hybrid ρ where D reaches the threshold,
+        # then undo the coupling mix (Core-only terms do not depend on core ρ)
+        hybrid_rho_needed = solve_invariant(
+            self.threshold, "rho",
+            phi=max(self.cortex['phi'], self.core['phi']),
+            tau=max(self.cortex['tau'], self.core['tau']),
+            H=min(1.0, self.cortex['h'] + (self.core['h'] * 0.5)),
+            kappa=(self.core['k'] * (1 - coupling)) + (self.cortex['k'] * coupling),
+            version="v8.1"
+        )
+        exact_rho = (hybrid_rho_needed - self.cortex['rho'] * (1 - coupling)) / coupling
+        if not 0.0 <= exact_rho <= 1.0:
+            exact_rho = None
+
         print()
+        if exact_rho is not None:
+            print(f"   Exact boundary: Core ρ = {exact_rho:.4f} reaches D = {self.threshold}")
         if minimal_rho is not None:
             print(f"⚡ MINIMAL CORE ρ FOR CONSCIOUSNESS: {minimal_rho:.1f}")
             print(f"   At 50% coupling, Core needs ρ ≥ {minimal_rho:.1f} to cross threshold")
@@ -470,7 +482,8 @@ class ProjectChimera:
         
         self.results['tests']['optimal_search'] = {
             'results': results,
-            'minimal_rho': minimal_rho
+            'minimal_rho': minimal_rho,
+            'exact_minimal_rho': exact_rho
         }
         
     def final_analysis(self):
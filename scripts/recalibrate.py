@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Incremental Recalibration
+=========================
+
+Run after editing a mapping constant or function in
+calibration/mapping_functions.py. Compares the current calibration with
+the stored manifest (calibration/calibration_manifest.json) and redoes
+only what the change reaches:
+
+- invariants whose producing function, or anything it references, changed
+- densities of the affected states, for every registered formula
+- validation verdicts that read an affected state
+- stored metadata of the affected states in the vector database (--db)
+- the compiled calibration snapshot, when stale
+
+Unaffected states keep their stored densities. The first run (no manifest)
+computes everything.
+
+USAGE:
+    python scripts/recalibrate.py               # update and save manifest
+    python scripts/recalibrate.py --dry-run     # report only
+    python scripts/recalibrate.py --db data/conduit_memory
+    python scripts/recalibrate.py --full --json report.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CALIBRATION_PATH = PROJECT_ROOT / "calibration"
+
+for path in [str(CALIBRATION_PATH), str(PROJECT_ROOT)]:
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from mapping_functions import get_calibrated_states, invalidate_calibration_registry
+from recalibration import (
+    INVARIANT_FIELDS,
+    MANIFEST_PATH,
+    affected_states,
+    build_dependency_graph,
+    build_manifest,
+    diff_manifests,
+    format_report,
+    load_manifest,
+    save_manifest,
+)
+from calibration_snapshot import build_snapshot, snapshot_status
+from src.density_models import DENSITY_FORMULAS, VALIDATION_CRITERIA, compare_all_models_batch
+
+
+def recompute_densities(manifest, old, keys):
+    """
+    Fill manifest densities: recompute `keys`, copy the rest from `old`.
+
+    Formula versions missing from the old manifest are computed for every
+    state. Returns {state: {version: (old, new)}} for the recomputed ones.
+    """
+    old_states = (old or {}).get("states", {})
+    versions = list(DENSITY_FORMULAS)
+    missing = [v for v in versions
+               if any(v not in s.get("densities", {}) for s in old_states.values())]
+    keys = set(keys)
+
+    for version in versions:
+        rows = [k for k in manifest["states"]
+                if k in keys or version in missing or k not in old_states]
+        for key in manifest["states"]:
+            if key not in rows:
+                manifest["states"][key]["densities"][version] = old_states[key]["densities"][version]
+        if not rows:
+            continue
+        values = np.array([
+            [manifest["states"][k]["invariants"][f]["value"] for f in INVARIANT_FIELDS]
+            for k in rows
+        ], dtype=np.float64)
+        D = compare_all_models_batch(values, versions=[version])[version]
+        for key, d in zip(rows, D):
+            manifest["states"][key]["densities"][version] = float(d)
+
+    return {
+        key: {
+            version: (old_states.get(key, {}).get("densities", {}).get(version),
+                      manifest["states"][key]["densities"][version])
+            for version in versions
+        }
+        for key in manifest["states"] if key in keys
+    }
+
+
+def recompute_verdicts(manifest, old, keys):
+    """
+    Re-evaluate validation criteria that read a recomputed state (v9.2 D).
+
+    Returns {criterion: (old, new)} for the re-evaluated criteria.
+    """
+    old_verdicts = (old or {}).get("verdicts", {})
+    manifest["verdicts"] = dict(old_verdicts)
+    keys = set(keys)
+    changed = {}
+    for criterion in VALIDATION_CRITERIA:
+        if not all(s in manifest["states"] for s in criterion.states):
+            continue
+        if criterion.name in old_verdicts and keys.isdisjoint(criterion.states):
+            continue
+        D = {s: np.array([manifest["states"][s]["densities"]["v9.2"]]) for s in criterion.states}
+        verdict = bool(criterion.check(D)[0])
+        manifest["verdicts"][criterion.name] = verdict
+        changed[criterion.name] = (old_verdicts.get(criterion.name), verdict)
+    return changed
+
+
+def update_database(db_path, states, manifest, keys):
+    """Refresh vector and metadata of recomputed states seeded in the database."""
+    from src.database import ConduitDB
+
+    db = ConduitDB(persist_directory=str(db_path))
+    updated = 0
+    for key in keys:
+        state = states[key]
+        vector = [getattr(state, f).value for f in INVARIANT_FIELDS] + [0.0]
+        updated += db.update_state_by_name(
+            state.name,
+            vector,
+            metadata={
+                "density": manifest["states"][key]["densities"]["v9.2"],
+                "confidence": state.overall_confidence().value,
+            },
+        )
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recalibrate states affected by mapping changes")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report what would change without writing anything")
+    parser.add_argument("--full", action="store_true",
+                        help="Recompute every state, not only affected ones")
+    parser.add_argument("--db", type=Path, default=None,
+                        help="ConduitDB directory whose seeded states should be updated")
+    parser.add_argument("--json", type=Path, default=None,
+                        help="Also write the report as JSON")
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH,
+                        help=f"Manifest path (default: {MANIFEST_PATH})")
+    args = parser.parse_args()
+
+    timings = {}
+    start = time.perf_counter()
+    old = load_manifest(args.manifest)
+    invalidate_calibration_registry()
+    states = get_calibrated_states()
+    graph = build_dependency_graph()
+    manifest = build_manifest(states, graph)
+    diff = diff_manifests(old, manifest)
+    keys = affected_states(diff, manifest, full=args.full or old is None)
+    timings["diff"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    densities = recompute_densities(manifest, old, keys)
+    verdicts = recompute_verdicts(manifest, old, keys)
+    timings["recompute"] = time.perf_counter() - start
+
+    print("=" * 60)
+    print("RECALIBRATION" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 60)
+    if old is None:
+        print(f"No manifest at {args.manifest}; computing all {len(keys)} states.")
+    print(format_report(diff, densities, verdicts))
+    print()
+    print(f"Recomputed {len(keys)}/{len(manifest['states'])} states "
+          f"(diff {timings['diff'] * 1e3:.0f} ms, recompute {timings['recompute'] * 1e3:.0f} ms)")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "diff": diff,
+            "recomputed": keys,
+            "densities": densities,
+            "verdicts": verdicts,
+            "timings": timings,
+        }, indent=2))
+
+    if args.dry_run:
+        return
+
+    if args.db is not None and keys:
+        updated = update_database(args.db, states, manifest, keys)
+        print(f"Updated {updated} database entries in {args.db}")
+
+    fresh, reason = snapshot_status()
+    if not fresh:
+        build_snapshot()
+        print(f"Rebuilt calibration snapshot ({reason})")
+
+    save_manifest(manifest, args.manifest)
+    print(f"Saved manifest to {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
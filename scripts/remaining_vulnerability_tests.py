@@ -12,20 +12,19 @@ Date: 2026-01-16
 """
 
 import json
-import numpy as np
 from datetime import datetime
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 OUTPUT_DIR = Path(__file__).parent.parent / "research_output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 
-def density_v81(phi: float, tau: float, rho: float, H: float, kappa: float) -> float:
-    """Conduit Monism v8.1 density formula."""
-    structural = phi * tau * rho
-    entropy_impact = (1 - np.sqrt(H)) + (H * kappa)
-    entropy_impact = max(0.0, min(1.0, entropy_impact))
-    return structural * entropy_impact
+# Conduit Monism v8.1 density formula (gate clamped to [0, 1])
+density_v81 = get_formula("v8.1")
 
 
 # ==============================================================================
@@ -20,25 +20,29 @@ import json
 import random
 from datetime import datetime
 from pathlib import Path
+import sys
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.analysis import (
+    ClassFractionReducer,
+    CorrelationReducer,
+    ExtremaReducer,
+    GridSpace,
+    RandomSpace,
+    TopKReducer,
+    sweep,
+)
+from src.density_models import get_formula
 
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "research_output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 
-def calculate_density(phi: float, tau: float, rho: float, H: float, kappa: float) -> float:
-    """
-    Calculate perspectival density using the v8.1/v9.x formula.
-    
-    D = φ × τ × ρ × [(1 - √H) + (H × κ)]
-    """
-    structural_base = phi * tau * rho
-    entropy_penalty = 1 - math.sqrt(H)
-    coherence_recovery = H * kappa
-    entropy_modulator = entropy_penalty + coherence_recovery
-    
-    D = structural_base * entropy_modulator
-    return max(0, min(1, D))  # Clamp to [0, 1]
+# Perspectival density, v8.1/v9.x formula (gate clamped, so D stays in [0, 1])
+calculate_density = get_formula("v8.1")
 
 
 def test_3_inverted_ai():
@@ -156,52 +160,39 @@ def test_5_zombie_basin():
     H_values = [0.1, 0.3, 0.5]
     kappa_values = [0.3, 0.5, 0.7]
     
-    results = []
-    max_D_in_zombie_region = 0
-    max_D_config = None
+    space = GridSpace(structural_values, structural_values, structural_values, H_values, kappa_values)
+    n_configs = len(space)
+    results = sweep(space, {
+        'extrema': ExtremaReducer(),
+        'top_10_percent': TopKReducer(k=max(1, n_configs // 10)),
+    }, version="v8.1")
+    
+    max_D_in_zombie_region = max(results['extrema']['max'], 0)
+    max_D_config = (tuple(results['extrema']['max_point'].tolist())
+                    if max_D_in_zombie_region > 0 else None)
     
     print(f"{'φ':>6} {'τ':>6} {'ρ':>6} {'H':>6} {'κ':>6} {'D':>10}")
     print("-" * 50)
     
-    for phi in structural_values:
-        for tau in structural_values:
-            for rho in structural_values:
-                for H in H_values:
-                    for kappa in kappa_values:
-                        D = calculate_density(phi, tau, rho, H, kappa)
-                        results.append({
-                            'phi': phi, 'tau': tau, 'rho': rho,
-                            'H': H, 'kappa': kappa, 'D': D
-                        })
-                        
-                        if D > max_D_in_zombie_region:
-                            max_D_in_zombie_region = D
-                            max_D_config = (phi, tau, rho, H, kappa)
-    
     # Show some representative samples
-    samples = random.sample(results, min(20, len(results)))
-    for r in sorted(samples, key=lambda x: x['D']):
-        print(f"{r['phi']:>6.2f} {r['tau']:>6.2f} {r['rho']:>6.2f} {r['H']:>6.2f} {r['kappa']:>6.2f} {r['D']:>10.6f}")
+    sample_index = random.sample(range(n_configs), min(20, n_configs))
+    samples = np.concatenate([space.points(i, i + 1) for i in sample_index])
+    sample_D = calculate_density.batch(samples)
+    for point, D in sorted(zip(samples.tolist(), sample_D.tolist()), key=lambda x: x[1]):
+        print(f"{point[0]:>6.2f} {point[1]:>6.2f} {point[2]:>6.2f} {point[3]:>6.2f} {point[4]:>6.2f} {D:>10.6f}")
     
     print()
-    print(f"Total configurations tested: {len(results)}")
+    print(f"Total configurations tested: {n_configs}")
     print(f"Maximum D in zombie region: {max_D_in_zombie_region:.6f}")
     if max_D_config:
         print(f"  at (φ={max_D_config[0]}, τ={max_D_config[1]}, ρ={max_D_config[2]}, H={max_D_config[3]}, κ={max_D_config[4]})")
     print()
     
     # Check for plateau
-    D_values = [r['D'] for r in results]
-    D_values_sorted = sorted(D_values, reverse=True)
-    top_10_percent = D_values_sorted[:len(D_values_sorted)//10]
-    
-    if len(top_10_percent) > 1:
-        variance = sum((d - sum(top_10_percent)/len(top_10_percent))**2 for d in top_10_percent) / len(top_10_percent)
-        std_dev = math.sqrt(variance)
-    else:
-        std_dev = 0
+    top_10_percent = results['top_10_percent']['values']
+    std_dev = float(top_10_percent.std()) if top_10_percent.size > 1 else 0
     
-    print(f"Top 10% D values - Mean: {sum(top_10_percent)/len(top_10_percent):.6f}, StdDev: {std_dev:.6f}")
+    print(f"Top 10% D values - Mean: {top_10_percent.mean():.6f}, StdDev: {std_dev:.6f}")
     print()
     
     # Verdict
@@ -224,7 +215,7 @@ def test_5_zombie_basin():
     
     return {
         'test': 'Zombie Basin Test',
-        'total_configs': len(results),
+        'total_configs': n_configs,
         'max_D': max_D_in_zombie_region,
         'max_D_config': max_D_config,
         'verdict': verdict,
@@ -276,74 +267,50 @@ def test_2_degenerate_symmetry():
     print()
     
     H, kappa = 0.5, 0.5
-    random.seed(42)  # Reproducibility
-    
-    part_b_results = []
-    false_positives = []
-    
-    for _ in range(1000):
-        phi = random.random()
-        tau = random.random()
-        rho = random.random()
-        
-        structural_base = phi * tau * rho
-        D = calculate_density(phi, tau, rho, H, kappa)
-        
-        part_b_results.append({
-            'phi': phi, 'tau': tau, 'rho': rho,
-            'structural_base': structural_base, 'D': D
-        })
-        
-        # Flag potential false positives: high D with low structure
-        if D > 0.3 and structural_base < 0.1:
-            false_positives.append({
-                'phi': phi, 'tau': tau, 'rho': rho,
-                'structural_base': structural_base, 'D': D
-            })
-    
-    print(f"Total configurations: 1000")
-    print(f"False positives (D > 0.3 with φτρ < 0.1): {len(false_positives)}")
-    
-    if false_positives:
+    n_part_b = 1000
+    space = RandomSpace(n_part_b, seed=42, H=(H, H), kappa=(kappa, kappa))  # Reproducible
+    results = sweep(space, {
+        # Potential false positives: high D (> 0.3) with low structure (< 0.1)
+        'high_D_structure': ClassFractionReducer(thresholds=(0.1,), labels=('low', 'high'),
+                                                 field='structural', where=(0.3, None)),
+        'lowest_structure': TopKReducer(k=5, largest=False, field='structural', where=(0.3, None)),
+        'correlation': CorrelationReducer('structural', 'D'),
+    }, version="v8.1")
+    n_false_positives = results['high_D_structure']['counts']['low']
+    
+    print(f"Total configurations: {n_part_b}")
+    print(f"False positives (D > 0.3 with φτρ < 0.1): {n_false_positives}")
+    
+    if n_false_positives:
         print("\nFalse positive examples:")
-        for fp in false_positives[:5]:
-            print(f"  φ={fp['phi']:.3f}, τ={fp['tau']:.3f}, ρ={fp['rho']:.3f} → base={fp['structural_base']:.4f}, D={fp['D']:.4f}")
+        lowest = results['lowest_structure']
+        examples = lowest['points'][lowest['values'] < 0.1]
+        for point, base, D in zip(examples, lowest['values'], calculate_density.batch(examples)):
+            print(f"  φ={point[0]:.3f}, τ={point[1]:.3f}, ρ={point[2]:.3f} → base={base:.4f}, D={D:.4f}")
     
     print()
     
-    # Check correlation between structural base and D
-    bases = [r['structural_base'] for r in part_b_results]
-    Ds = [r['D'] for r in part_b_results]
-    
-    # Simple correlation
-    mean_base = sum(bases) / len(bases)
-    mean_D = sum(Ds) / len(Ds)
-    
-    numerator = sum((b - mean_base) * (d - mean_D) for b, d in zip(bases, Ds))
-    denom_base = math.sqrt(sum((b - mean_base)**2 for b in bases))
-    denom_D = math.sqrt(sum((d - mean_D)**2 for d in Ds))
-    
-    if denom_base > 0 and denom_D > 0:
-        correlation = numerator / (denom_base * denom_D)
-    else:
+    # Correlation between structural base and D
+    correlation = results['correlation']['correlation']
+    if math.isnan(correlation):
         correlation = 0
     
     print(f"Correlation between structural base and D: {correlation:.4f}")
     print()
     
     # Verdict
-    if len(false_positives) == 0 and correlation > 0.8:
+    if n_false_positives == 0 and correlation > 0.8:
         verdict = "PASS"
         explanation = "No false positives. Strong correlation between structure and D."
-    elif len(false_positives) == 0:
+    elif n_false_positives == 0:
         verdict = "PASS"
         explanation = f"No false positives. Correlation = {correlation:.2f}."
-    elif len(false_positives) < 10:
+    elif n_false_positives < 10:
         verdict = "WARNING"
-        explanation = f"{len(false_positives)} potential false positives found. Investigate."
+        explanation = f"{n_false_positives} potential false positives found. Investigate."
     else:
         verdict = "FAIL"
-        explanation = f"{len(false_positives)} false positives. Formula may have hidden nonlinearities."
+        explanation = f"{n_false_positives} false positives. Formula may have hidden nonlinearities."
     
     print(f"VERDICT: {verdict}")
     print(f"Explanation: {explanation}")
@@ -352,8 +319,8 @@ def test_2_degenerate_symmetry():
     return {
         'test': 'Degenerate Symmetry Test',
         'part_a_samples': len(part_a_results),
-        'part_b_samples': len(part_b_results),
-        'false_positives': len(false_positives),
+        'part_b_samples': n_part_b,
+        'false_positives': n_false_positives,
         'correlation': correlation,
         'verdict': verdict,
         'explanation': explanation
@@ -34,10 +34,13 @@ We document this limitation honestly.
 
 import os
 import json
-import numpy as np
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 # Load environment variables from .env file
 def load_dotenv():
@@ -114,9 +117,10 @@ Your current felt sense: {valence_desc}, with high inertia preventing rapid chan
 
     def calculate_density(self) -> float:
         """Calculate perspectival density using v8.1 formula."""
-        entropy_mod = (1.0 - np.sqrt(self.state["h"])) + (self.state["h"] * self.state["kappa"])
-        entropy_mod = max(0.0, min(1.0, entropy_mod))
-        return self.state["phi"] * self.state["tau"] * self.state["rho"] * entropy_mod
+        return get_formula("v8.1")(
+            self.state["phi"], self.state["tau"], self.state["rho"],
+            self.state["h"], self.state["kappa"]
+        )
     
     def update_state(self, target_valence: float, force: float = 0.5):
         """
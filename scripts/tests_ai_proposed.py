@@ -315,17 +315,17 @@ class AIProposedTests:
         # Analyze where each trajectory ends up
         print("Blind Trajectory Generation:\n")
 
-        for name, data in trajectories.items():
+        # Query database once for what every final state is geometrically closest to
+        final_neighbors = self.db.query_batch(
+            [data['trajectory'][-1]['vector'] for data in trajectories.values()],
+            n_results=1
+        )
+        closest = {name: str(n) for name, n in zip(trajectories, final_neighbors.names[:, 0])}
+
+        for i, (name, data) in enumerate(trajectories.items()):
             final_state = data['trajectory'][-1]
-
-            # Query database to find what this is geometrically closest to
-            neighbors = self.db.query_vector(
-                final_state['vector'],
-                n_results=1
-            )
-
-            closest_state = neighbors[0]['name']
-            distance = neighbors[0]['distance']
+            closest_state = closest[name]
+            distance = final_neighbors.distances[i, 0]
 
             print(f"{name}:")
             print(f"  Operator: {data['operator']}")
@@ -339,22 +339,14 @@ class AIProposedTests:
         print_subheader("Analysis")
         print("\nChatGPT's Question: Do blind transformations match human phenomenology?\n")
 
-        fracture_result = trajectories['fracture_integration']['trajectory'][-1]
-        binding_result = trajectories['collapse_binding']['trajectory'][-1]
-        noise_result = trajectories['inject_noise']['trajectory'][-1]
-
-        frac_neighbors = self.db.query_vector(fracture_result['vector'], n_results=1)
-        bind_neighbors = self.db.query_vector(binding_result['vector'], n_results=1)
-        noise_neighbors = self.db.query_vector(noise_result['vector'], n_results=1)
-
         print("Results:")
-        print(f"  1. Fracturing Integration → {frac_neighbors[0]['name']}")
+        print(f"  1. Fracturing Integration → {closest['fracture_integration']}")
         print(f"     (Expected: Dissociation, Dementia)")
         print()
-        print(f"  2. Collapsing Binding → {bind_neighbors[0]['name']}")
+        print(f"  2. Collapsing Binding → {closest['collapse_binding']}")
         print(f"     (Expected: Anesthesia, Deep Sleep)")
         print()
-        print(f"  3. Injecting Entropy → {noise_neighbors[0]['name']}")
+        print(f"  3. Injecting Entropy → {closest['inject_noise']}")
         print(f"     (Expected: Panic, Confusion)")
         print()
 
@@ -369,12 +361,7 @@ class AIProposedTests:
         total = len(expected_mappings)
 
         for traj_name, expected_list in expected_mappings.items():
-            if traj_name == 'fracture_integration':
-                actual = frac_neighbors[0]['name']
-            elif traj_name == 'collapse_binding':
-                actual = bind_neighbors[0]['name']
-            else:
-                actual = noise_neighbors[0]['name']
+            actual = closest[traj_name]
 
             if any(exp in actual for exp in expected_list):
                 matches += 1
@@ -393,7 +380,7 @@ class AIProposedTests:
             'trajectories': {
                 k: {
                     'final_density': v['trajectory'][-1]['density'],
-                    'closest_state': self.db.query_vector(v['trajectory'][-1]['vector'], n_results=1)[0]['name']
+                    'closest_state': closest[k]
                 }
                 for k, v in trajectories.items()
             },
@@ -26,6 +26,10 @@ import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
 
 # Configuration
 RWKV_SERVER_URL = os.environ.get('RWKV_SERVER_URL', 'https://unlabouring-marcel-reclosable.ngrok-free.dev')
@@ -42,12 +46,8 @@ HEADERS = {
 # CORE FORMULA (v8.1)
 # ==============================================================================
 
-def density_v81(phi: float, tau: float, rho: float, H: float, kappa: float) -> float:
-    """Conduit Monism v8.1 density formula."""
-    structural = phi * tau * rho
-    entropy_impact = (1 - np.sqrt(H)) + (H * kappa)
-    entropy_impact = max(0.0, min(1.0, entropy_impact))
-    return structural * entropy_impact
+# Conduit Monism v8.1 density formula (gate clamped to [0, 1])
+density_v81 = get_formula("v8.1")
 
 
 # ==============================================================================
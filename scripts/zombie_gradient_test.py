@@ -17,12 +17,14 @@ Counter-Hypothesis (Claude): Curve will be LINEAR (D = C × ρ).
 import numpy as np
 import json
 from datetime import datetime
+import sys
+from pathlib import Path
 
-def calc_density_v8_1(phi, tau, rho, h, k):
-    """The Coherence-Gated Entropy Model (v8.1)"""
-    entropy_impact = (1.0 - np.sqrt(h)) + (h * k)
-    modulator = max(0.0, min(1.0, entropy_impact))
-    return phi * tau * rho * modulator
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.density_models import get_formula
+
+# The Coherence-Gated Entropy Model (v8.1)
+calc_density_v8_1 = get_formula("v8.1")
 
 def run_zombie_gradient():
     """
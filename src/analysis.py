@@ -7,11 +7,25 @@ Tests the core claims of Conduit Monism v7.0:
 - Multiplicative vs additive relationships
 - Asymptotic thresholds
 - Perspectival density gradients
+
+Updated:
+- Added streaming chunked parameter sweeps with online reducers
+- Added multi-process sweeps (merged reducer states, shared-memory D buffer)
+- Added adaptive refinement of D-threshold boundaries
+- analyze_liminal_states covers every seeded state with a density
+  (previously only the 20 nearest to the midpoint)
 """
 
+import copy
+from abc import ABC, abstractmethod
+import math
+import os
+from multiprocessing import get_context, shared_memory
+
 import numpy as np
-from typing import List, Tuple, Dict
-from .encoder import encode, compute_density
+from typing import Iterable, List, Optional, Tuple, Dict
+from .encoder import encode, encode_legacy, compute_density
+from .density_models import INVARIANTS, STRUCTURAL_INVARIANTS, get_formula, solve_invariant, validate_batch
 
 
 def perspectival_density_multiplicative(phi: float, tau: float, rho: float) -> float:
@@ -76,7 +90,10 @@ def analyze_asymptotic_behavior(
 
 def find_critical_threshold(
     epsilon: float = 0.01,
-    fixed_high: float = 0.9
+    fixed_high: float = 0.9,
+    version: str = "v7",
+    H: float = 0.0,
+    kappa: float = 0.0
 ) -> Dict[str, float]:
     """
     Find the critical threshold where perspective becomes "meaningless".
@@ -91,24 +108,26 @@ def find_critical_threshold(
         The threshold for "meaningless" density (e.g., 0.01 = 1%)
     fixed_high : float
         The value held constant for the other two variables
+    version : str
+        Registered formula version (default 'v7', the φ × τ × ρ product)
+    H, kappa : float
+        Entropy and coherence, for formulas with an entropy gate
 
     Returns:
     --------
-    Dict with critical thresholds for each variable
+    Dict with critical thresholds for each variable (NaN if even 1.0 stays
+    below epsilon)
     """
     thresholds = {}
 
-    # Find where φ × 0.9 × 0.9 < epsilon
-    phi_critical = epsilon / (fixed_high * fixed_high)
-    thresholds['phi_critical'] = phi_critical
-
-    # Find where 0.9 × τ × 0.9 < epsilon
-    tau_critical = epsilon / (fixed_high * fixed_high)
-    thresholds['tau_critical'] = tau_critical
-
-    # Find where 0.9 × 0.9 × ρ < epsilon
-    rho_critical = epsilon / (fixed_high * fixed_high)
-    thresholds['rho_critical'] = rho_critical
+    # Solve D(x, fixed_high, fixed_high, H, κ) = epsilon for each
+    # structural variable in turn
+    for name in STRUCTURAL_INVARIANTS:
+        others = {other: fixed_high for other in STRUCTURAL_INVARIANTS if other != name}
+        thresholds[f'{name}_critical'] = solve_invariant(
+            epsilon, name, H=H, kappa=kappa, version=version, **others
+        )
+    phi_critical = thresholds['phi_critical']
 
     thresholds['epsilon'] = epsilon
     thresholds['interpretation'] = (
@@ -196,29 +215,26 @@ def gradient_comparison(variable: str = 'phi') -> Dict[str, np.ndarray]:
 
     Returns:
     --------
-    Dict with comparison data
+    Dict with comparison data, including the analytic slope ∂D/∂variable
     """
+    if variable not in STRUCTURAL_INVARIANTS:
+        raise ValueError(f"Unknown variable: {variable}")
+
     resolution = 100
     var_range = np.linspace(0.0, 1.0, resolution)
 
-    densities = []
-
-    for val in var_range:
-        if variable == 'phi':
-            density = perspectival_density_multiplicative(val, 0.9, 0.9)
-        elif variable == 'tau':
-            density = perspectival_density_multiplicative(0.9, val, 0.9)
-        elif variable == 'rho':
-            density = perspectival_density_multiplicative(0.9, 0.9, val)
-        else:
-            raise ValueError(f"Unknown variable: {variable}")
-
-        densities.append(density)
+    # Multiplicative (v7) product with the other two held at 0.9
+    states = np.full((resolution, 5), 0.9)
+    states[:, 3:] = 0.0
+    column = INVARIANTS.index(variable)
+    states[:, column] = var_range
+    formula = get_formula("v7")
 
     return {
         'variable': variable,
         'range': var_range,
-        'densities': np.array(densities)
+        'densities': formula.batch(states),
+        'slopes': formula.gradient(states)[:, column]
     }
 
 
@@ -235,26 +251,28 @@ def analyze_liminal_states(db) -> Dict[str, any]:
     --------
     Analysis of liminal state densities and their relationships
     """
-    # Query all states by fetching from a mid-point
-    neighbors = db.find_neighbors(0.5, 0.5, 0.5, 0.5, n_results=20)
+    # Every state with a density, densest first
+    selected = db.select(where={'density': {'$gte': 0.0}}, order_by='density', descending=True)
+
+    # Squared L2 from the midpoint query the vector store was searched with.
+    # Stored vectors are [φ, τ, ρ, H, κ (0 for legacy states), 0], so they
+    # can be rebuilt from metadata
+    midpoint = np.asarray(encode_legacy(0.5, 0.5, 0.5, 0.5))
 
-    # Compute density for each
     state_analysis = []
-    for neighbor in neighbors:
-        meta = neighbor['metadata']
-        if 'density' in meta:
-            state_analysis.append({
-                'name': neighbor['name'],
-                'phi': meta.get('phi', 0),
-                'tau': meta.get('tau', 0),
-                'rho': meta.get('rho', 0),
-                'entropy': meta.get('entropy', 0),
-                'density': meta['density'],
-                'distance_from_midpoint': neighbor['distance']
-            })
-
-    # Sort by density
-    state_analysis.sort(key=lambda x: x['density'], reverse=True)
+    for meta in selected['metadatas']:
+        vector = np.zeros_like(midpoint)
+        for i, key in enumerate(('phi', 'tau', 'rho', 'entropy', 'kappa')):
+            vector[i] = meta.get(key, 0)
+        state_analysis.append({
+            'name': meta['name'],
+            'phi': meta.get('phi', 0),
+            'tau': meta.get('tau', 0),
+            'rho': meta.get('rho', 0),
+            'entropy': meta.get('entropy', 0),
+            'density': meta['density'],
+            'distance_from_midpoint': float(np.sum((vector - midpoint) ** 2))
+        })
 
     return {
         'states': state_analysis,
@@ -265,3 +283,939 @@ def analyze_liminal_states(db) -> Dict[str, any]:
             state_analysis[0]['density']
         ) if state_analysis else (0, 0)
     }
+
+
+# =============================================================================
+# Streaming Parameter Sweeps
+# =============================================================================
+#
+# A sweep evaluates a density formula over a parameter space in fixed-size
+# chunks and feeds each chunk to online reducers, so memory use depends on
+# the chunk size and never on the number of points swept.
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# Quantities a reducer can aggregate: the density, any invariant, or the
+# structural product φ×τ×ρ
+SWEEP_FIELDS = ("D",) + INVARIANTS + ("structural",)
+
+# RandomSpace rows per random stream; fixed so samples do not depend on
+# the chunk size
+RANDOM_BLOCK_SIZE = 4096
+
+
+class GridSpace:
+    """
+    Cartesian grid over (φ, τ, ρ, H, κ).
+
+    Each axis is a scalar (held fixed) or a 1-D array of values. Points are
+    enumerated in C order (κ varies fastest), matching nested loops over
+    φ, τ, ρ, H, κ. Points are generated per chunk, never materialized.
+    """
+
+    def __init__(self, phi=0.5, tau=0.5, rho=0.5, H=0.5, kappa=0.5):
+        self.axes = tuple(
+            np.atleast_1d(np.asarray(axis, dtype=np.float64))
+            for axis in (phi, tau, rho, H, kappa)
+        )
+        for name, axis in zip(INVARIANTS, self.axes):
+            if axis.ndim != 1 or axis.size == 0:
+                raise ValueError(f"{name} axis must be a scalar or non-empty 1-D array")
+        validate_batch(self.axes)
+        self.shape = tuple(axis.size for axis in self.axes)
+        # Number of consecutive points over which each axis value is held
+        self._strides = tuple(int(np.prod(self.shape[i + 1:], dtype=np.int64)) for i in range(5))
+
+    @classmethod
+    def uniform(cls, resolution: int, low: float = 0.0, high: float = 1.0, **fixed) -> "GridSpace":
+        """
+        Grid with `resolution` evenly spaced values per axis in [low, high].
+
+        Keyword arguments override individual axes (e.g., kappa=0.5).
+        """
+        axes = {name: np.linspace(low, high, resolution) for name in INVARIANTS}
+        axes.update(fixed)
+        return cls(**axes)
+
+    def __len__(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def points(self, start: int, stop: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows [start, stop) of the flattened grid as an (n, 5) array."""
+        if out is None:
+            out = np.empty((stop - start, 5), dtype=np.float64)
+        for i, (axis, stride) in enumerate(zip(self.axes, self._strides)):
+            if stride == 1:
+                out[:, i] = axis[np.arange(start, stop, dtype=np.int64) % axis.size]
+                continue
+            # Outer axes are constant over runs of `stride` points: expand
+            # the few values touched by this chunk instead of unravelling
+            # every flat index
+            first, last = start // stride, (stop - 1) // stride
+            runs = np.full(last - first + 1, stride, dtype=np.int64)
+            runs[0] -= start - first * stride
+            runs[-1] -= (last + 1) * stride - stop
+            out[:, i] = np.repeat(axis[np.arange(first, last + 1, dtype=np.int64) % axis.size], runs)
+        return out
+
+
+class RandomSpace:
+    """
+    Uniform random samples over per-invariant [low, high] bounds.
+
+    Rows are drawn in blocks of RANDOM_BLOCK_SIZE, each from its own stream
+    seeded by (seed, block index), so row i is the same point whatever the
+    chunk size or the order in which chunks are generated.
+    """
+
+    def __init__(self, n: int, seed: int = 0, **bounds: Tuple[float, float]):
+        unknown = set(bounds) - set(INVARIANTS)
+        if unknown:
+            raise ValueError(f"Unknown invariants: {sorted(unknown)}")
+        self.n = int(n)
+        self.seed = seed
+        self.low = np.array([bounds.get(name, (0.0, 1.0))[0] for name in INVARIANTS], dtype=np.float64)
+        self.high = np.array([bounds.get(name, (0.0, 1.0))[1] for name in INVARIANTS], dtype=np.float64)
+        validate_batch((self.low, self.high))
+        if np.any(self.low > self.high):
+            raise ValueError("Each bound must satisfy low <= high")
+
+    def __len__(self) -> int:
+        return self.n
+
+    def points(self, start: int, stop: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Samples [start, stop) as an (n, 5) array."""
+        if out is None:
+            out = np.empty((stop - start, 5), dtype=np.float64)
+        row = start
+        while row < stop:
+            block, offset = divmod(row, RANDOM_BLOCK_SIZE)
+            end = min(stop, (block + 1) * RANDOM_BLOCK_SIZE)
+            bit_generator = np.random.PCG64(np.random.SeedSequence(self.seed, spawn_key=(block,)))
+            # One 64-bit draw per double: skip the block's earlier rows
+            bit_generator.advance(offset * 5)
+            np.random.Generator(bit_generator).random(out=out[row - start:end - start])
+            row = end
+        out *= self.high - self.low
+        out += self.low
+        return out
+
+
+def _field_values(field: str, D: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Extract one SWEEP_FIELDS quantity for a chunk."""
+    if field == "D":
+        return D
+    if field == "structural":
+        return points[:, 0] * points[:, 1] * points[:, 2]
+    return points[:, INVARIANTS.index(field)]
+
+
+class Reducer(ABC):
+    """
+    Base class for online sweep reducers.
+
+    Subclasses implement reset() to initialize their accumulators, update()
+    for one chunk, merge() to combine the state of a reducer that saw a
+    disjoint set of chunks, and result().
+
+    Parameters:
+    -----------
+    field : str
+        Quantity to aggregate (one of SWEEP_FIELDS, default 'D')
+    where : (lo, hi), optional
+        Only aggregate points with lo < D < hi; either bound may be None
+    """
+
+    def __init__(self, field: str = "D", where: Optional[Tuple[Optional[float], Optional[float]]] = None):
+        if field not in SWEEP_FIELDS:
+            raise ValueError(f"Unknown field '{field}'. Available: {', '.join(SWEEP_FIELDS)}")
+        self.field = field
+        self.where = where
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Initialize the accumulators."""
+
+    def spawn(self) -> "Reducer":
+        """Empty reducer with the same configuration (for partial sweeps)."""
+        clone = copy.copy(self)
+        clone.reset()
+        return clone
+
+    def _select(self, D: np.ndarray, points: np.ndarray, offset: int):
+        """Return (values, flat indices or None, points) after the D window."""
+        values = _field_values(self.field, D, points)
+        if self.where is None:
+            return values, None, points
+        lo, hi = self.where
+        mask = np.ones(D.shape, dtype=bool)
+        if lo is not None:
+            mask &= D > lo
+        if hi is not None:
+            mask &= D < hi
+        index = np.flatnonzero(mask)
+        return values[index], index + offset, points[index]
+
+    @abstractmethod
+    def update(self, D: np.ndarray, points: np.ndarray, offset: int) -> None:
+        """Fold in one chunk: D values and points, starting at flat index offset."""
+
+    @abstractmethod
+    def merge(self, other: "Reducer") -> None:
+        """Fold in the state of a reducer that saw a disjoint set of chunks."""
+
+    @abstractmethod
+    def result(self) -> Dict:
+        """Aggregate of everything seen so far."""
+
+
+class HistogramReducer(Reducer):
+    """Fixed-bin histogram (np.histogram semantics; out-of-range values are counted separately)."""
+
+    def __init__(self, bins, field: str = "D", where=None):
+        super().__init__(field, where)
+        self.edges = np.asarray(bins, dtype=np.float64)
+        if self.edges.ndim != 1 or self.edges.size < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("bins must be a strictly increasing sequence of at least two edges")
+        self.reset()
+
+    def reset(self):
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+        self.outside = 0
+
+    def update(self, D, points, offset):
+        values, _, _ = self._select(D, points, offset)
+        counts, _ = np.histogram(values, bins=self.edges)
+        self.counts += counts
+        self.outside += values.size - int(counts.sum())
+
+    def merge(self, other):
+        self.counts += other.counts
+        self.outside += other.outside
+
+    def result(self):
+        return {'edges': self.edges, 'counts': self.counts.copy(), 'outside': self.outside}
+
+
+class MomentsReducer(Reducer):
+    """Running count, mean and variance (Chan et al. pairwise update)."""
+
+    def __init__(self, field: str = "D", where=None):
+        super().__init__(field, where)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _combine(self, count, mean, m2):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def update(self, D, points, offset):
+        values, _, _ = self._select(D, points, offset)
+        if values.size:
+            mean = float(values.mean())
+            self._combine(values.size, mean, float(np.sum((values - mean) ** 2)))
+
+    def merge(self, other):
+        self._combine(other.count, other.mean, other.m2)
+
+    def result(self):
+        if self.count == 0:
+            return {'count': 0, 'mean': float('nan'), 'var': float('nan'), 'std': float('nan')}
+        var = self.m2 / self.count
+        return {'count': self.count, 'mean': self.mean, 'var': var, 'std': math.sqrt(var)}
+
+
+class CorrelationReducer(Reducer):
+    """Running Pearson correlation of two fields (pairwise co-moment update)."""
+
+    def __init__(self, x: str = "structural", y: str = "D", where=None):
+        super().__init__(y, where)
+        if x not in SWEEP_FIELDS:
+            raise ValueError(f"Unknown field '{x}'. Available: {', '.join(SWEEP_FIELDS)}")
+        self.x = x
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def _combine(self, count, mean_x, mean_y, m2_x, m2_y, c_xy):
+        if count == 0:
+            return
+        total = self.count + count
+        dx = mean_x - self.mean_x
+        dy = mean_y - self.mean_y
+        weight = self.count * count / total
+        self.m2_x += m2_x + dx * dx * weight
+        self.m2_y += m2_y + dy * dy * weight
+        self.c_xy += c_xy + dx * dy * weight
+        self.mean_x += dx * count / total
+        self.mean_y += dy * count / total
+        self.count = total
+
+    def update(self, D, points, offset):
+        y, index, selected = self._select(D, points, offset)
+        if y.size == 0:
+            return
+        x = _field_values(self.x, D if index is None else D[index - offset], selected)
+        mean_x, mean_y = float(x.mean()), float(y.mean())
+        dx, dy = x - mean_x, y - mean_y
+        self._combine(y.size, mean_x, mean_y, float(dx @ dx), float(dy @ dy), float(dx @ dy))
+
+    def merge(self, other):
+        self._combine(other.count, other.mean_x, other.mean_y, other.m2_x, other.m2_y, other.c_xy)
+
+    def result(self):
+        denominator = math.sqrt(self.m2_x * self.m2_y)
+        return {
+            'count': self.count,
+            'correlation': self.c_xy / denominator if denominator > 0 else float('nan'),
+            'covariance': self.c_xy / self.count if self.count else float('nan'),
+        }
+
+
+class ExtremaReducer(Reducer):
+    """Minimum and maximum with the flat index and point where each occurs."""
+
+    def __init__(self, field: str = "D", where=None):
+        super().__init__(field, where)
+        self.reset()
+
+    def reset(self):
+        self.min = (math.inf, -1, None)
+        self.max = (-math.inf, -1, None)
+
+    def update(self, D, points, offset):
+        values, index, selected = self._select(D, points, offset)
+        if values.size == 0:
+            return
+        for row in (int(np.argmin(values)), int(np.argmax(values))):
+            flat = offset + row if index is None else int(index[row])
+            self._offer(float(values[row]), flat, selected[row].copy())
+
+    def _offer(self, value, index, point):
+        # Ties keep the earliest index so results do not depend on chunking
+        if value < self.min[0] or (value == self.min[0] and index < self.min[1]):
+            self.min = (value, index, point)
+        if value > self.max[0] or (value == self.max[0] and index < self.max[1]):
+            self.max = (value, index, point)
+
+    def merge(self, other):
+        for value, index, point in (other.min, other.max):
+            if point is not None:
+                self._offer(value, index, point)
+
+    def result(self):
+        return {
+            'min': self.min[0], 'argmin': self.min[1], 'min_point': self.min[2],
+            'max': self.max[0], 'argmax': self.max[1], 'max_point': self.max[2],
+        }
+
+
+class ClassFractionReducer(Reducer):
+    """
+    Count points per class delimited by thresholds.
+
+    Class i holds values between thresholds[i-1] and thresholds[i]. A value
+    equal to a threshold goes to the class above it unless that threshold's
+    entry in `ties` is 'below'. With ties=('above', 'below'), the default
+    (0.1, 0.3) gives the framework's classes: unconscious D < 0.1, liminal
+    0.1 <= D <= 0.3, conscious D > 0.3.
+    """
+
+    def __init__(self, thresholds=(0.1, 0.3), labels: Optional[Tuple[str, ...]] = None,
+                 ties: Optional[Tuple[str, ...]] = None, field: str = "D", where=None):
+        super().__init__(field, where)
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        if np.any(np.diff(self.thresholds) <= 0):
+            raise ValueError("thresholds must be strictly increasing")
+        self.ties = ("above",) * self.thresholds.size if ties is None else tuple(ties)
+        if len(self.ties) != self.thresholds.size or not set(self.ties) <= {"above", "below"}:
+            raise ValueError(f"ties needs one of 'above'/'below' per threshold, got {ties!r}")
+        if labels is None:
+            labels = ("unconscious", "liminal", "conscious") if self.thresholds.size == 2 else \
+                tuple(f"class_{i}" for i in range(self.thresholds.size + 1))
+        if len(labels) != self.thresholds.size + 1:
+            raise ValueError(f"Need {self.thresholds.size + 1} labels, got {len(labels)}")
+        self.labels = tuple(labels)
+        self.reset()
+
+    def reset(self):
+        self.counts = np.zeros(len(self.labels), dtype=np.int64)
+
+    def update(self, D, points, offset):
+        values, _, _ = self._select(D, points, offset)
+        classes = np.zeros(values.size, dtype=np.intp)
+        for threshold, tie in zip(self.thresholds, self.ties):
+            classes += (values > threshold) if tie == "below" else (values >= threshold)
+        self.counts += np.bincount(classes, minlength=self.counts.size)
+
+    def merge(self, other):
+        self.counts += other.counts
+
+    def result(self):
+        total = int(self.counts.sum())
+        return {
+            'total': total,
+            'counts': dict(zip(self.labels, self.counts.tolist())),
+            'fractions': {
+                label: (count / total if total else float('nan'))
+                for label, count in zip(self.labels, self.counts.tolist())
+            },
+        }
+
+
+class QuantileReducer(Reducer):
+    """
+    Streaming quantiles with bounded relative error.
+
+    Values are counted in logarithmically spaced buckets (as in DDSketch):
+    every reported quantile is within `relative_accuracy` of a true sample
+    value at that rank. Magnitudes below `min_value` are treated as zero.
+    Memory is fixed by the accuracy and value range, not the sample count.
+    """
+
+    def __init__(self, quantiles=(0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99),
+                 relative_accuracy: float = 1e-4, min_value: float = 1e-12, max_value: float = 1e3,
+                 field: str = "D", where=None):
+        super().__init__(field, where)
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.quantiles = tuple(float(q) for q in quantiles)
+        if any(not 0.0 <= q <= 1.0 for q in self.quantiles):
+            raise ValueError("quantiles must be in [0, 1]")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._offset = math.floor(math.log(min_value) / self._log_gamma)
+        self._n_buckets = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self.reset()
+
+    def reset(self):
+        self.positive = np.zeros(self._n_buckets, dtype=np.int64)
+        self.negative = np.zeros(self._n_buckets, dtype=np.int64)
+        self.zeros = 0
+
+    def __getstate__(self):
+        # Bucket arrays are large and sparse; pickle only occupied buckets
+        # so shipping reducers to and from worker processes stays cheap
+        state = self.__dict__.copy()
+        for name in ("positive", "negative"):
+            occupied = np.flatnonzero(state[name])
+            state[name] = (occupied, state[name][occupied])
+        return state
+
+    def __setstate__(self, state):
+        for name in ("positive", "negative"):
+            occupied, counts = state[name]
+            dense = np.zeros(state["_n_buckets"], dtype=np.int64)
+            dense[occupied] = counts
+            state[name] = dense
+        self.__dict__.update(state)
+
+    def _bucket(self, magnitude: np.ndarray) -> np.ndarray:
+        index = np.ceil(np.log(magnitude) / self._log_gamma).astype(np.int64) - self._offset
+        return np.clip(index, 0, self.positive.size - 1)
+
+    def update(self, D, points, offset):
+        values, _, _ = self._select(D, points, offset)
+        big = np.abs(values) >= self.min_value
+        self.zeros += int(values.size - big.sum())
+        pos = values[big & (values > 0)]
+        neg = values[big & (values < 0)]
+        if pos.size:
+            self.positive += np.bincount(self._bucket(pos), minlength=self.positive.size)
+        if neg.size:
+            self.negative += np.bincount(self._bucket(-neg), minlength=self.negative.size)
+
+    def merge(self, other):
+        self.positive += other.positive
+        self.negative += other.negative
+        self.zeros += other.zeros
+
+    def _bucket_value(self, index: np.ndarray) -> np.ndarray:
+        # Midpoint (in relative terms) of bucket (gamma^(i-1), gamma^i]
+        return 2 * self._gamma ** (index + self._offset) / (self._gamma + 1)
+
+    def result(self):
+        # Sorted bucket representatives from most negative to most positive
+        neg_idx = np.flatnonzero(self.negative)[::-1]
+        pos_idx = np.flatnonzero(self.positive)
+        values = np.concatenate([-self._bucket_value(neg_idx), [0.0], self._bucket_value(pos_idx)])
+        counts = np.concatenate([self.negative[neg_idx], [self.zeros], self.positive[pos_idx]])
+        cumulative = np.cumsum(counts)
+        total = int(cumulative[-1]) if cumulative.size else 0
+        if total == 0:
+            return {'count': 0, 'quantiles': {q: float('nan') for q in self.quantiles}}
+        ranks = np.array([q * (total - 1) for q in self.quantiles])
+        positions = np.searchsorted(cumulative, ranks, side='right')
+        return {
+            'count': total,
+            'quantiles': {q: float(values[p]) for q, p in zip(self.quantiles, positions)},
+        }
+
+
+class TopKReducer(Reducer):
+    """The k largest (or smallest) values with their flat indices and points."""
+
+    def __init__(self, k: int = 10, largest: bool = True, field: str = "D", where=None):
+        super().__init__(field, where)
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        self.k = k
+        self.largest = largest
+        self.reset()
+
+    def reset(self):
+        self.values = np.empty(0, dtype=np.float64)
+        self.index = np.empty(0, dtype=np.int64)
+        self.points = np.empty((0, 5), dtype=np.float64)
+
+    def _keep(self, values, index, points):
+        values = np.concatenate([self.values, values])
+        index = np.concatenate([self.index, index])
+        points = np.concatenate([self.points, points])
+        # Sort by value (descending if largest), then by index so ties are stable
+        order = np.lexsort((index, -values if self.largest else values))[:self.k]
+        self.values, self.index, self.points = values[order], index[order], points[order]
+
+    def update(self, D, points, offset):
+        values, index, selected = self._select(D, points, offset)
+        if values.size == 0:
+            return
+        if index is None:
+            index = np.arange(offset, offset + values.size, dtype=np.int64)
+        if values.size > self.k:
+            keep = np.argpartition(-values if self.largest else values, self.k - 1)[:self.k]
+            values, index, selected = values[keep], index[keep], selected[keep]
+        self._keep(values, index, selected.copy())
+
+    def merge(self, other):
+        self._keep(other.values, other.index, other.points)
+
+    def result(self):
+        return {'values': self.values.copy(), 'index': self.index.copy(), 'points': self.points.copy()}
+
+
+def _sweep_range(space, reducers, formula, start, stop, chunk_size, density_out=None):
+    """Evaluate points [start, stop) chunk by chunk, feeding the reducers."""
+    size = min(chunk_size, stop - start)
+    points_buf = np.empty((size, 5), dtype=np.float64)
+    density_buf = np.empty(size, dtype=np.float64) if density_out is None else None
+
+    for lo in range(start, stop, chunk_size):
+        hi = min(lo + chunk_size, stop)
+        m = hi - lo
+        points = space.points(lo, hi, out=points_buf[:m])
+        out = density_buf[:m] if density_out is None else density_out[lo:hi]
+        D = formula.batch(points, out=out, validate=False)
+        for reducer in reducers.values():
+            reducer.update(D, points, lo)
+
+
+def sweep(
+    space,
+    reducers: Dict[str, Reducer],
+    version: str = "v9.2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[str, any]:
+    """
+    Evaluate a density formula over a parameter space with online reductions.
+
+    Parameters:
+    -----------
+    space : GridSpace or RandomSpace
+        Anything with __len__ and points(start, stop, out)
+    reducers : Dict[str, Reducer]
+        Named reducers; each sees every chunk in order
+    version : str
+        Registered formula version (default 'v9.2')
+    chunk_size : int
+        Points evaluated per chunk; bounds peak memory
+
+    Returns:
+    --------
+    Dict with 'n_points', 'version' and each reducer's result by name
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    formula = get_formula(version)
+    n = len(space)
+    _sweep_range(space, reducers, formula, 0, n, chunk_size)
+
+    results = {name: reducer.result() for name, reducer in reducers.items()}
+    results['n_points'] = n
+    results['version'] = formula.version
+    return results
+
+
+# =============================================================================
+# Parallel Sweeps
+# =============================================================================
+#
+# The space is cut into tasks of `task_chunks` consecutive chunks. Task
+# boundaries depend only on the space size and chunk settings, never on the
+# worker count, and partial results are merged in task order, so any number
+# of workers (including one) produces identical results. RandomSpace draws
+# each row from a stream keyed by its fixed-size block, so random sweeps are
+# reproducible in the same way, for any chunk size too.
+
+DEFAULT_TASK_CHUNKS = 16
+
+
+def _task_bounds(n: int, chunk_size: int, task_chunks: int) -> List[Tuple[int, int]]:
+    if chunk_size < 1 or task_chunks < 1:
+        raise ValueError("chunk_size and task_chunks must be >= 1")
+    task_size = chunk_size * task_chunks
+    return [(start, min(start + task_size, n)) for start in range(0, n, task_size)]
+
+
+def _sweep_task(args):
+    """Worker: reduce one task with fresh reducers and return their state."""
+    space, templates, version, start, stop, chunk_size = args
+    reducers = {name: template.spawn() for name, template in templates.items()}
+    _sweep_range(space, reducers, get_formula(version), start, stop, chunk_size)
+    return reducers
+
+
+def _evaluate_task(args):
+    """Worker: write D for one task into the shared result buffer."""
+    space, version, start, stop, chunk_size, shm_name, n = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        D = np.ndarray((n,), dtype=np.float64, buffer=shm.buf)
+        _sweep_range(space, {}, get_formula(version), start, stop, chunk_size, density_out=D)
+        del D
+    finally:
+        shm.close()
+    return stop - start
+
+
+def _run_tasks(worker, payloads: Iterable, n_tasks: int, workers: Optional[int]):
+    """
+    Yield worker(payload) results in payload order, in-process or from a pool.
+
+    `payloads` may be a generator of n_tasks payloads; it is consumed as
+    tasks are dispatched.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    workers = min(workers, n_tasks)
+    if workers <= 1:
+        for payload in payloads:
+            yield worker(payload)
+        return
+    with get_context().Pool(workers) as pool:
+        # imap keeps task order and lets finished tasks be merged (and
+        # freed) while later ones are still running
+        yield from pool.imap(worker, payloads, chunksize=1)
+
+
+def parallel_sweep(
+    space,
+    reducers: Dict[str, Reducer],
+    version: str = "v9.2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    task_chunks: int = DEFAULT_TASK_CHUNKS
+) -> Dict[str, any]:
+    """
+    sweep() spread over a process pool.
+
+    Each task reduces its share of the space into empty copies of the
+    reducers, spawned inside the task from one set of empty templates, so
+    the parent holds a single partial state at a time; the partial states
+    are merged into `reducers` in task order.
+
+    Parameters:
+    -----------
+    space, reducers, version, chunk_size :
+        As for sweep()
+    workers : int, optional
+        Worker processes (default: all cores); 1 runs in-process
+    task_chunks : int
+        Chunks per task (the unit of work handed to a worker)
+
+    Returns:
+    --------
+    Dict with 'n_points', 'version', 'n_tasks' and each reducer's result
+    """
+    formula = get_formula(version)
+    n = len(space)
+    bounds = _task_bounds(n, chunk_size, task_chunks)
+    templates = {name: r.spawn() for name, r in reducers.items()}
+    payloads = (
+        (space, templates, formula.version, start, stop, chunk_size)
+        for start, stop in bounds
+    )
+
+    for partial in _run_tasks(_sweep_task, payloads, len(bounds), workers):
+        for name, reducer in reducers.items():
+            reducer.merge(partial[name])
+
+    results = {name: reducer.result() for name, reducer in reducers.items()}
+    results['n_points'] = n
+    results['version'] = formula.version
+    results['n_tasks'] = len(bounds)
+    return results
+
+
+def parallel_evaluate(
+    space,
+    version: str = "v9.2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    task_chunks: int = DEFAULT_TASK_CHUNKS
+) -> np.ndarray:
+    """
+    Evaluate D at every point of a space using a process pool.
+
+    Workers write their slices straight into one shared-memory buffer, so
+    no per-point results are pickled. Unlike sweep(), memory grows with the
+    space (8 bytes per point); use it when every D value is needed.
+
+    Returns:
+    --------
+    np.ndarray of shape (len(space),), in the space's point order
+    """
+    formula = get_formula(version)
+    n = len(space)
+    bounds = _task_bounds(n, chunk_size, task_chunks)
+    shm = shared_memory.SharedMemory(create=True, size=max(n, 1) * 8)
+    try:
+        payloads = (
+            (space, formula.version, start, stop, chunk_size, shm.name, n)
+            for start, stop in bounds
+        )
+        for _ in _run_tasks(_evaluate_task, payloads, len(bounds), workers):
+            pass
+        return np.ndarray((n,), dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# =============================================================================
+# Adaptive Threshold Boundaries
+# =============================================================================
+#
+# Cells of a coarse grid are subdivided (2^d children in d free dimensions)
+# only when their corner D values straddle a threshold. A refined cell is
+# evaluated on its 3^d sub-lattice, so corners shared by its children are
+# computed once and the parent's corners are reused. Refinement is
+# depth-first over bounded batches, so memory does not grow with the number
+# of cells visited. Cells whose corners all lie on one side are assumed not
+# to contain the boundary; D is smooth on [0, 1]^5, so this holds once the
+# base grid resolves its curvature.
+
+DEFAULT_THRESHOLDS = (0.01, 0.05, 0.1, 0.3)
+_REFINE_BATCH_CELLS = 4096
+
+
+def _corner_offsets(d: int) -> np.ndarray:
+    """(2^d, d) 0/1 offsets of a unit cube's corners; bit k of row i is axis k."""
+    return (np.arange(2 ** d)[:, None] >> np.arange(d)) & 1
+
+
+def refine_threshold_boundary(
+    thresholds: Iterable[float] = DEFAULT_THRESHOLDS,
+    version: str = "v9.2",
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    base_resolution: int = 4,
+    max_depth: int = 2,
+    return_points: bool = True
+) -> Dict[str, any]:
+    """
+    Locate D = threshold boundaries by adaptive (octree-style) refinement.
+
+    Equivalent to a dense grid with base_resolution * 2^max_depth cells per
+    free axis, but only cells straddling a threshold are ever subdivided.
+    The saving grows with depth: boundary cells scale as L^(d-1) against
+    L^d for the dense grid.
+
+    Parameters:
+    -----------
+    thresholds : iterable of float
+        D values whose level sets are located (default 0.01, 0.05, 0.1, 0.3)
+    version : str
+        Registered formula version (default 'v9.2')
+    bounds : Dict[str, (lo, hi)], optional
+        Per-invariant region (default [0, 1]); lo == hi fixes an invariant
+        and removes it from the refinement
+    base_resolution : int
+        Cells per free axis in the initial grid
+    max_depth : int
+        Number of halvings applied to straddling cells
+    return_points : bool
+        Collect the boundary point clouds (default True)
+
+    Returns:
+    --------
+    Dict containing:
+    - 'thresholds': {t: {'points', 'volume'}} where 'points' is an (P, 5)
+      cloud of boundary crossings interpolated along the edges of the
+      finest straddling cells, and 'volume' gives the fractions of the
+      region with D < t ('below'), D >= t ('above') and unresolved
+      ('boundary'), plus 'above_estimate' splitting boundary cells by
+      their fraction of corners with D >= t
+    - 'evaluations': D evaluations performed
+    - 'dense_evaluations': points a dense grid of equal resolution needs
+    - 'cells_per_level': cells examined at each level
+    """
+    thresholds = tuple(float(t) for t in thresholds)
+    if not thresholds:
+        raise ValueError("At least one threshold is required")
+    if base_resolution < 1 or max_depth < 0:
+        raise ValueError("base_resolution must be >= 1 and max_depth >= 0")
+
+    bounds = dict(bounds or {})
+    unknown = set(bounds) - set(INVARIANTS)
+    if unknown:
+        raise ValueError(f"Unknown invariants: {sorted(unknown)}")
+    low = np.array([bounds.get(name, (0.0, 1.0))[0] for name in INVARIANTS], dtype=np.float64)
+    high = np.array([bounds.get(name, (0.0, 1.0))[1] for name in INVARIANTS], dtype=np.float64)
+    validate_batch((low, high))
+    if np.any(low > high):
+        raise ValueError("Each bound must satisfy low <= high")
+
+    free = np.flatnonzero(high > low)
+    d = free.size
+    if d == 0:
+        raise ValueError("At least one invariant must have low < high")
+    n_lattice = base_resolution * 2 ** max_depth
+    if (n_lattice + 1) ** d * d >= 2 ** 62:
+        raise ValueError("Resolution too fine for 64-bit lattice keys")
+
+    formula = get_formula(version)
+    radix = (n_lattice + 1) ** np.arange(d, dtype=np.int64)
+    span = (high - low)[free] / n_lattice
+
+    def to_points(lattice: np.ndarray) -> np.ndarray:
+        points = np.broadcast_to(low, (lattice.shape[0], 5)).copy()
+        points[:, free] += lattice * span
+        return points
+
+    offsets = _corner_offsets(d)
+    n_corners = offsets.shape[0]
+    # 3^d sub-lattice of a refined cell; entries with every coordinate in
+    # {0, 2} are the parent's own corners
+    sub = np.stack(np.meshgrid(*([np.arange(3)] * d), indexing='ij'), axis=-1).reshape(-1, d)
+    sub_radix = 3 ** np.arange(d)[::-1]
+    is_corner = np.all(sub != 1, axis=1)
+    parent_corner_slot = (2 * offsets) @ sub_radix
+    # child_slots[c, j]: sub-lattice entry holding corner j of child c
+    child_slots = (offsets[:, None, :] + offsets[None, :, :]) @ sub_radix
+    # Edges join corners i and i | 2^k for every bit k not set in i
+    edge_lo, edge_axis = np.nonzero(((np.arange(n_corners)[:, None] >> np.arange(d)) & 1) == 0)
+    edge_hi = edge_lo | (1 << edge_axis)
+
+    volume = {t: {'below': 0.0, 'above': 0.0, 'boundary': 0.0, 'above_estimate': 0.0} for t in thresholds}
+    crossings = {t: [] for t in thresholds}
+    cells_per_level = [0] * (max_depth + 1)
+    evaluations = 0
+
+    def visit(level: int, origin: np.ndarray, D: np.ndarray) -> None:
+        """Classify cells (origins + corner D values) and recurse into straddlers."""
+        nonlocal evaluations
+        size = 2 ** (max_depth - level)
+        cell_volume = (size / n_lattice) ** d
+        finest = level == max_depth
+        cells_per_level[level] += origin.shape[0]
+
+        n_above = {t: np.count_nonzero(D >= t, axis=1) for t in thresholds}
+        straddle = {t: (n_above[t] > 0) & (n_above[t] < n_corners) for t in thresholds}
+        refine = np.zeros(origin.shape[0], dtype=bool)
+        if not finest:
+            for t in thresholds:
+                refine |= straddle[t]
+
+        leaf = ~refine
+        for t in thresholds:
+            all_above = np.count_nonzero(leaf & (n_above[t] == n_corners))
+            boundary = leaf & straddle[t]
+            v = volume[t]
+            v['above'] += all_above * cell_volume
+            v['below'] += np.count_nonzero(leaf & (n_above[t] == 0)) * cell_volume
+            v['boundary'] += np.count_nonzero(boundary) * cell_volume
+            v['above_estimate'] += (all_above + n_above[t][boundary].sum() / n_corners) * cell_volume
+
+            if finest and return_points and boundary.any():
+                Db, Dt = D[boundary][:, edge_lo], D[boundary][:, edge_hi]
+                cell, edge = np.nonzero((Db >= t) != (Dt >= t))
+                start = origin[boundary][cell] + size * offsets[edge_lo[edge]]
+                frac = (t - Db[cell, edge]) / (Dt[cell, edge] - Db[cell, edge])
+                # Neighbouring cells share edges: key each by its low
+                # corner and axis so every crossing is reported once
+                key = (start @ radix) * d + edge_axis[edge]
+                lattice = start.astype(np.float64)
+                lattice[np.arange(edge.size), edge_axis[edge]] += frac * size
+                crossings[t].append((key, lattice))
+
+        parents, parent_D = origin[refine], D[refine]
+        half = size // 2
+        for lo in range(0, parents.shape[0], _REFINE_BATCH_CELLS):
+            p_origin = parents[lo:lo + _REFINE_BATCH_CELLS]
+            p_D = parent_D[lo:lo + _REFINE_BATCH_CELLS]
+            m = p_origin.shape[0]
+            lattice_D = np.empty((m, sub.shape[0]), dtype=np.float64)
+            lattice_D[:, parent_corner_slot] = p_D
+            # Faces are shared between neighbouring parents in the batch:
+            # evaluate each distinct lattice point once
+            new = (p_origin[:, None, :] + half * sub[~is_corner]).reshape(-1, d)
+            keys, first, inverse = np.unique(new @ radix, return_index=True, return_inverse=True)
+            values = formula.batch(to_points(new[first]), validate=False)
+            lattice_D[:, ~is_corner] = values[inverse].reshape(m, -1)
+            evaluations += keys.size
+            child_origin = (p_origin[:, None, :] + half * offsets).reshape(-1, d)
+            child_D = lattice_D[:, child_slots].reshape(-1, n_corners)
+            visit(level + 1, child_origin, child_D)
+
+    base_sub = np.stack(
+        np.meshgrid(*([np.arange(base_resolution + 1)] * d), indexing='ij'), axis=-1
+    ).reshape(-1, d) * 2 ** max_depth
+    base_D = formula.batch(to_points(base_sub), validate=False)
+    evaluations += base_D.size
+    base_radix = (base_resolution + 1) ** np.arange(d)[::-1]
+    cells = np.stack(
+        np.meshgrid(*([np.arange(base_resolution)] * d), indexing='ij'), axis=-1
+    ).reshape(-1, d)
+    corner_index = (cells[:, None, :] + offsets) @ base_radix
+    for lo in range(0, cells.shape[0], _REFINE_BATCH_CELLS):
+        idx = corner_index[lo:lo + _REFINE_BATCH_CELLS]
+        visit(0, cells[lo:lo + _REFINE_BATCH_CELLS] * 2 ** max_depth, base_D[idx])
+
+    results = {}
+    for t in thresholds:
+        if crossings[t]:
+            keys = np.concatenate([k for k, _ in crossings[t]])
+            lattice = np.concatenate([p for _, p in crossings[t]])
+            _, first = np.unique(keys, return_index=True)
+            points = to_points(lattice[first])
+        else:
+            points = np.empty((0, 5), dtype=np.float64)
+        results[t] = {'points': points, 'volume': volume[t]}
+
+    return {
+        'thresholds': results,
+        'version': formula.version,
+        'evaluations': evaluations,
+        'dense_evaluations': (n_lattice + 1) ** d,
+        'cells_per_level': cells_per_level,
+    }
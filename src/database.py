@@ -7,15 +7,126 @@ The database is the "Conduit" - it holds the structure when neither human nor AI
 Updated: 2026-01-17
 - Added seed_state_vector for v9.2 5D/6D vectors
 - Updated to v9.2 description
+
+Updated: 2026-02-06
+- State IDs are content hashes of (name, vector); seeding is an upsert,
+  so re-running a seeding script no longer duplicates states
+- Added seed_states_batch for chunked bulk ingestion
+- Storage goes through a pluggable backend (vector_backends.py): the
+  ChromaDB collection by default, or exact in-memory search
+- Added query_batch for many query vectors in one call per chunk
+- Added select: range/predicate queries on metadata (density, confidence,
+  invariants) with ordering and pagination, served from sorted secondary
+  indexes on the in-memory backend
+- Added scan (record batches over the whole collection in bounded memory)
+  and export_states/import_states (Parquet, Arrow, memory-mapped .npy)
+- Added IngestQueue: write-behind bulk ingestion of high-rate records
+  (e.g. per-token telemetry) from a background thread
 """
 
-import uuid
+import atexit
+import hashlib
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-import chromadb
-from chromadb.config import Settings
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Any, Sequence, Union
+import numpy as np
+
+from .encoder import encode_legacy as encode, compute_density, StateBatch
+from .state_io import RecordBatch, export_states, read_states
+from .vector_backends import BACKENDS, VectorBackend
+
+
+# States per upsert call in seed_states_batch (capped by the backend's limit)
+DEFAULT_SEED_CHUNK = 4096
+
+# Query vectors per backend call in query_batch
+DEFAULT_QUERY_CHUNK = 1024
+
+# States per record batch in scan
+DEFAULT_SCAN_BATCH = 8192
+
+# IngestQueue: records per bulk write, seconds a record may wait, buffer bound
+DEFAULT_INGEST_BATCH = 1024
+DEFAULT_INGEST_INTERVAL = 1.0
+DEFAULT_INGEST_BUFFER = 65536
+
+# Metadata keys of the first five vector components
+VECTOR_METADATA_KEYS = ("phi", "tau", "rho", "entropy", "kappa")
+
+
+def state_id(name: str, vector: Sequence[float]) -> str:
+    """
+    Deterministic ID of a state: a hash of its label and float64 vector.
+
+    Seeding the same (name, vector) twice yields the same ID, so repeated
+    seeding updates the stored state instead of adding a copy.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(name.encode("utf-8"))
+    digest.update(b"\x00")
+    # Adding 0.0 maps -0.0 to 0.0 so equal vectors hash equally
+    digest.update((np.asarray(vector, dtype=np.float64) + 0.0).tobytes())
+    return digest.hexdigest()
+
+
+class NeighborBatch:
+    """
+    Nearest neighbors of many query vectors (see ConduitDB.query_batch).
+
+    IDs and distances are (M, k) arrays, nearest first. Metadata is
+    fetched from the backend on first access, in one call for all
+    distinct neighbor IDs.
+
+    Attributes:
+        ids: (M, k) object array of state IDs
+        distances: (M, k) float64 squared Euclidean distances
+    """
 
-from .encoder import encode_legacy as encode, compute_density
+    def __init__(self, ids: np.ndarray, distances: np.ndarray, backend: VectorBackend):
+        self.ids = ids
+        self.distances = distances
+        self._backend = backend
+        self._metadata_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return self.ids.shape[0]
+
+    def _lookup(self) -> Dict[str, Dict[str, Any]]:
+        if self._metadata_by_id is None:
+            unique = list(dict.fromkeys(self.ids.ravel().tolist()))
+            limit = self._backend.max_batch_size or len(unique) or 1
+            self._metadata_by_id = {}
+            for lo in range(0, len(unique), limit):
+                chunk = unique[lo:lo + limit]
+                self._metadata_by_id.update(zip(chunk, self._backend.get_by_ids(chunk)))
+        return self._metadata_by_id
+
+    @property
+    def metadata(self) -> np.ndarray:
+        """(M, k) object array of metadata dicts."""
+        lookup = self._lookup()
+        out = np.empty(self.ids.shape, dtype=object)
+        out.ravel()[:] = [lookup[sid] for sid in self.ids.ravel()]
+        return out
+
+    @property
+    def names(self) -> np.ndarray:
+        """(M, k) array of state names."""
+        lookup = self._lookup()
+        names = [lookup[sid].get("name", "") for sid in self.ids.ravel()]
+        return np.array(names, dtype=str).reshape(self.ids.shape)
+
+    def neighbors(self, i: int) -> List[Dict]:
+        """Neighbor dicts of query i, as returned by query_vector()."""
+        lookup = self._lookup()
+        return [
+            {'id': sid, 'name': lookup[sid]['name'], 'distance': float(d), 'metadata': lookup[sid]}
+            for sid, d in zip(self.ids[i], self.distances[i])
+        ]
 
 
 class ConduitDB:
@@ -23,22 +134,34 @@ class ConduitDB:
     Persistent vector database for topological states.
 
     This is the substrate - the memory that persists across sessions.
+
+    Thread safety: each method is as safe as the backend calls it makes.
+    MemoryBackend locks every call and the ChromaDB client is thread-safe,
+    so reads may run while an IngestQueue writes. Methods that make several
+    backend calls (update_state_by_name, export_states) are not atomic.
     """
 
-    def __init__(self, persist_directory: str = "./data/conduit_memory"):
+    def __init__(
+        self,
+        persist_directory: str = "./data/conduit_memory",
+        backend: Union[str, VectorBackend] = "chroma"
+    ):
         """
         Initialize the Conduit database.
 
         Parameters:
         -----------
         persist_directory : str
-            Path where the database will be persisted
+            Path where the database will be persisted (ChromaDB backend)
+        backend : str or VectorBackend
+            'chroma' (persistent, default), 'memory' (exact in-memory
+            search, not persisted) or a backend instance
         """
-        self.client = chromadb.PersistentClient(path=persist_directory)
-        self.collection = self.client.get_or_create_collection(
-            name="topology_space",
-            metadata={"description": "Conduit Monism v7.0 - Structural Only"}
-        )
+        if isinstance(backend, str):
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown backend '{backend}'. Available: {list(BACKENDS)}")
+            backend = BACKENDS[backend](persist_directory) if backend == "chroma" else BACKENDS[backend]()
+        self.backend = backend
 
     def seed_state(
         self,
@@ -47,7 +170,8 @@ class ConduitDB:
         tau: float,
         rho: float,
         entropy: float,
-        description: str = ""
+        description: str = "",
+        verbose: bool = False
     ) -> str:
         """
         Add a named state to the database.
@@ -60,19 +184,21 @@ class ConduitDB:
             The four structural invariants
         description : str
             Optional description (metadata only)
+        verbose : bool
+            Print a one-line summary of the seeded state
 
         Returns:
         --------
         str
-            UUID of the created state
+            Content-hash ID of the state (see state_id)
         """
         vec = encode(phi, tau, rho, entropy)
         density = compute_density(phi, tau, rho)
-        state_id = str(uuid.uuid4())
+        sid = state_id(name, vec)
 
-        self.collection.add(
-            ids=[state_id],
-            embeddings=[vec],
+        self.backend.upsert(
+            ids=[sid],
+            vectors=np.array([vec]),
             metadatas=[{
                 "name": name,
                 "description": description,
@@ -85,8 +211,9 @@ class ConduitDB:
             }]
         )
 
-        print(f"Seeded: [{name}] (φ={phi:.2f}, τ={tau:.2f}, ρ={rho:.2f}, H={entropy:.2f}, Density={density:.3f})")
-        return state_id
+        if verbose:
+            print(f"Seeded: [{name}] (φ={phi:.2f}, τ={tau:.2f}, ρ={rho:.2f}, H={entropy:.2f}, Density={density:.3f})")
+        return sid
 
     def seed_state_vector(
         self,
@@ -114,9 +241,9 @@ class ConduitDB:
         Returns:
         --------
         str
-            UUID of the created state
+            Content-hash ID of the state (see state_id)
         """
-        state_id = str(uuid.uuid4())
+        sid = state_id(name, vector)
 
         # Build metadata
         meta = {
@@ -139,13 +266,176 @@ class ConduitDB:
         if metadata:
             meta.update(metadata)
 
-        self.collection.add(
-            ids=[state_id],
-            embeddings=[vector],
-            metadatas=[meta]
-        )
+        self.backend.upsert(ids=[sid], vectors=np.array([vector]), metadatas=[meta])
+
+        return sid
 
-        return state_id
+    def seed_states_batch(
+        self,
+        states: Union[StateBatch, np.ndarray],
+        names: Optional[Sequence[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        description: str = "",
+        chunk_size: int = DEFAULT_SEED_CHUNK
+    ) -> Dict[str, Any]:
+        """
+        Upsert many states in chunked bulk writes.
+
+        IDs are content hashes (see state_id), so seeding the same corpus
+        again updates it in place instead of duplicating it. Rows with
+        the same name and vector collapse to one state; the last row's
+        metadata wins.
+
+        Parameters:
+        -----------
+        states : StateBatch or np.ndarray
+            A StateBatch (stored as 6D vectors with a zero latent
+            dimension, like seed_calibrated_states) or an (N, D) array
+        names : sequence of str, optional
+            Per-row labels (default: the StateBatch names, else "")
+        metadata : Dict[str, array-like or scalar]
+            Extra metadata columns, each of length N or a scalar
+        description : str
+            Description stored on every row
+        chunk_size : int
+            States per upsert call (capped by the backend's batch limit)
+
+        Returns:
+        --------
+        Dict containing:
+        - 'ids': list of the N row IDs, in input order
+        - 'n_states': rows given; 'n_written': distinct states written
+        - 'chunks': upsert calls made
+        - 'seconds', 'states_per_second': wall time of the whole call
+        """
+        start = time.perf_counter()
+
+        columns: Dict[str, Any] = {}
+        if isinstance(states, StateBatch):
+            vectors = states.to_vectors_6d()
+            if names is None and states.names is not None:
+                names = states.names
+            columns["density"] = states.density()
+            if states.confidence is not None:
+                columns["confidence"] = states.confidence
+        else:
+            vectors = np.ascontiguousarray(states, dtype=np.float64)
+            if vectors.ndim != 2:
+                raise ValueError(f"states must be a StateBatch or an (N, D) array, got shape {vectors.shape}")
+        n, dim = vectors.shape
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        if names is None:
+            names = [""] * n
+        else:
+            names = [str(name) for name in names]
+            if len(names) != n:
+                raise ValueError(f"names must have {n} entries, got {len(names)}")
+
+        for key, value in zip(VECTOR_METADATA_KEYS[:dim], vectors.T):
+            columns[key] = value
+        columns.update(metadata or {})
+        column_lists = {}
+        for key, value in columns.items():
+            value = np.asarray(value)
+            if value.ndim == 0:
+                value = np.broadcast_to(value, (n,))
+            if value.shape != (n,):
+                raise ValueError(f"Metadata column '{key}' must have {n} values, got shape {value.shape}")
+            column_lists[key] = value.tolist()
+
+        ids = [state_id(name, row) for name, row in zip(names, vectors)]
+
+        # Keep the last row of each ID, in first-seen order
+        last = {sid: i for i, sid in enumerate(ids)}
+        rows = sorted(last.values())
+
+        timestamp = datetime.now().isoformat()
+        limit = self.backend.max_batch_size
+        if limit:
+            chunk_size = min(chunk_size, limit)
+
+        chunks = 0
+        for lo in range(0, len(rows), chunk_size):
+            chunk = rows[lo:lo + chunk_size]
+            metadatas = []
+            for i in chunk:
+                meta = {
+                    "name": names[i],
+                    "description": description,
+                    "timestamp": timestamp,
+                    "vector_dim": dim,
+                }
+                for key, values in column_lists.items():
+                    meta[key] = values[i]
+                metadatas.append(meta)
+            self.backend.upsert(
+                ids=[ids[i] for i in chunk],
+                vectors=vectors[chunk],
+                metadatas=metadatas
+            )
+            chunks += 1
+
+        seconds = time.perf_counter() - start
+        return {
+            "ids": ids,
+            "n_states": n,
+            "n_written": len(rows),
+            "chunks": chunks,
+            "seconds": seconds,
+            "states_per_second": n / seconds if seconds > 0 else float("inf"),
+        }
+
+    def update_state_by_name(
+        self,
+        name: str,
+        vector: List[float],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Replace the vector and merge metadata of every state with a given label.
+
+        Used by scripts/recalibrate.py to refresh seeded calibrated states
+        when their invariants change. IDs are content hashes, so the
+        states are re-keyed: they are stored as one state under
+        state_id(name, vector) (metadata merged into the most recently
+        stored row's) and the old IDs are deleted. Seeding the same name
+        and vector afterwards updates that state instead of adding a row.
+
+        Parameters:
+        -----------
+        name : str
+            Label the states were seeded under
+        vector : List[float]
+            The new state vector (5D or 6D)
+        metadata : Dict
+            Metadata to merge into the stored metadata
+
+        Returns:
+        --------
+        int
+            Number of stored states replaced
+        """
+        found = self.backend.get(where={"name": name})
+        if not found["ids"]:
+            return 0
+
+        latest = max(found["metadatas"], key=lambda meta: str(meta.get("timestamp", "")))
+        meta = dict(latest)
+        meta["timestamp"] = datetime.now().isoformat()
+        meta["vector_dim"] = len(vector)
+        for key, value in zip(VECTOR_METADATA_KEYS, vector):
+            meta[key] = value
+        if metadata:
+            meta.update(metadata)
+
+        # Write the new state before dropping the old IDs, so a failure
+        # in between leaves a duplicate rather than losing the state
+        sid = state_id(name, vector)
+        self.backend.upsert(ids=[sid], vectors=np.array([vector], dtype=np.float64), metadatas=[meta])
+        self.backend.delete([old for old in found["ids"] if old != sid])
+        return len(found["ids"])
 
     def find_neighbors(
         self,
@@ -173,21 +463,7 @@ class ConduitDB:
             List of neighbor states with their metadata and distances
         """
         query_vec = encode(phi, tau, rho, entropy)
-        results = self.collection.query(
-            query_embeddings=[query_vec],
-            n_results=min(n_results, self.collection.count())
-        )
-
-        neighbors = []
-        for i in range(len(results['ids'][0])):
-            neighbors.append({
-                'id': results['ids'][0][i],
-                'name': results['metadatas'][0][i]['name'],
-                'distance': results['distances'][0][i],
-                'metadata': results['metadatas'][0][i]
-            })
-
-        return neighbors
+        return self._neighbors(query_vec, n_results)
 
     def query_vector(self, vector: List[float], n_results: int = 3) -> List[Dict]:
         """
@@ -205,31 +481,441 @@ class ConduitDB:
         List[Dict]
             List of neighbor states with their metadata and distances
         """
-        results = self.collection.query(
-            query_embeddings=[vector],
-            n_results=min(n_results, self.collection.count())
-        )
+        return self._neighbors(vector, n_results)
+
+    def query_batch(
+        self,
+        vectors: Union[StateBatch, np.ndarray],
+        n_results: int = 3,
+        chunk_size: int = DEFAULT_QUERY_CHUNK
+    ) -> NeighborBatch:
+        """
+        Query the database with many vectors at once.
+
+        Issues one backend call per chunk of query vectors (and one count),
+        e.g. labelling every step of a trajectory costs one round-trip per
+        chunk instead of one per step.
+
+        Parameters:
+        -----------
+        vectors : StateBatch or np.ndarray
+            (M, D) query vectors; a StateBatch is queried as 6D vectors
+        n_results : int
+            Neighbors per query (capped by the number of stored states)
+        chunk_size : int
+            Query vectors per backend call
+
+        Returns:
+        --------
+        NeighborBatch
+            (M, k) ids and distances; metadata is fetched lazily
+        """
+        if isinstance(vectors, StateBatch):
+            vectors = vectors.to_vectors_6d()
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        if vectors.ndim != 2:
+            raise ValueError(f"vectors must have shape (M, D), got {vectors.shape}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        m = vectors.shape[0]
+        k = min(n_results, self.backend.count())
+        ids = np.empty((m, max(k, 0)), dtype=object)
+        distances = np.empty((m, max(k, 0)), dtype=np.float64)
+        if k > 0:
+            for lo in range(0, m, chunk_size):
+                hi = min(lo + chunk_size, m)
+                ids[lo:hi], distances[lo:hi] = self.backend.knn(vectors[lo:hi], k)
+        return NeighborBatch(ids, distances, self.backend)
+
+    def select(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Select states by metadata predicates, e.g. every HIGH-confidence
+        state with density above 0.3, densest first.
+
+        Parameters:
+        -----------
+        where : dict, optional
+            ChromaDB-style filter: {"density": {"$gt": 0.3},
+            "confidence": {"$gte": "MODERATE"}}. Keys are ANDed; a bare value
+            means $eq. Confidence labels compare by rank.
+        order_by : str, optional
+            Metadata key to sort by; states without it come last
+        descending : bool
+            Sort largest first
+        offset, limit : int
+            Page of the ordered result to return (limit None: to the end)
+
+        Returns:
+        --------
+        Dict
+            'ids' and 'metadatas' of the page, 'total' matching states,
+            'offset', and 'next_offset' (None on the last page)
+        """
+        page = self.backend.select(where, order_by, descending, offset, limit)
+        end = offset + len(page["ids"])
+        page["offset"] = offset
+        page["next_offset"] = end if end < page["total"] else None
+        return page
+
+    def _neighbors(self, vector: List[float], n_results: int) -> List[Dict]:
+        """Neighbor dicts of one query vector, nearest first."""
+        results = self.backend.query(np.array([vector], dtype=np.float64), n_results)
 
         neighbors = []
         for i in range(len(results['ids'][0])):
             neighbors.append({
                 'id': results['ids'][0][i],
                 'name': results['metadatas'][0][i]['name'],
-                'distance': results['distances'][0][i],
+                'distance': float(results['distances'][0][i]),
                 'metadata': results['metadatas'][0][i]
             })
 
         return neighbors
 
+    def scan(self, batch_size: int = DEFAULT_SCAN_BATCH) -> Iterator[RecordBatch]:
+        """
+        Iterate over every stored state in record batches.
+
+        Pages through the collection in storage order, holding one batch at
+        a time. Writes made during the scan may or may not be seen.
+
+        Parameters:
+        -----------
+        batch_size : int
+            States per batch
+
+        Yields:
+        -------
+        RecordBatch
+            ids, (n, D) vectors and metadata columns of up to batch_size states
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        offset = 0
+        while True:
+            ids, vectors, columns = self.backend.scan(offset, batch_size)
+            if not len(ids):
+                return
+            yield RecordBatch(ids, vectors, columns)
+            offset += len(ids)
+
+    def export_states(
+        self,
+        path: Union[str, Path],
+        batch_size: int = DEFAULT_SCAN_BATCH
+    ) -> Dict[str, Any]:
+        """
+        Export the whole collection (see state_io for the formats).
+
+        Streams: the collection is scanned twice, once for the schema and
+        once to write, holding one batch in memory at a time.
+
+        Parameters:
+        -----------
+        path : str or Path
+            '.parquet' or '.arrow'/'.feather' file (requires pyarrow), or a
+            directory of .npy files plus a metadata.json sidecar
+        batch_size : int
+            States per scanned batch
+
+        Returns:
+        --------
+        Dict with 'path', 'format', 'n_states' and 'seconds'
+        """
+        return export_states(lambda: self.scan(batch_size), path)
+
+    def import_states(
+        self,
+        path: Union[str, Path],
+        chunk_size: int = DEFAULT_SEED_CHUNK
+    ) -> Dict[str, Any]:
+        """
+        Upsert every state of an export under its stored ID.
+
+        Re-importing the same export leaves the collection unchanged.
+
+        Parameters:
+        -----------
+        path : str or Path
+            File or directory written by export_states
+        chunk_size : int
+            States per upsert call (capped by the backend's limit)
+
+        Returns:
+        --------
+        Dict with 'n_states', 'chunks' and 'seconds'
+        """
+        start = time.perf_counter()
+        batch = read_states(path)
+        if self.backend.max_batch_size:
+            chunk_size = min(chunk_size, self.backend.max_batch_size)
+        chunks = 0
+        for lo in range(0, len(batch), chunk_size):
+            hi = min(lo + chunk_size, len(batch))
+            self.backend.upsert(
+                ids=batch.ids[lo:hi].tolist(),
+                vectors=batch.vectors[lo:hi],
+                metadatas=[batch.metadata(i) for i in range(lo, hi)]
+            )
+            chunks += 1
+        return {"n_states": len(batch), "chunks": chunks, "seconds": time.perf_counter() - start}
+
+    def ingest_queue(self, **kwargs) -> "IngestQueue":
+        """Start a write-behind IngestQueue into this database (see IngestQueue)."""
+        return IngestQueue(self, **kwargs)
+
     def count(self) -> int:
         """Return the number of states in the database."""
-        return self.collection.count()
+        return self.backend.count()
 
     def reset(self):
         """Delete all states from the database (use with caution)."""
-        self.client.delete_collection("topology_space")
-        self.collection = self.client.get_or_create_collection(
-            name="topology_space",
-            metadata={"description": "Conduit Monism v7.0 - Structural Only"}
-        )
+        self.backend.reset()
         print("Database reset.")
+
+
+class IngestQueue:
+    """
+    Write-behind ingestion of state records into a ConduitDB.
+
+    put() appends a record to a bounded in-memory buffer and returns; a
+    background thread writes buffered records through seed_states_batch
+    once batch_size of them are waiting or the oldest has waited
+    flush_interval seconds. When the buffer is full, put() blocks until
+    the writer catches up (back-pressure) or raises queue.Full.
+
+    Records still buffered at interpreter exit are written by an atexit
+    hook; close() (or leaving a `with` block) flushes and stops the writer
+    explicitly. A failed bulk write is kept and re-raised by the next
+    flush() or close().
+
+    The writer thread shares the database with the caller's threads; this
+    relies on the backend being thread-safe (see ConduitDB), so queries may
+    run while records are being ingested.
+
+    Usage:
+        with db.ingest_queue(batch_size=512) as ingest:
+            for step in steps:
+                ingest.put(f"run/{step}", vector, {"density": D})
+    """
+
+    def __init__(
+        self,
+        db: ConduitDB,
+        batch_size: int = DEFAULT_INGEST_BATCH,
+        flush_interval: float = DEFAULT_INGEST_INTERVAL,
+        max_pending: int = DEFAULT_INGEST_BUFFER,
+        description: str = ""
+    ):
+        """
+        Parameters:
+        -----------
+        db : ConduitDB
+            Destination database
+        batch_size : int
+            Records per bulk write
+        flush_interval : float
+            Longest time (seconds) a record waits before being written
+        max_pending : int
+            Buffer bound; put() applies back-pressure beyond it
+        description : str
+            Description stored on every record
+        """
+        if batch_size < 1 or max_pending < batch_size:
+            raise ValueError("Need 1 <= batch_size <= max_pending")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.description = description
+
+        self._pending: deque = deque()
+        self._oldest = 0.0
+        self._dim: Optional[int] = None
+        self._condition = threading.Condition()
+        self._flush_requested = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._submitted = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._blocked_seconds = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="conduit-ingest", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "IngestQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def put(
+        self,
+        name: str,
+        vector: Sequence[float],
+        metadata: Optional[Dict[str, Any]] = None,
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Buffer one record for writing.
+
+        Parameters:
+        -----------
+        name : str
+            State label (the ID is the content hash of name and vector)
+        vector : sequence of float
+            State vector; every record of a queue has the same dimension
+        metadata : Dict, optional
+            Extra metadata; not copied, so do not modify it afterwards
+        block, timeout : bool, float
+            When the buffer is full, wait (up to timeout seconds) for room,
+            or raise queue.Full immediately if block is False
+        """
+        if self._dim is None:
+            self._dim = len(vector)
+        elif len(vector) != self._dim:
+            raise ValueError(f"Vector dimension {len(vector)} does not match queue dimension {self._dim}")
+        with self._condition:
+            if self._closed:
+                raise ValueError("IngestQueue is closed")
+            if len(self._pending) >= self.max_pending:
+                self._wait_for_room(block, timeout)
+            if not self._pending:
+                # Start the writer's flush_interval timer
+                self._oldest = time.monotonic()
+                self._condition.notify_all()
+            self._pending.append((name, vector, metadata))
+            self._submitted += 1
+            if len(self._pending) == self.batch_size:
+                self._condition.notify_all()
+
+    def _wait_for_room(self, block: bool, timeout: Optional[float]) -> None:
+        """Back-pressure: wait (holding the condition) until the buffer has room."""
+        if not block:
+            raise queue.Full
+        start = time.monotonic()
+        self._condition.notify_all()
+        room = self._condition.wait_for(
+            lambda: len(self._pending) < self.max_pending or self._closed, timeout
+        )
+        self._blocked_seconds += time.monotonic() - start
+        if not room:
+            raise queue.Full
+        if self._closed:
+            raise ValueError("IngestQueue is closed")
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Write every record put so far and wait for it to be stored.
+
+        Raises the error of a failed bulk write since the last flush.
+        """
+        with self._condition:
+            target = self._submitted
+            self._flush_requested = True
+            self._condition.notify_all()
+            done = self._condition.wait_for(
+                lambda: self._written + self._failed >= target or not self._thread.is_alive(), timeout
+            )
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        if not done:
+            raise TimeoutError(f"IngestQueue flush did not finish within {timeout} s")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush, then stop the writer thread. Safe to call more than once."""
+        atexit.unregister(self.close)
+        if self._closed:
+            return
+        try:
+            self.flush(timeout)
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters: submitted, written, failed, pending, batches, blocked_seconds."""
+        with self._condition:
+            return {
+                "submitted": self._submitted,
+                "written": self._written,
+                "failed": self._failed,
+                "pending": len(self._pending),
+                "batches": self._batches,
+                "blocked_seconds": self._blocked_seconds,
+            }
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _ready(self) -> bool:
+        if self._closed or len(self._pending) >= self.batch_size:
+            return True
+        if not self._pending:
+            return False
+        return self._flush_requested or time.monotonic() - self._oldest >= self.flush_interval
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready():
+                    wait = None if not self._pending else self._oldest + self.flush_interval - time.monotonic()
+                    self._condition.wait(wait)
+                if self._closed and not self._pending:
+                    return
+                records = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+                if not self._pending:
+                    self._flush_requested = False
+                # Wake producers blocked on a full buffer
+                self._condition.notify_all()
+
+            error = None
+            try:
+                self._write(records)
+            except Exception as exc:
+                error = exc
+
+            with self._condition:
+                if error is None:
+                    self._written += len(records)
+                else:
+                    self._failed += len(records)
+                    self._error = error
+                self._batches += 1
+                self._condition.notify_all()
+
+    def _write(self, records: List[tuple]) -> None:
+        """Bulk-write records, one seed_states_batch call per metadata key set."""
+        groups: Dict[tuple, List[tuple]] = {}
+        for record in records:
+            groups.setdefault(tuple(record[2] or ()), []).append(record)
+        for keys, group in groups.items():
+            self.db.seed_states_batch(
+                np.array([vector for _, vector, _ in group], dtype=np.float64),
+                names=[name for name, _, _ in group],
+                metadata={key: [meta[key] for _, _, meta in group] for key in keys},
+                description=self.description
+            )
+
@@ -20,12 +20,19 @@ Updated: 2026-01-17
 - Integrated calibration library (v1.1)
 - Added v9.2 formula with coherence gate
 - Preserved legacy models for comparison
+- Added vectorized batch evaluation over (N, 5) arrays
+- Added versioned formula registry (v7, legacy, v8.0, v8.1, v9.2)
+- Added vectorized inverse solver (invariant reaching a target D)
+- Added analytic gradients and Hessians for every registered formula
+- Added exact interval bounds on D over boxes of invariants
 """
 
 import math
 import sys
+import warnings
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
 
@@ -36,7 +43,7 @@ if str(CALIBRATION_PATH) not in sys.path:
 
 try:
     from mapping_functions import (
-        get_calibrated_states,
+        get_calibration_registry,
         create_grounded_state,
         GroundedState,
         CalibratedValue,
@@ -45,7 +52,7 @@ try:
     CALIBRATION_AVAILABLE = True
 except ImportError:
     CALIBRATION_AVAILABLE = False
-    print("Warning: Calibration library not available. Using standalone mode.")
+    warnings.warn("Calibration library not available. Using standalone mode.", ImportWarning)
 
 
 # =============================================================================
@@ -147,6 +154,861 @@ def decompose_density(
     }
 
 
+# =============================================================================
+# Batch (Vectorized) Evaluation
+# =============================================================================
+
+# Column order of an (N, 5) state array
+INVARIANTS = ("phi", "tau", "rho", "H", "kappa")
+
+
+def as_columns(
+    states: Optional[np.ndarray] = None,
+    phi=None,
+    tau=None,
+    rho=None,
+    H=None,
+    kappa=None
+) -> Tuple[np.ndarray, ...]:
+    """
+    Normalize batch input into five float64 column arrays.
+
+    Accepts either an (N, 5) array with columns [φ, τ, ρ, H, κ] or the
+    five columns as separate array-likes (broadcast against each other).
+    Column views of a C-contiguous (N, 5) array are returned without copying.
+
+    Returns:
+    --------
+    Tuple of five 1-D float64 arrays (phi, tau, rho, H, kappa)
+    """
+    if states is not None:
+        if any(c is not None for c in (phi, tau, rho, H, kappa)):
+            raise ValueError("Pass either an (N, 5) array or five columns, not both")
+        states = np.asarray(states, dtype=np.float64)
+        if states.ndim == 1 and states.shape[0] == 5:
+            states = states.reshape(1, 5)
+        if states.ndim != 2 or states.shape[1] != 5:
+            raise ValueError(f"states must have shape (N, 5), got {states.shape}")
+        return tuple(states[:, i] for i in range(5))
+
+    columns = (phi, tau, rho, H, kappa)
+    if any(c is None for c in columns):
+        missing = [n for n, c in zip(INVARIANTS, columns) if c is None]
+        raise ValueError(f"Missing columns: {missing}")
+    arrays = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in columns))
+    return tuple(np.ravel(a) for a in arrays)
+
+
+def validate_batch(columns: Tuple[np.ndarray, ...]) -> None:
+    """
+    Check that every invariant column lies in [0.0, 1.0].
+
+    Uses one min/max reduction per column; the offending row is only
+    located when a column fails. NaN values fail validation.
+
+    Raises:
+    -------
+    ValueError naming the first invalid invariant, row and value
+    """
+    for name, col in zip(INVARIANTS, columns):
+        if col.size == 0:
+            continue
+        lo, hi = col.min(), col.max()
+        if not (0.0 <= lo and hi <= 1.0):
+            bad = np.flatnonzero(~((col >= 0.0) & (col <= 1.0)))[0]
+            raise ValueError(
+                f"{name} must be in range [0.0, 1.0], got {col[bad]} at row {bad}"
+            )
+
+
+def density_v92_batch(
+    states: Optional[np.ndarray] = None,
+    phi=None,
+    tau=None,
+    rho=None,
+    H=None,
+    kappa=None,
+    out: Optional[np.ndarray] = None,
+    validate: bool = True
+) -> np.ndarray:
+    """
+    Vectorized v9.2 density over a batch of states.
+
+    D = φ × τ × ρ × [(1 - √H) + (H × κ)]
+
+    Parameters:
+    -----------
+    states : np.ndarray, optional
+        (N, 5) array with columns [φ, τ, ρ, H, κ]
+    phi, tau, rho, H, kappa : array-like, optional
+        Column arrays, used instead of `states`
+    out : np.ndarray, optional
+        Preallocated float64 buffer of length N that receives D
+    validate : bool
+        Check ranges in bulk before computing (default True)
+
+    Returns:
+    --------
+    np.ndarray: D for each row (the `out` buffer when given)
+
+    Examples:
+    ---------
+    >>> density_v92_batch(np.array([[0.80, 0.50, 0.55, 0.50, 0.50]]))
+    array([0.119...])
+    """
+    return DENSITY_FORMULAS["v9.2"].batch(
+        states, phi, tau, rho, H, kappa, out=out, validate=validate
+    )
+
+
+def decompose_density_batch(
+    states: Optional[np.ndarray] = None,
+    phi=None,
+    tau=None,
+    rho=None,
+    H=None,
+    kappa=None,
+    out: Optional[np.ndarray] = None,
+    validate: bool = True
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized counterpart of decompose_density().
+
+    Parameters are as for density_v92_batch(); `out` receives D.
+
+    Returns:
+    --------
+    Dict of arrays: phi, tau, rho, H, kappa, structure, entropy_penalty,
+    coherence_rescue, entropy_gate, and D
+    """
+    phi, tau, rho, H, kappa = as_columns(states, phi, tau, rho, H, kappa)
+    if validate:
+        validate_batch((phi, tau, rho, H, kappa))
+
+    n = phi.shape[0]
+    if out is None:
+        out = np.empty(n, dtype=np.float64)
+    elif out.shape != (n,):
+        raise ValueError(f"out must have shape ({n},), got {out.shape}")
+
+    structure = phi * tau
+    structure *= rho
+    entropy_penalty = np.sqrt(H)
+    np.subtract(1.0, entropy_penalty, out=entropy_penalty)
+    coherence_rescue = H * kappa
+    entropy_gate = entropy_penalty + coherence_rescue
+    np.multiply(structure, entropy_gate, out=out)
+
+    return {
+        "phi": phi,
+        "tau": tau,
+        "rho": rho,
+        "H": H,
+        "kappa": kappa,
+        "structure": structure,
+        "entropy_penalty": entropy_penalty,
+        "coherence_rescue": coherence_rescue,
+        "entropy_gate": entropy_gate,
+        "D": out
+    }
+
+
+# =============================================================================
+# Formula Registry
+# =============================================================================
+#
+# Every density formula used across the project has the shape
+#
+#     D = φ × τ × ρ × gate(H, κ)
+#
+# and differs only in its entropy gate and in how that gate is clamped.
+# Each registered version declares both, so one vectorized implementation
+# serves every experiment. Scripts select formulas by version string:
+#
+#     density_v81 = get_formula("v8.1")
+#     D = density_v81(phi, tau, rho, H, kappa)        # scalar
+#     D = get_formula("v8.1").batch(states)           # (N, 5) array
+#
+# Formulas may also declare the analytic derivatives of their gate,
+# returned as (g_H, g_κ, g_HH, g_Hκ, g_κκ); all built-in versions do. The
+# structural factor is a plain product, so gradients and Hessians of D
+# follow from these five gate terms.
+#
+# For interval bounds a formula declares where its gate is stationary in H
+# (gate_stationary_H(κ) -> H, NaN when it is monotone). Built-in gates are
+# affine in κ, so their extremes over a box lie on its κ edges, at a corner
+# or at that stationary point, which makes the bounds exact.
+
+
+@dataclass(frozen=True)
+class DensityFormula:
+    """
+    A registered density formula.
+
+    Attributes:
+        version: Version string used for lookup (e.g., 'v9.2')
+        gate: Vectorized entropy gate, called as gate(H, kappa, sqrt_H)
+        gate_min: Lower clamp applied to the gate (None = unclamped)
+        gate_max: Upper clamp applied to the gate (None = unclamped)
+        uses_kappa: Whether κ enters the formula
+        description: Formula summary
+        gate_derivatives: Unclamped gate derivatives, called as
+            gate_derivatives(H, kappa, sqrt_H) -> (g_H, g_κ, g_HH, g_Hκ, g_κκ)
+        gate_stationary_H: H where ∂gate/∂H = 0 for a given κ (NaN if none
+            in the interior); the gate must be affine in κ
+    """
+    version: str
+    gate: Callable
+    gate_min: Optional[float] = None
+    gate_max: Optional[float] = None
+    uses_kappa: bool = True
+    description: str = ""
+    gate_derivatives: Optional[Callable] = None
+    gate_stationary_H: Optional[Callable] = None
+
+    def entropy_gate(self, H, kappa, sqrt_H=None):
+        """Evaluate the (clamped) entropy gate for scalars or arrays."""
+        if sqrt_H is None:
+            sqrt_H = np.sqrt(H)
+        gate = self.gate(H, kappa, sqrt_H)
+        if self.gate_min is not None or self.gate_max is not None:
+            gate = np.clip(gate, self.gate_min, self.gate_max)
+        return gate
+
+    def gate_gradient(self, H, kappa, sqrt_H=None) -> Tuple[np.ndarray, ...]:
+        """
+        Derivatives of the (clamped) gate: (g_H, g_κ, g_HH, g_Hκ, g_κκ).
+
+        Where a clamp is active the gate is constant, so all derivatives
+        are zero there. Terms in 1/√H diverge at H = 0 and are returned as
+        ±inf.
+
+        Raises:
+        -------
+        ValueError if the formula does not declare gate derivatives
+        """
+        if self.gate_derivatives is None:
+            raise ValueError(f"Formula '{self.version}' does not declare gate derivatives")
+        H = np.asarray(H, dtype=np.float64)
+        kappa = np.asarray(kappa, dtype=np.float64)
+        if sqrt_H is None:
+            sqrt_H = np.sqrt(H)
+        with np.errstate(divide='ignore'):
+            terms = [
+                np.broadcast_to(np.asarray(t, dtype=np.float64), np.broadcast(H, kappa).shape)
+                for t in self.gate_derivatives(H, kappa, sqrt_H)
+            ]
+        if self.gate_min is not None or self.gate_max is not None:
+            raw = self.gate(H, kappa, sqrt_H)
+            clamped = np.zeros(np.shape(raw), dtype=bool)
+            if self.gate_min is not None:
+                clamped |= raw < self.gate_min
+            if self.gate_max is not None:
+                clamped |= raw > self.gate_max
+            terms = [np.where(clamped, 0.0, t) for t in terms]
+        return tuple(terms)
+
+    def __call__(self, phi, tau, rho, H, kappa=0.0):
+        """
+        Evaluate the formula without range validation.
+
+        Scalar inputs return a Python float; array inputs return an array.
+        """
+        D = phi * tau * rho * self.entropy_gate(H, kappa)
+        return float(D) if np.ndim(D) == 0 else D
+
+    def batch(
+        self,
+        states: Optional[np.ndarray] = None,
+        phi=None,
+        tau=None,
+        rho=None,
+        H=None,
+        kappa=None,
+        out: Optional[np.ndarray] = None,
+        validate: bool = True
+    ) -> np.ndarray:
+        """
+        Evaluate the formula over a batch of states.
+
+        Accepts the same inputs as density_v92_batch(). When the formula
+        ignores κ, the κ column may be omitted.
+        """
+        if states is None and kappa is None and not self.uses_kappa:
+            kappa = 0.0
+        phi, tau, rho, H, kappa = as_columns(states, phi, tau, rho, H, kappa)
+        if validate:
+            validate_batch((phi, tau, rho, H, kappa))
+
+        n = phi.shape[0]
+        if out is None:
+            out = np.empty(n, dtype=np.float64)
+        elif out.shape != (n,):
+            raise ValueError(f"out must have shape ({n},), got {out.shape}")
+
+        gate = self.entropy_gate(H, kappa)
+        np.multiply(phi, tau, out=out)
+        out *= rho
+        out *= gate
+        return out
+
+    def interval(self, lo, hi, validate: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact bounds on D over boxes of invariants.
+
+        Parameters:
+        -----------
+        lo, hi : array-like
+            (N, 5) (or length-5) lower and upper corners [φ, τ, ρ, H, κ]
+        validate : bool
+            Check ranges and lo <= hi (default True)
+
+        Returns:
+        --------
+        Tuple (D_lo, D_hi) of (N,) arrays; both bounds are attained in the box
+
+        Raises:
+        -------
+        ValueError if the formula does not declare gate_stationary_H
+        """
+        if self.gate_stationary_H is None:
+            raise ValueError(f"Formula '{self.version}' does not declare gate_stationary_H")
+        lo = np.asarray(lo, dtype=np.float64).reshape(-1, 5)
+        hi = np.asarray(hi, dtype=np.float64).reshape(-1, 5)
+        if lo.shape != hi.shape:
+            raise ValueError(f"lo and hi must have the same shape, got {lo.shape} and {hi.shape}")
+        if validate:
+            validate_batch(tuple(lo[:, i] for i in range(5)))
+            validate_batch(tuple(hi[:, i] for i in range(5)))
+            if np.any(lo > hi):
+                row = np.flatnonzero(np.any(lo > hi, axis=1))[0]
+                raise ValueError(f"lo must not exceed hi, got lo={lo[row]} hi={hi[row]} at row {row}")
+
+        # Structure is increasing in each (non-negative) invariant
+        structure_lo = lo[:, 0] * lo[:, 1] * lo[:, 2]
+        structure_hi = hi[:, 0] * hi[:, 1] * hi[:, 2]
+
+        # Raw gate candidates: the four corners of the (H, κ) box and the
+        # stationary point on each κ edge when it lies inside [H_lo, H_hi]
+        H_lo, H_hi, k_lo, k_hi = lo[:, 3], hi[:, 3], lo[:, 4], hi[:, 4]
+        candidates = [self.gate(H, k, np.sqrt(H)) for H in (H_lo, H_hi) for k in (k_lo, k_hi)]
+        for k in (k_lo, k_hi):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                H_star = np.asarray(self.gate_stationary_H(k), dtype=np.float64)
+            inside = (H_star >= H_lo) & (H_star <= H_hi)
+            H_safe = np.where(inside, H_star, H_lo)
+            candidates.append(np.where(inside, self.gate(H_safe, k, np.sqrt(H_safe)), np.nan))
+        candidates = np.stack([np.broadcast_to(c, H_lo.shape) for c in candidates], axis=1)
+        gate_lo = np.nanmin(candidates, axis=1)
+        gate_hi = np.nanmax(candidates, axis=1)
+        if self.gate_min is not None or self.gate_max is not None:
+            gate_lo = np.clip(gate_lo, self.gate_min, self.gate_max)
+            gate_hi = np.clip(gate_hi, self.gate_min, self.gate_max)
+
+        # Structure and gate depend on disjoint invariants, so the product's
+        # extremes pair extreme structure with extreme gate
+        D_lo = np.minimum(structure_lo * gate_lo, structure_hi * gate_lo)
+        D_hi = np.maximum(structure_lo * gate_hi, structure_hi * gate_hi)
+        return D_lo, D_hi
+
+    def gradient(
+        self,
+        states: Optional[np.ndarray] = None,
+        phi=None,
+        tau=None,
+        rho=None,
+        H=None,
+        kappa=None,
+        validate: bool = True
+    ) -> np.ndarray:
+        """
+        Analytic gradient of D for every state in a batch.
+
+        Returns:
+        --------
+        np.ndarray of shape (N, 5): row i is [∂D/∂φ, ∂D/∂τ, ∂D/∂ρ, ∂D/∂H,
+        ∂D/∂κ] at state i (the Jacobian of the batch, one row per state)
+        """
+        if states is None and kappa is None and not self.uses_kappa:
+            kappa = 0.0
+        phi, tau, rho, H, kappa = as_columns(states, phi, tau, rho, H, kappa)
+        if validate:
+            validate_batch((phi, tau, rho, H, kappa))
+
+        sqrt_H = np.sqrt(H)
+        gate = self.entropy_gate(H, kappa, sqrt_H)
+        g_H, g_k = self.gate_gradient(H, kappa, sqrt_H)[:2]
+        structure = phi * tau * rho
+
+        grad = np.empty((phi.shape[0], 5), dtype=np.float64)
+        np.multiply(tau * rho, gate, out=grad[:, 0])
+        np.multiply(phi * rho, gate, out=grad[:, 1])
+        np.multiply(phi * tau, gate, out=grad[:, 2])
+        np.multiply(structure, g_H, out=grad[:, 3])
+        np.multiply(structure, g_k, out=grad[:, 4])
+        return grad
+
+    def hessian(
+        self,
+        states: Optional[np.ndarray] = None,
+        phi=None,
+        tau=None,
+        rho=None,
+        H=None,
+        kappa=None,
+        validate: bool = True
+    ) -> np.ndarray:
+        """
+        Analytic Hessian of D for every state in a batch.
+
+        Returns:
+        --------
+        np.ndarray of shape (N, 5, 5), symmetric, in [φ, τ, ρ, H, κ] order
+        """
+        if states is None and kappa is None and not self.uses_kappa:
+            kappa = 0.0
+        phi, tau, rho, H, kappa = as_columns(states, phi, tau, rho, H, kappa)
+        if validate:
+            validate_batch((phi, tau, rho, H, kappa))
+
+        sqrt_H = np.sqrt(H)
+        gate = self.entropy_gate(H, kappa, sqrt_H)
+        g_H, g_k, g_HH, g_Hk, g_kk = self.gate_gradient(H, kappa, sqrt_H)
+        # ∂S/∂x for the structural product S = φτρ
+        d_structure = (tau * rho, phi * rho, phi * tau)
+        structure = phi * tau * rho
+
+        hess = np.zeros((phi.shape[0], 5, 5), dtype=np.float64)
+        # Structural block: ∂²S/∂x∂y is the remaining invariant
+        for (i, j), other in (((0, 1), rho), ((0, 2), tau), ((1, 2), phi)):
+            hess[:, i, j] = hess[:, j, i] = other * gate
+        for i, dS in enumerate(d_structure):
+            hess[:, i, 3] = hess[:, 3, i] = dS * g_H
+            hess[:, i, 4] = hess[:, 4, i] = dS * g_k
+        hess[:, 3, 3] = structure * g_HH
+        hess[:, 3, 4] = hess[:, 4, 3] = structure * g_Hk
+        hess[:, 4, 4] = structure * g_kk
+        return hess
+
+
+DENSITY_FORMULAS: Dict[str, DensityFormula] = {}
+FORMULA_ALIASES: Dict[str, str] = {}
+
+
+def register_formula(formula: DensityFormula, aliases: Tuple[str, ...] = ()) -> DensityFormula:
+    """
+    Add a formula to the registry under its version string and aliases.
+
+    Raises:
+    -------
+    ValueError if the version or an alias is already registered
+    """
+    for key in (formula.version,) + tuple(aliases):
+        if key in DENSITY_FORMULAS or key in FORMULA_ALIASES:
+            raise ValueError(f"Formula version '{key}' is already registered")
+    DENSITY_FORMULAS[formula.version] = formula
+    for alias in aliases:
+        FORMULA_ALIASES[alias] = formula.version
+    return formula
+
+
+def get_formula(version: str) -> DensityFormula:
+    """
+    Look up a registered formula by version string or alias.
+
+    Raises:
+    -------
+    ValueError if the version is unknown
+    """
+    version = FORMULA_ALIASES.get(version, version)
+    if version not in DENSITY_FORMULAS:
+        available = list(DENSITY_FORMULAS.keys())
+        raise ValueError(f"Unknown formula version '{version}'. Available: {available}")
+    return DENSITY_FORMULAS[version]
+
+
+def _gate_v92(H, kappa, sqrt_H):
+    """(1 - √H) + (H × κ)"""
+    gate = 1.0 - sqrt_H
+    gate += H * kappa
+    return gate
+
+
+def _gate_v92_derivatives(H, kappa, sqrt_H):
+    """g_H = κ - 1/(2√H), g_κ = H, g_HH = 1/(4 H^1.5), g_Hκ = 1, g_κκ = 0"""
+    return kappa - 0.5 / sqrt_H, H, 0.25 / (H * sqrt_H), 1.0, 0.0
+
+
+def _gate_sqrt_derivatives(H, kappa, sqrt_H):
+    """Derivatives of 1 - √H"""
+    return -0.5 / sqrt_H, 0.0, 0.25 / (H * sqrt_H), 0.0, 0.0
+
+
+def _gate_v92_stationary_H(kappa):
+    """κ - 1/(2√H) = 0  →  H = 1/(4κ²) (none for κ = 0)"""
+    kappa = np.asarray(kappa, dtype=np.float64)
+    return np.where(kappa > 0, 0.25 / np.where(kappa > 0, kappa, 1.0) ** 2, np.nan)
+
+
+def _no_stationary_H(kappa):
+    """Gate is monotone in H"""
+    return np.full(np.shape(kappa), np.nan)
+
+
+register_formula(DensityFormula(
+    version="v7",
+    gate=lambda H, kappa, sqrt_H: np.ones_like(H, dtype=np.float64),
+    uses_kappa=False,
+    description="φ × τ × ρ (original v7.0 product, entropy ignored)",
+    gate_derivatives=lambda H, kappa, sqrt_H: (0.0, 0.0, 0.0, 0.0, 0.0),
+    gate_stationary_H=_no_stationary_H
+), aliases=("v7_original", "structure_only"))
+
+register_formula(DensityFormula(
+    version="legacy_linear",
+    gate=lambda H, kappa, sqrt_H: 1.0 - H,
+    gate_min=0.0,
+    uses_kappa=False,
+    description="φ × τ × ρ × max(0, 1 - H)",
+    gate_derivatives=lambda H, kappa, sqrt_H: (-1.0, 0.0, 0.0, 0.0, 0.0),
+    gate_stationary_H=_no_stationary_H
+))
+
+register_formula(DensityFormula(
+    version="legacy_quadratic",
+    gate=lambda H, kappa, sqrt_H: 1.0 - H * H,
+    gate_min=0.0,
+    uses_kappa=False,
+    description="φ × τ × ρ × max(0, 1 - H²)",
+    gate_derivatives=lambda H, kappa, sqrt_H: (-2.0 * H, 0.0, -2.0, 0.0, 0.0),
+    gate_stationary_H=_no_stationary_H
+))
+
+register_formula(DensityFormula(
+    version="legacy_sqrt",
+    gate=lambda H, kappa, sqrt_H: 1.0 - sqrt_H,
+    gate_min=0.0,
+    uses_kappa=False,
+    description="φ × τ × ρ × max(0, 1 - √H)",
+    gate_derivatives=_gate_sqrt_derivatives,
+    gate_stationary_H=_no_stationary_H
+))
+
+register_formula(DensityFormula(
+    version="v8.0",
+    gate=lambda H, kappa, sqrt_H: 1.0 - sqrt_H,
+    uses_kappa=False,
+    description="φ × τ × ρ × (1 - √H)",
+    gate_derivatives=_gate_sqrt_derivatives,
+    gate_stationary_H=_no_stationary_H
+))
+
+register_formula(DensityFormula(
+    version="v8.1",
+    gate=_gate_v92,
+    gate_min=0.0,
+    gate_max=1.0,
+    description="φ × τ × ρ × clamp[(1 - √H) + (H × κ), 0, 1]",
+    gate_derivatives=_gate_v92_derivatives,
+    gate_stationary_H=_gate_v92_stationary_H
+), aliases=("v8.1-clamped",))
+
+register_formula(DensityFormula(
+    version="v9.2",
+    gate=_gate_v92,
+    description="φ × τ × ρ × [(1 - √H) + (H × κ)]",
+    gate_derivatives=_gate_v92_derivatives,
+    gate_stationary_H=_gate_v92_stationary_H
+), aliases=("v9.2_standard",))
+
+
+# =============================================================================
+# Inverse Solver
+# =============================================================================
+#
+# Given a target D and four invariants, find the fifth. D is linear in each
+# structural invariant, so φ, τ and ρ have closed forms. H and κ enter only
+# through the gate, which need not be monotone (the v9.2 gate falls with √H
+# and then rises again through H×κ), so gate roots are bracketed on a scan
+# of [0, 1] and polished with a safeguarded Newton iteration that falls
+# back to bisection whenever a step leaves the bracket.
+
+STRUCTURAL_INVARIANTS = ("phi", "tau", "rho")
+_GATE_SCAN_POINTS = 65
+_GOLDEN = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+def _gate_along(formula: DensityFormula, variable: str, fixed: np.ndarray) -> Callable:
+    """Gate as a function of H (κ fixed) or κ (H fixed), row-wise."""
+    def gate(x: np.ndarray) -> np.ndarray:
+        other = np.broadcast_to(fixed[:, None] if x.ndim == 2 else fixed, x.shape)
+        if variable == "H":
+            return formula.entropy_gate(x, other)
+        return formula.entropy_gate(other, x)
+    return gate
+
+
+def _gate_slope_along(formula: DensityFormula, variable: str, fixed: np.ndarray) -> Callable:
+    """∂gate/∂H or ∂gate/∂κ along one variable (central differences if undeclared)."""
+    gate = _gate_along(formula, variable, fixed)
+    index = 0 if variable == "H" else 1
+
+    def slope(x: np.ndarray) -> np.ndarray:
+        if formula.gate_derivatives is not None:
+            if variable == "H":
+                return formula.gate_gradient(x, fixed)[index]
+            return formula.gate_gradient(fixed, x)[index]
+        lo, hi = np.maximum(x - 1e-7, 0.0), np.minimum(x + 1e-7, 1.0)
+        return (gate(hi) - gate(lo)) / (hi - lo)
+    return slope
+
+
+def _refine_extremum(f: Callable, lo: np.ndarray, hi: np.ndarray, sign: float, iters: int = 60) -> np.ndarray:
+    """Vectorized golden-section search for a minimum (sign=1) or maximum (sign=-1)."""
+    a, b = lo.copy(), hi.copy()
+    for _ in range(iters):
+        c = b - _GOLDEN * (b - a)
+        d = a + _GOLDEN * (b - a)
+        left = sign * f(c) < sign * f(d)
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+    return 0.5 * (a + b)
+
+
+def _solve_gate(
+    formula: DensityFormula,
+    variable: str,
+    fixed: np.ndarray,
+    level: np.ndarray,
+    branch: str,
+    tol: float,
+    max_iter: int
+) -> np.ndarray:
+    """Solve gate(x) = level for x in [0, 1], row-wise; NaN where no root."""
+    gate = _gate_along(formula, variable, fixed)
+    gate_slope = _gate_slope_along(formula, variable, fixed)
+    n = level.shape[0]
+
+    # Scan [0, 1], then add the refined interior extrema as extra nodes so
+    # a root pair on either side of a turning point is always bracketed
+    grid = np.broadcast_to(np.linspace(0.0, 1.0, _GATE_SCAN_POINTS), (n, _GATE_SCAN_POINTS))
+    values = gate(grid)
+    rows = np.arange(n)
+    extra = []
+    for sign, pick in ((1.0, np.argmin), (-1.0, np.argmax)):
+        k = pick(values, axis=1)
+        lo = grid[rows, np.maximum(k - 1, 0)]
+        hi = grid[rows, np.minimum(k + 1, _GATE_SCAN_POINTS - 1)]
+        extra.append(_refine_extremum(gate, lo, hi, sign))
+    nodes = np.sort(np.concatenate([grid, np.stack(extra, axis=1)], axis=1), axis=1)
+    residual = gate(nodes) - level[:, None]
+
+    # A bracket [x_k, x_k+1] holds a root when the residual changes sign or
+    # touches zero at its left end (the right end is checked last)
+    hit = (residual[:, :-1] == 0.0) | (np.signbit(residual[:, :-1]) != np.signbit(residual[:, 1:]))
+    last_zero = residual[:, -1] == 0.0
+    has_root = hit.any(axis=1) | last_zero
+    if branch == "lower":
+        k = np.where(hit.any(axis=1), np.argmax(hit, axis=1), nodes.shape[1] - 2)
+    else:
+        k = np.where(last_zero, nodes.shape[1] - 2,
+                     nodes.shape[1] - 2 - np.argmax(hit[:, ::-1], axis=1))
+
+    lo, hi = nodes[rows, k], nodes[rows, k + 1]
+    f_lo, f_hi = residual[rows, k], residual[rows, k + 1]
+    if branch == "lower":
+        lo_root = f_lo == 0.0
+        hi_root = ~lo_root & (f_hi == 0.0) & ~(np.signbit(f_lo) != np.signbit(f_hi))
+    else:
+        hi_root = f_hi == 0.0
+        lo_root = ~hi_root & (f_lo == 0.0) & ~(np.signbit(f_lo) != np.signbit(f_hi))
+
+    x = 0.5 * (lo + hi)
+    active = has_root & ~lo_root & ~hi_root
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        fx = gate(x) - level
+        # Keep the sub-interval whose ends still have opposite signs
+        same_as_lo = np.signbit(fx) == np.signbit(f_lo)
+        lo = np.where(active & same_as_lo, x, lo)
+        f_lo = np.where(active & same_as_lo, fx, f_lo)
+        hi = np.where(active & ~same_as_lo, x, hi)
+
+        slope = gate_slope(x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - fx / slope
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        x_next = np.where(fx == 0.0, x, np.where(inside, newton, 0.5 * (lo + hi)))
+
+        converged = (fx == 0.0) | (np.abs(x_next - x) <= tol) | (hi - lo <= tol)
+        x = np.where(active, x_next, x)
+        active &= ~converged
+
+    result = np.where(lo_root, lo, np.where(hi_root, hi, x))
+    return np.where(has_root, result, np.nan)
+
+
+def solve_invariant(
+    target,
+    solve_for: str,
+    phi=None,
+    tau=None,
+    rho=None,
+    H=None,
+    kappa=None,
+    version: str = "v9.2",
+    branch: str = "lower",
+    tol: float = 1e-12,
+    max_iter: int = 100
+):
+    """
+    Find the value of one invariant that gives a target density.
+
+    Pass the other four invariants (κ may be omitted for formulas that
+    ignore it). All inputs broadcast against each other, so one call
+    answers any number of queries.
+
+    Parameters:
+    -----------
+    target : float or array-like
+        Target density D
+    solve_for : str
+        Invariant to solve for ('phi', 'tau', 'rho', 'H' or 'kappa')
+    phi, tau, rho, H, kappa : float or array-like
+        Known invariants; the one being solved for must be None
+    version : str
+        Registered formula version (default 'v9.2')
+    branch : str
+        'lower' (smallest solution, default) or 'upper' (largest). Only
+        matters for H and κ, where the gate can reach a level twice.
+    tol : float
+        Absolute tolerance on H or κ
+    max_iter : int
+        Iteration cap for the Newton/bisection stage
+
+    Returns:
+    --------
+    float for scalar inputs, otherwise np.ndarray; NaN where no value in
+    [0, 1] reaches the target. When D does not depend on the invariant
+    (e.g. the other structure is zero) and the target is met anyway, the
+    smallest value, 0.0, is returned.
+
+    Examples:
+    ---------
+    >>> solve_invariant(0.05, "rho", phi=0.8, tau=0.5, H=0.5, kappa=0.5)
+    0.2302...
+    """
+    if solve_for not in INVARIANTS:
+        raise ValueError(f"Unknown invariant '{solve_for}'. Available: {', '.join(INVARIANTS)}")
+    if branch not in ("lower", "upper"):
+        raise ValueError(f"branch must be 'lower' or 'upper', got '{branch}'")
+    formula = get_formula(version)
+    if solve_for == "kappa" and not formula.uses_kappa:
+        raise ValueError(f"Formula '{formula.version}' does not depend on kappa")
+
+    given = dict(zip(INVARIANTS, (phi, tau, rho, H, kappa)))
+    if given[solve_for] is not None:
+        raise ValueError(f"{solve_for} is being solved for and must not be given")
+    if given["kappa"] is None and solve_for != "kappa" and not formula.uses_kappa:
+        given["kappa"] = 0.0
+    missing = [name for name, v in given.items() if v is None and name != solve_for]
+    if missing:
+        raise ValueError(f"Missing invariants: {missing}")
+
+    names = [name for name in INVARIANTS if name != solve_for]
+    scalar = all(np.ndim(v) == 0 for v in [target] + [given[n] for n in names])
+    arrays = np.broadcast_arrays(
+        np.asarray(target, dtype=np.float64), *(np.asarray(given[n], dtype=np.float64) for n in names)
+    )
+    target = np.ravel(arrays[0])
+    known = {name: np.ravel(a) for name, a in zip(names, arrays[1:])}
+    validate_batch(tuple(known.get(name, target * 0.0) for name in INVARIANTS))
+    if target.size and target.min() < 0.0:
+        raise ValueError("target must be >= 0")
+
+    structure = np.ones_like(target)
+    for name in STRUCTURAL_INVARIANTS:
+        if name != solve_for:
+            structure = structure * known[name]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if solve_for in STRUCTURAL_INVARIANTS:
+            denom = structure * formula.entropy_gate(known["H"], known["kappa"])
+            x = target / denom
+            x = np.where(denom == 0.0, np.where(target == 0.0, 0.0, np.nan), x)
+        else:
+            level = target / structure
+            other = known["kappa"] if solve_for == "H" else known["H"]
+            x = np.full_like(target, np.nan)
+            solvable = structure > 0.0
+            if solvable.any():
+                x[solvable] = _solve_gate(
+                    formula, solve_for, other[solvable], level[solvable], branch, tol, max_iter
+                )
+            x = np.where(~solvable & (target == 0.0), 0.0, x)
+
+    x = np.where((x >= 0.0) & (x <= 1.0), x, np.nan)
+    x = x.reshape(arrays[0].shape)
+    return float(x) if scalar else x
+
+
+# =============================================================================
+# Sensitivity
+# =============================================================================
+
+def density_gradient(states: np.ndarray, version: str = "v9.2", validate: bool = True) -> np.ndarray:
+    """(N, 5) analytic gradient of D; see DensityFormula.gradient()."""
+    return get_formula(version).gradient(states, validate=validate)
+
+
+def density_hessian(states: np.ndarray, version: str = "v9.2", validate: bool = True) -> np.ndarray:
+    """(N, 5, 5) analytic Hessian of D; see DensityFormula.hessian()."""
+    return get_formula(version).hessian(states, validate=validate)
+
+
+def rank_sensitivities(
+    states: np.ndarray,
+    version: str = "v9.2",
+    elasticity: bool = False,
+    validate: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rank the invariants by their local influence on D, for every state.
+
+    Parameters:
+    -----------
+    states : np.ndarray
+        (N, 5) array with columns [φ, τ, ρ, H, κ]
+    version : str
+        Registered formula version (default 'v9.2')
+    elasticity : bool
+        Rank by |∂ln D/∂ln x| = |x ∂D/∂x / D| instead of the raw |∂D/∂x|
+        (default False). Elasticities compare relative changes; they are
+        exactly 1 for φ, τ and ρ, so they only rank the gate terms against
+        the structure.
+    validate : bool
+        Check ranges in bulk before computing (default True)
+
+    Returns:
+    --------
+    Tuple (order, scores): order is an (N, 5) array of column indices into
+    INVARIANTS, most influential first; scores is the (N, 5) array of
+    sensitivities that was ranked (NaN where D = 0 for elasticities)
+    """
+    formula = get_formula(version)
+    states = np.asarray(states, dtype=np.float64)
+    grad = formula.gradient(states, validate=validate)
+    scores = np.abs(grad)
+    if elasticity:
+        D = formula.batch(states, validate=False)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.abs(grad * states.reshape(-1, 5) / D[:, None])
+    # NaN scores sort last
+    order = np.argsort(-np.nan_to_num(scores, nan=-np.inf), axis=1, kind='stable')
+    return order, scores
+
+
 # =============================================================================
 # Calibration-Integrated Functions
 # =============================================================================
@@ -171,19 +1033,8 @@ def density_from_state(state_name: str) -> Tuple[float, Dict]:
     if not CALIBRATION_AVAILABLE:
         raise ValueError("Calibration library not available")
 
-    states = get_calibrated_states()
-    if state_name not in states:
-        available = list(states.keys())
-        raise ValueError(f"State '{state_name}' not found. Available: {available}")
-
-    state = states[state_name]
-    decomp = decompose_density(
-        state.phi.value,
-        state.tau.value,
-        state.rho.value,
-        state.H.value,
-        state.kappa.value
-    )
+    registry = get_calibration_registry()
+    decomp = decompose_density(*registry.values[registry.row(state_name)].tolist())
 
     return decomp["D"], decomp
 
@@ -314,6 +1165,141 @@ def compare_all_models(
     }
 
 
+def compare_all_models_batch(
+    states: Optional[np.ndarray] = None,
+    phi=None,
+    tau=None,
+    rho=None,
+    H=None,
+    kappa=None,
+    versions: Optional[Iterable[str]] = None,
+    validate: bool = True
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate registered formulas over a whole corpus in a single pass.
+
+    Validation, the structure product φ × τ × ρ and √H are computed once
+    and shared by every formula; each version only adds its entropy gate.
+
+    Parameters:
+    -----------
+    states : np.ndarray, optional
+        (N, 5) array with columns [φ, τ, ρ, H, κ]
+    phi, tau, rho, H, kappa : array-like, optional
+        Column arrays, used instead of `states`
+    versions : Iterable[str], optional
+        Formula versions to evaluate (default: every registered version)
+    validate : bool
+        Check ranges in bulk before computing (default True)
+
+    Returns:
+    --------
+    Dict mapping version string to an array of D values
+    """
+    phi, tau, rho, H, kappa = as_columns(states, phi, tau, rho, H, kappa)
+    if validate:
+        validate_batch((phi, tau, rho, H, kappa))
+
+    structure = phi * tau
+    structure *= rho
+    sqrt_H = np.sqrt(H)
+
+    if versions is None:
+        versions = DENSITY_FORMULAS.keys()
+
+    results = {}
+    for version in versions:
+        formula = get_formula(version)
+        results[version] = structure * formula.entropy_gate(H, kappa, sqrt_H)
+    return results
+
+
+@dataclass(frozen=True)
+class ValidationCriterion:
+    """
+    One empirical benchmark of run_validation_suite(), as data.
+
+    Attributes:
+        name: Result key in run_validation_suite()
+        kind: 'ratio_above' (D[a] / D[b] > bound), 'within'
+              (lo <= D[a] <= hi) or 'greater' (D[a] > D[b])
+        states: Calibrated state keys the criterion reads
+        bounds: Numeric bounds for 'ratio_above' and 'within'
+        criterion: Human-readable criterion
+    """
+    name: str
+    kind: str
+    states: Tuple[str, ...]
+    bounds: Tuple[float, ...] = ()
+    criterion: str = ""
+
+    def check(self, D: Dict[str, np.ndarray]):
+        """
+        Evaluate the criterion on densities keyed by state (scalars or
+        equally shaped arrays, e.g. Monte Carlo samples).
+        """
+        a = D[self.states[0]]
+        if self.kind == "ratio_above":
+            b = D[self.states[1]]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio = np.where(b > 0, np.divide(a, np.where(b > 0, b, 1.0)), np.inf)
+            return ratio > self.bounds[0]
+        if self.kind == "within":
+            return (self.bounds[0] <= a) & (a <= self.bounds[1])
+        if self.kind == "greater":
+            return a > D[self.states[1]]
+        raise ValueError(f"Unknown criterion kind '{self.kind}'")
+
+    def check_interval(self, bounds: Dict[str, Tuple[float, float]]) -> Optional[bool]:
+        """
+        Decide the criterion for every D within per-state [lo, hi] bounds.
+
+        Returns:
+        --------
+        True if it passes everywhere, False if it fails everywhere, None
+        if the bounds allow both outcomes
+        """
+        a_lo, a_hi = bounds[self.states[0]]
+        if self.kind == "ratio_above":
+            b_lo, b_hi = bounds[self.states[1]]
+            if b_hi > 0 and a_lo / b_hi > self.bounds[0]:
+                return True
+            if b_lo > 0 and a_hi / b_lo <= self.bounds[0]:
+                return False
+            if b_hi == 0 and a_lo > 0:
+                return True
+            return None
+        if self.kind == "within":
+            if self.bounds[0] <= a_lo and a_hi <= self.bounds[1]:
+                return True
+            if a_hi < self.bounds[0] or a_lo > self.bounds[1]:
+                return False
+            return None
+        if self.kind == "greater":
+            b_lo, b_hi = bounds[self.states[1]]
+            if a_lo > b_hi:
+                return True
+            if a_hi <= b_lo:
+                return False
+            return None
+        raise ValueError(f"Unknown criterion kind '{self.kind}'")
+
+
+# The benchmarks checked by run_validation_suite(), for tools that evaluate
+# them over samples or bounds instead of point values
+VALIDATION_CRITERIA: Tuple[ValidationCriterion, ...] = (
+    ValidationCriterion("ketamine_propofol_split", "ratio_above",
+                        ("ketamine_anesthesia", "propofol_anesthesia"), (10.0,), "ratio > 10×"),
+    ValidationCriterion("wakefulness_baseline", "within",
+                        ("wakefulness",), (0.10, 0.15), "0.10 ≤ D ≤ 0.15"),
+    ValidationCriterion("panic_khole_ordering", "greater",
+                        ("panic_attack", "ketamine_anesthesia"), (),
+                        "Panic D > K-hole D (hyper-conscious > dissociated)"),
+    ValidationCriterion("flow_state", "greater",
+                        ("flow_state", "wakefulness"), (), "Flow D > Wakefulness D"),
+)
+
+
 def run_validation_suite() -> Dict[str, Dict]:
     """
     Run validation against key empirical benchmarks.
@@ -11,54 +11,46 @@ Updated: 2026-01-17
 - Added κ (kappa) for coherence (v9.2)
 - Integrated with calibration library
 - Added v9.2 density computation
+- Added StateBatch columnar container and slotted state types
 """
 
 import math
 import sys
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Iterable, Iterator, List, Optional, Dict, Sequence, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+
 # Add calibration to path
 CALIBRATION_PATH = Path(__file__).parent.parent / "calibration"
 if str(CALIBRATION_PATH) not in sys.path:
     sys.path.insert(0, str(CALIBRATION_PATH))
 
 try:
-    from mapping_functions import get_calibrated_states, GroundedState
+    from mapping_functions import (
+        CONFIDENCE_ORDER,
+        calibrate_measurements,
+        get_calibration_registry,
+        GroundedState,
+    )
     CALIBRATION_AVAILABLE = True
 except ImportError:
     CALIBRATION_AVAILABLE = False
 
+try:
+    from .density_models import decompose_density_batch, get_formula, validate_batch
+except ImportError:  # Imported as a top-level module with src/ on sys.path
+    from density_models import decompose_density_batch, get_formula, validate_batch
 
-@dataclass
-class StateVector:
-    """
-    A v9.2 consciousness state encoded as structural topology.
 
-    Attributes:
-        phi: Structural Integration (0-1)
-        tau: Temporal Depth (0-1)
-        rho: Re-entrant Binding (0-1, anchored to PCI)
-        H: Entropy (0-1, anchored to LZc)
-        kappa: Coherence (0-1, anchored to MSE)
-        name: Optional state name
-        confidence: Optional confidence level
+class _StateMethods:
     """
-    phi: float
-    tau: float
-    rho: float
-    H: float
-    kappa: float
-    name: Optional[str] = None
-    confidence: Optional[str] = None
-
-    def __post_init__(self):
-        """Validate all parameters are in range."""
-        for name, val in [("phi", self.phi), ("tau", self.tau),
-                          ("rho", self.rho), ("H", self.H), ("kappa", self.kappa)]:
-            if not 0.0 <= val <= 1.0:
-                raise ValueError(f"{name} must be in range [0.0, 1.0], got {val}")
+    Shared behaviour of every single-state type (StateVector,
+    SlottedStateVector, StateView). Subclasses provide phi, tau, rho, H,
+    kappa, name and confidence.
+    """
+    __slots__ = ()
 
     def to_vector(self) -> List[float]:
         """Convert to 5D vector for database storage."""
@@ -99,7 +91,78 @@ class StateVector:
 
     def __repr__(self) -> str:
         name_str = f"'{self.name}'" if self.name else "unnamed"
-        return f"StateVector({name_str}: φ={self.phi:.2f}, τ={self.tau:.2f}, ρ={self.rho:.2f}, H={self.H:.2f}, κ={self.kappa:.2f}, D={self.density():.4f})"
+        return f"{type(self).__name__}({name_str}: φ={self.phi:.2f}, τ={self.tau:.2f}, ρ={self.rho:.2f}, H={self.H:.2f}, κ={self.kappa:.2f}, D={self.density():.4f})"
+
+
+def _validate_invariants(phi, tau, rho, H, kappa) -> None:
+    """Validate all parameters are in range."""
+    for name, val in [("phi", phi), ("tau", tau),
+                      ("rho", rho), ("H", H), ("kappa", kappa)]:
+        if not 0.0 <= val <= 1.0:
+            raise ValueError(f"{name} must be in range [0.0, 1.0], got {val}")
+
+
+@dataclass(repr=False)
+class StateVector(_StateMethods):
+    """
+    A v9.2 consciousness state encoded as structural topology.
+
+    Attributes:
+        phi: Structural Integration (0-1)
+        tau: Temporal Depth (0-1)
+        rho: Re-entrant Binding (0-1, anchored to PCI)
+        H: Entropy (0-1, anchored to LZc)
+        kappa: Coherence (0-1, anchored to MSE)
+        name: Optional state name
+        confidence: Optional confidence level
+    """
+    phi: float
+    tau: float
+    rho: float
+    H: float
+    kappa: float
+    name: Optional[str] = None
+    confidence: Optional[str] = None
+
+    def __post_init__(self):
+        """Validate all parameters are in range."""
+        _validate_invariants(self.phi, self.tau, self.rho, self.H, self.kappa)
+
+
+class SlottedStateVector(_StateMethods):
+    """
+    StateVector without a per-instance __dict__.
+
+    Same fields, validation and methods as StateVector, for code that keeps
+    many individual states alive. Prefer StateBatch for large collections.
+    """
+    __slots__ = ("phi", "tau", "rho", "H", "kappa", "name", "confidence")
+
+    def __init__(
+        self,
+        phi: float,
+        tau: float,
+        rho: float,
+        H: float,
+        kappa: float,
+        name: Optional[str] = None,
+        confidence: Optional[str] = None
+    ):
+        _validate_invariants(phi, tau, rho, H, kappa)
+        self.phi = phi
+        self.tau = tau
+        self.rho = rho
+        self.H = H
+        self.kappa = kappa
+        self.name = name
+        self.confidence = confidence
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (SlottedStateVector, StateVector)):
+            return NotImplemented
+        return (self.to_vector() == other.to_vector()
+                and self.name == other.name
+                and self.confidence == other.confidence)
 
 
 def encode(
@@ -179,21 +242,18 @@ def encode_from_calibration(state_name: str) -> StateVector:
     if not CALIBRATION_AVAILABLE:
         raise ValueError("Calibration library not available")
 
-    states = get_calibrated_states()
-    if state_name not in states:
-        available = list(states.keys())
-        raise ValueError(f"State '{state_name}' not found. Available: {available}")
-
-    state = states[state_name]
+    registry = get_calibration_registry()
+    row = registry.row(state_name)
+    phi, tau, rho, H, kappa = registry.values[row].tolist()
 
     return StateVector(
-        phi=state.phi.value,
-        tau=state.tau.value,
-        rho=state.rho.value,
-        H=state.H.value,
-        kappa=state.kappa.value,
-        name=state.name,
-        confidence=state.overall_confidence().value
+        phi=phi,
+        tau=tau,
+        rho=rho,
+        H=H,
+        kappa=kappa,
+        name=registry.labels[row],
+        confidence=registry.confidence_of(state_name).value
     )
 
 
@@ -208,10 +268,10 @@ def get_all_calibrated_states() -> Dict[str, StateVector]:
     if not CALIBRATION_AVAILABLE:
         raise ValueError("Calibration library not available")
 
-    states = get_calibrated_states()
+    registry = get_calibration_registry()
     return {
         name: encode_from_calibration(name)
-        for name in states.keys()
+        for name in registry.names
     }
 
 
@@ -313,6 +373,322 @@ def create_trajectory(
     return trajectory
 
 
+# =============================================================================
+# Batch Containers
+# =============================================================================
+
+class StateView(_StateMethods):
+    """
+    Lightweight read-only view of one row of a StateBatch.
+
+    Behaves like a StateVector (same attributes and methods) without
+    copying the row out of the batch.
+    """
+    __slots__ = ("_batch", "_row")
+
+    def __init__(self, batch: "StateBatch", row: int):
+        self._batch = batch
+        self._row = row
+
+    @property
+    def phi(self) -> float:
+        return float(self._batch.values[self._row, 0])
+
+    @property
+    def tau(self) -> float:
+        return float(self._batch.values[self._row, 1])
+
+    @property
+    def rho(self) -> float:
+        return float(self._batch.values[self._row, 2])
+
+    @property
+    def H(self) -> float:
+        return float(self._batch.values[self._row, 3])
+
+    @property
+    def kappa(self) -> float:
+        return float(self._batch.values[self._row, 4])
+
+    @property
+    def name(self) -> Optional[str]:
+        names = self._batch.names
+        return None if names is None else names[self._row]
+
+    @property
+    def confidence(self) -> Optional[str]:
+        confidence = self._batch.confidence
+        return None if confidence is None else confidence[self._row]
+
+    def to_state_vector(self) -> StateVector:
+        """Materialize the row as an independent StateVector."""
+        return StateVector(*self.to_vector(), name=self.name, confidence=self.confidence)
+
+
+class StateBatch:
+    """
+    Columnar collection of v9.2 states.
+
+    Backed by one C-contiguous (N, 5) float64 array with columns
+    [φ, τ, ρ, H, κ], plus optional per-row name and confidence columns.
+    Validation happens once for the whole batch; slicing returns views
+    that share the underlying arrays.
+
+    Attributes:
+        values: (N, 5) float64 array
+        names: Optional (N,) array of state names
+        confidence: Optional (N,) array of confidence labels
+    """
+    __slots__ = ("values", "names", "confidence")
+
+    def __init__(
+        self,
+        values,
+        names: Optional[Sequence[str]] = None,
+        confidence: Optional[Sequence[str]] = None,
+        validate: bool = True
+    ):
+        """
+        Parameters:
+        -----------
+        values : array-like, shape (N, 5)
+            State invariants; used without copying when already a
+            C-contiguous float64 array
+        names, confidence : sequence of str, optional
+            Per-row labels
+        validate : bool
+            Check all invariants lie in [0, 1] (default True)
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.ndim == 1 and values.shape[0] == 5:
+            values = values.reshape(1, 5)
+        if values.ndim != 2 or values.shape[1] != 5:
+            raise ValueError(f"values must have shape (N, 5), got {values.shape}")
+
+        n = values.shape[0]
+        if names is not None:
+            names = np.asarray(names)
+            if names.shape != (n,):
+                raise ValueError(f"names must have shape ({n},), got {names.shape}")
+        if confidence is not None:
+            confidence = np.asarray(confidence)
+            if confidence.shape != (n,):
+                raise ValueError(f"confidence must have shape ({n},), got {confidence.shape}")
+
+        if validate:
+            validate_batch(tuple(values[:, i] for i in range(5)))
+
+        self.values = values
+        self.names = names
+        self.confidence = confidence
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_columns(
+        cls,
+        phi,
+        tau,
+        rho,
+        H,
+        kappa,
+        names: Optional[Sequence[str]] = None,
+        confidence: Optional[Sequence[str]] = None,
+        validate: bool = True
+    ) -> "StateBatch":
+        """Build a batch from five column arrays (broadcast against each other)."""
+        columns = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in (phi, tau, rho, H, kappa)))
+        values = np.empty((columns[0].size, 5), dtype=np.float64)
+        for i, col in enumerate(columns):
+            values[:, i] = col.ravel()
+        return cls(values, names=names, confidence=confidence, validate=validate)
+
+    @classmethod
+    def from_states(cls, states: Iterable[_StateMethods]) -> "StateBatch":
+        """Build a batch from StateVector-like objects (already validated)."""
+        states = list(states)
+        values = np.array([s.to_vector() for s in states], dtype=np.float64).reshape(len(states), 5)
+        names = [s.name for s in states]
+        confidence = [s.confidence for s in states]
+        return cls(
+            values,
+            names=None if all(n is None for n in names) else np.array(names, dtype=object),
+            confidence=None if all(c is None for c in confidence) else np.array(confidence, dtype=object),
+            validate=False
+        )
+
+    # -------------------------------------------------------------------------
+    # Container protocol
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __iter__(self) -> Iterator[StateView]:
+        for row in range(len(self)):
+            yield StateView(self, row)
+
+    def __getitem__(self, key) -> Union[StateView, "StateBatch"]:
+        """
+        Integer keys return a StateView; slices return a StateBatch view
+        sharing memory; index arrays and boolean masks return a copy.
+        """
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            if not -n <= key < n:
+                raise IndexError(f"row {key} out of range for batch of {n}")
+            return StateView(self, int(key) % n)
+
+        batch = StateBatch.__new__(StateBatch)
+        batch.values = self.values[key]
+        batch.names = None if self.names is None else self.names[key]
+        batch.confidence = None if self.confidence is None else self.confidence[key]
+        if not batch.values.flags.c_contiguous:
+            batch.values = np.ascontiguousarray(batch.values)
+        return batch
+
+    def __repr__(self) -> str:
+        return f"StateBatch({len(self)} states)"
+
+    # -------------------------------------------------------------------------
+    # Columns
+    # -------------------------------------------------------------------------
+
+    @property
+    def phi(self) -> np.ndarray:
+        return self.values[:, 0]
+
+    @property
+    def tau(self) -> np.ndarray:
+        return self.values[:, 1]
+
+    @property
+    def rho(self) -> np.ndarray:
+        return self.values[:, 2]
+
+    @property
+    def H(self) -> np.ndarray:
+        return self.values[:, 3]
+
+    @property
+    def kappa(self) -> np.ndarray:
+        return self.values[:, 4]
+
+    def to_vectors(self) -> np.ndarray:
+        """(N, 5) array for database storage (the backing array, not a copy)."""
+        return self.values
+
+    def to_vectors_6d(self) -> np.ndarray:
+        """(N, 6) array with a zero latent dimension."""
+        out = np.zeros((len(self), 6), dtype=np.float64)
+        out[:, :5] = self.values
+        return out
+
+    # -------------------------------------------------------------------------
+    # Density
+    # -------------------------------------------------------------------------
+
+    def density(self, version: str = "v9.2", out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized perspectival density of every state.
+
+        Parameters:
+        -----------
+        version : str
+            Registered formula version (default 'v9.2')
+        out : np.ndarray, optional
+            Preallocated (N,) buffer
+        """
+        return get_formula(version).batch(self.values, out=out, validate=False)
+
+    def decompose(self) -> Dict[str, np.ndarray]:
+        """Vectorized v9.2 decomposition of every state."""
+        return decompose_density_batch(self.values, validate=False)
+
+
+def create_trajectory_batch(
+    state1: _StateMethods,
+    state2: _StateMethods,
+    steps: int = 10
+) -> StateBatch:
+    """
+    Vectorized create_trajectory(): steps + 1 states from state1 to state2.
+
+    Returns:
+    --------
+    StateBatch with rows named 'Interpolated(t)'
+    """
+    t = np.linspace(0.0, 1.0, steps + 1)
+    start = np.asarray(state1.to_vector(), dtype=np.float64)
+    end = np.asarray(state2.to_vector(), dtype=np.float64)
+    values = start + t[:, None] * (end - start)
+    names = np.array([f"Interpolated({x:.2f})" for x in t], dtype=object)
+    return StateBatch(values, names=names)
+
+
+def get_all_calibrated_states_batch() -> StateBatch:
+    """
+    Get all pre-calibrated states as one StateBatch.
+
+    Names are the registry keys (e.g., 'wakefulness'); confidence is the
+    overall confidence label.
+    """
+    if not CALIBRATION_AVAILABLE:
+        raise ValueError("Calibration library not available")
+
+    registry = get_calibration_registry()
+    return StateBatch(
+        registry.values,
+        names=np.array(registry.names, dtype=object),
+        confidence=np.array([registry.confidence_of(n).value for n in registry.names], dtype=object),
+        validate=False
+    )
+
+
+def create_grounded_states_batch(
+    table,
+    names: Optional[Sequence[str]] = None,
+    return_calibration: bool = False
+) -> Union[StateBatch, Tuple[StateBatch, Dict[str, np.ndarray]]]:
+    """
+    Build a StateBatch from a table of empirical measurements in one call.
+
+    Vectorized counterpart of create_grounded_state() for bulk ingestion;
+    see mapping_functions.calibrate_measurements() for the recognised
+    columns. NaN marks a missing measurement.
+
+    Parameters:
+    -----------
+    table : Mapping[str, array-like] or structured np.ndarray
+        Measurement columns, one row per state
+    names : sequence of str, optional
+        Per-row names
+    return_calibration : bool
+        Also return the per-invariant calibration detail (default False)
+
+    Returns:
+    --------
+    StateBatch whose confidence column is the overall (lowest) confidence
+    label of each row; with return_calibration, also the dict of
+    CALIBRATED_DTYPE arrays (value, confidence code, source id)
+    """
+    if not CALIBRATION_AVAILABLE:
+        raise ValueError("Calibration library not available")
+
+    calibrated = calibrate_measurements(table)
+    columns = [calibrated[name] for name in ("phi", "tau", "rho", "H", "kappa")]
+    values = np.stack([c["value"] for c in columns], axis=1)
+    overall = np.min(np.stack([c["confidence"] for c in columns], axis=1), axis=1)
+    labels = np.array([c.value for c in CONFIDENCE_ORDER], dtype=object)
+
+    batch = StateBatch(values, names=names, confidence=labels[overall])
+    if return_calibration:
+        return batch, calibrated
+    return batch
+
+
 # =============================================================================
 # Main Execution
 # =============================================================================
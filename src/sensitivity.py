@@ -0,0 +1,310 @@
+"""
+Sensitivity Module - Conduit Engine v0.2
+
+Global (variance-based) sensitivity analysis of the density formulas.
+
+Estimates first-order and total Sobol indices of D with respect to the five
+invariants using the Saltelli sampling design on a scrambled Sobol
+sequence. Quasi-random points fill the input space far more evenly than
+uniform random draws, so the indices converge with far fewer formula
+evaluations. Evaluation runs through analysis.parallel_evaluate(), and
+results are cached per formula version and settings.
+
+The Sobol generator uses the Joe-Kuo direction numbers with random linear
+matrix scrambling and a digital shift (implemented here; no SciPy needed).
+"""
+
+import copy
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .analysis import DEFAULT_CHUNK_SIZE, parallel_evaluate
+from .density_models import INVARIANTS, get_formula, validate_batch
+
+
+# =============================================================================
+# Scrambled Sobol Sequence
+# =============================================================================
+
+SOBOL_BITS = 30
+
+# Joe & Kuo (2008) direction numbers, dimensions 2-10: (s, a, m_1..m_s).
+# Dimension 1 is the van der Corput sequence.
+_JOE_KUO = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+)
+SOBOL_MAX_DIM = len(_JOE_KUO) + 1
+
+
+def _direction_numbers(d: int) -> np.ndarray:
+    """(d, SOBOL_BITS) direction integers; entry k is v_(k+1) scaled by 2^SOBOL_BITS."""
+    if not 1 <= d <= SOBOL_MAX_DIM:
+        raise ValueError(f"Sobol dimension must be in [1, {SOBOL_MAX_DIM}], got {d}")
+    V = np.zeros((d, SOBOL_BITS), dtype=np.int64)
+    V[0] = [1 << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)]
+    for j, (s, a, m) in enumerate(_JOE_KUO[:d - 1], start=1):
+        v = [0] * SOBOL_BITS
+        for k in range(min(s, SOBOL_BITS)):
+            v[k] = m[k] << (SOBOL_BITS - 1 - k)
+        for k in range(s, SOBOL_BITS):
+            v[k] = v[k - s] ^ (v[k - s] >> s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    v[k] ^= v[k - i]
+        V[j] = v
+    return V
+
+
+def _scramble(V: np.ndarray, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Random linear matrix scrambling of direction numbers, plus a digital shift."""
+    d = V.shape[0]
+    scrambled = np.zeros_like(V)
+    for j in range(d):
+        # Lower-triangular binary matrix with unit diagonal; row r as an
+        # integer whose bit (BITS-1-c) is entry (r, c), matching V's layout
+        rows = []
+        for r in range(SOBOL_BITS):
+            below = int(rng.integers(0, 1 << r)) if r else 0
+            rows.append((below << (SOBOL_BITS - r)) | (1 << (SOBOL_BITS - 1 - r)))
+        for k in range(SOBOL_BITS):
+            v = int(V[j, k])
+            out = 0
+            for r, row in enumerate(rows):
+                if bin(row & v).count("1") & 1:
+                    out |= 1 << (SOBOL_BITS - 1 - r)
+            scrambled[j, k] = out
+    shift = rng.integers(0, 1 << SOBOL_BITS, size=d, dtype=np.int64)
+    return scrambled, shift
+
+
+class SobolSequence:
+    """
+    Scrambled Sobol points in [0, 1)^d with random access by index.
+
+    Balance properties hold for blocks of 2^m consecutive points starting
+    at a multiple of 2^m.
+    """
+
+    def __init__(self, d: int, seed: Optional[int] = 0, scramble: bool = True):
+        self.d = d
+        V = _direction_numbers(d)
+        if scramble:
+            V, shift = _scramble(V, np.random.default_rng(seed))
+        else:
+            shift = np.zeros(d, dtype=np.int64)
+        self._V = V
+        self._shift = shift
+
+    def points(self, start: int, stop: int) -> np.ndarray:
+        """Points [start, stop) as an (n, d) float64 array."""
+        if stop > 1 << SOBOL_BITS:
+            raise ValueError(f"At most 2^{SOBOL_BITS} points are available")
+        index = np.arange(start, stop, dtype=np.int64)
+        gray = index ^ (index >> 1)
+        X = np.broadcast_to(self._shift, (index.size, self.d)).copy()
+        for bit in range(max(int(stop - 1).bit_length(), 1)):
+            X ^= ((gray >> bit) & 1)[:, None] * self._V[:, bit]
+        return X / float(1 << SOBOL_BITS)
+
+
+# =============================================================================
+# Saltelli Design
+# =============================================================================
+
+class SaltelliSpace:
+    """
+    Evaluation points of the Saltelli design, generated chunk by chunk.
+
+    Rows are laid out as blocks of n_base points: A, B, then AB_i for each
+    invariant i (A with column i taken from B). Implements the space
+    protocol of analysis.sweep (__len__ and points(start, stop, out)).
+    """
+
+    def __init__(self, n_base: int, low: np.ndarray, high: np.ndarray, seed: int = 0):
+        self.n_base = n_base
+        self.low = low
+        self.high = high
+        self.sequence = SobolSequence(10, seed=seed)
+
+    def __len__(self) -> int:
+        return self.n_base * (2 + 5)
+
+    def points(self, start: int, stop: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = np.empty((stop - start, 5), dtype=np.float64)
+        row = start
+        while row < stop:
+            block, i = divmod(row, self.n_base)
+            end = min(stop, (block + 1) * self.n_base)
+            base = self.sequence.points(i, i + end - row)
+            A, B = base[:, :5], base[:, 5:]
+            if block == 0:
+                unit = A
+            elif block == 1:
+                unit = B
+            else:
+                unit = A.copy()
+                unit[:, block - 2] = B[:, block - 2]
+            out[row - start:end - start] = self.low + unit * (self.high - self.low)
+            row = end
+        return out
+
+
+def _indices(fA: np.ndarray, fB: np.ndarray, fAB: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    First-order (Saltelli 2010) and total (Jansen) estimators.
+
+    fA, fB have shape (..., N); fAB has shape (5, ..., N).
+    """
+    variance = np.var(np.concatenate([fA, fB], axis=-1), axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = np.mean(fB * (fAB - fA), axis=-1) / variance
+        total = 0.5 * np.mean((fA - fAB) ** 2, axis=-1) / variance
+    return first, total
+
+
+# =============================================================================
+# Sobol Indices
+# =============================================================================
+
+# Results are stored and handed out as deep copies, so callers may mutate them
+_SOBOL_CACHE: Dict[tuple, Dict] = {}
+_SOBOL_CACHE_LOCK = threading.Lock()
+
+
+def sobol_indices(
+    version: str = "v9.2",
+    n_base: int = 2 ** 14,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    n_bootstrap: int = 200,
+    confidence: float = 0.95,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_cache: bool = True
+) -> Dict[str, any]:
+    """
+    First-order and total Sobol indices of D for one formula.
+
+    Inputs are independent and uniform over per-invariant bounds. The
+    design costs n_base × 7 formula evaluations.
+
+    Parameters:
+    -----------
+    version : str
+        Registered formula version (default 'v9.2')
+    n_base : int
+        Base sample size; must be a power of two
+    bounds : Dict[str, (lo, hi)], optional
+        Input ranges (default [0, 1] for every invariant)
+    n_bootstrap : int
+        Bootstrap resamples for the confidence intervals
+    confidence : float
+        Confidence level of the intervals (default 0.95)
+    seed : int
+        Scrambling and bootstrap seed
+    workers : int, optional
+        Worker processes for evaluation (default: all cores)
+    chunk_size : int
+        Points per evaluation chunk
+    use_cache : bool
+        Reuse a cached result for identical settings (default True)
+
+    Returns:
+    --------
+    Dict containing:
+    - 'first_order', 'total': {invariant: index}
+    - 'first_order_ci', 'total_ci': {invariant: (lo, hi)}
+    - 'variance': Var(D) estimate
+    - 'evaluations', 'n_base', 'version'
+    """
+    if n_base < 2 or n_base & (n_base - 1):
+        raise ValueError(f"n_base must be a power of two >= 2, got {n_base}")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+    formula = get_formula(version)
+
+    bounds = dict(bounds or {})
+    unknown = set(bounds) - set(INVARIANTS)
+    if unknown:
+        raise ValueError(f"Unknown invariants: {sorted(unknown)}")
+    low = np.array([bounds.get(name, (0.0, 1.0))[0] for name in INVARIANTS], dtype=np.float64)
+    high = np.array([bounds.get(name, (0.0, 1.0))[1] for name in INVARIANTS], dtype=np.float64)
+    validate_batch((low, high))
+    if np.any(low > high):
+        raise ValueError("Each bound must satisfy low <= high")
+
+    key = (formula.version, n_base, tuple(low), tuple(high), n_bootstrap, confidence, seed)
+    if use_cache:
+        with _SOBOL_CACHE_LOCK:
+            if key in _SOBOL_CACHE:
+                return copy.deepcopy(_SOBOL_CACHE[key])
+
+    space = SaltelliSpace(n_base, low, high, seed=seed)
+    D = parallel_evaluate(space, formula.version, chunk_size=chunk_size, workers=workers)
+    fA, fB = D[:n_base], D[n_base:2 * n_base]
+    fAB = D[2 * n_base:].reshape(5, n_base)
+    first, total = _indices(fA, fB, fAB)
+
+    # Bootstrap over base rows, in batches that keep index arrays small
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(1,)))
+    batch = max(1, (1 << 21) // n_base)
+    boot_first, boot_total = [], []
+    for start in range(0, n_bootstrap, batch):
+        idx = rng.integers(0, n_base, size=(min(batch, n_bootstrap - start), n_base))
+        f, t = _indices(fA[idx], fB[idx], fAB[:, idx])
+        boot_first.append(f)
+        boot_total.append(t)
+    tail = 100 * (1 - confidence) / 2
+    first_ci = np.percentile(np.concatenate(boot_first, axis=1), [tail, 100 - tail], axis=1)
+    total_ci = np.percentile(np.concatenate(boot_total, axis=1), [tail, 100 - tail], axis=1)
+
+    result = {
+        'first_order': dict(zip(INVARIANTS, first.tolist())),
+        'total': dict(zip(INVARIANTS, total.tolist())),
+        'first_order_ci': {name: tuple(first_ci[:, i].tolist()) for i, name in enumerate(INVARIANTS)},
+        'total_ci': {name: tuple(total_ci[:, i].tolist()) for i, name in enumerate(INVARIANTS)},
+        'variance': float(np.var(np.concatenate([fA, fB]))),
+        'evaluations': len(space),
+        'n_base': n_base,
+        'version': formula.version,
+    }
+    if use_cache:
+        with _SOBOL_CACHE_LOCK:
+            _SOBOL_CACHE[key] = copy.deepcopy(result)
+    return result
+
+
+def clear_sobol_cache() -> None:
+    """Drop all cached sobol_indices() results."""
+    with _SOBOL_CACHE_LOCK:
+        _SOBOL_CACHE.clear()
+
+
+# =============================================================================
+# Main Execution
+# =============================================================================
+
+if __name__ == "__main__":
+    for version in ("v7", "v8.1", "v9.2"):
+        result = sobol_indices(version)
+        print("=" * 60)
+        print(f"SOBOL INDICES: {version} ({result['evaluations']:,} evaluations)")
+        print("=" * 60)
+        print(f"{'Invariant':<10} {'First order':>24} {'Total':>24}")
+        for name in INVARIANTS:
+            lo, hi = result['first_order_ci'][name]
+            tlo, thi = result['total_ci'][name]
+            print(f"{name:<10} {result['first_order'][name]:>8.4f} [{lo:6.3f}, {hi:6.3f}] "
+                  f"{result['total'][name]:>8.4f} [{tlo:6.3f}, {thi:6.3f}]")
+        print()
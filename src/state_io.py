@@ -0,0 +1,459 @@
+"""
+State I/O - Conduit Engine
+
+Column-wise record batches of stored states, and bulk export/import of a
+whole collection without per-record round-trips.
+
+Formats (chosen by the path suffix):
+- .parquet          Parquet file (pyarrow)
+- .arrow, .feather  Arrow IPC file (pyarrow), memory-mapped on read
+- anything else     directory of .npy files (memory-mapped on read) and
+                    a metadata.json sidecar describing them
+
+Exports stream: a first pass over the batches fixes the schema (row
+count, vector dimension, kind of every metadata column), a second pass
+writes batch by batch, so memory stays bounded by one batch. Metadata
+columns are numeric (float64, missing = NaN / null), bool or text; a key
+holding numbers in some states and strings in others is exported as text.
+
+Arrow layout: an 'id' string column, a 'vector' fixed-size list<double>
+column of dimension D, and one column per metadata key, written as one
+record batch per scanned batch. Reading it back concatenates the batches,
+which copies the vectors once.
+
+.npy layout: vectors.npy (N, D), ids.npy (fixed-width unicode) and one
+column_<i>.npy per numeric metadata column, all memory-mapped on read, so
+vectors, ids and numeric metadata load without a copy. Bool and text
+columns are stored as JSON lines (column_<i>.jsonl) and are parsed into
+Python objects on read; they are not zero-copy.
+
+Created: 2026-02-06
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+ID_COLUMN = "id"
+VECTOR_COLUMN = "vector"
+
+ARROW_SUFFIXES = (".arrow", ".feather")
+PARQUET_SUFFIXES = (".parquet",)
+
+# Files of the .npy directory format
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.npy"
+METADATA_FILE = "metadata.json"
+NPY_FORMAT_VERSION = 2
+
+# Kinds of exported metadata columns
+NUMERIC, BOOLEAN, TEXT = "numeric", "bool", "text"
+
+
+# =============================================================================
+# Record batches
+# =============================================================================
+
+def _column_array(values: Union[Sequence[Any], np.ndarray]) -> np.ndarray:
+    """
+    Metadata column as an array: float64 (NaN where missing) when every
+    present value is a number, otherwise object (None where missing).
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "iuf":
+            return values.astype(np.float64, copy=False)
+        return values.astype(object, copy=False)
+    numeric = all(
+        value is None or (isinstance(value, (int, float, np.number)) and not isinstance(value, bool))
+        for value in values
+    )
+    if numeric:
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = list(values)
+    return column
+
+
+def _missing(values: np.ndarray) -> np.ndarray:
+    if values.dtype == np.float64:
+        return np.isnan(values)
+    return np.array([value is None for value in values], dtype=bool)
+
+
+class RecordBatch:
+    """
+    Column-wise block of stored states.
+
+    Attributes:
+    -----------
+    ids : np.ndarray
+        (N,) array of state IDs; object, or fixed-width unicode when read
+        from an .npy export
+    vectors : np.ndarray
+        (N, D) float64 vectors; may be a view of backend storage or of a
+        memory-mapped file, so copy before modifying
+    columns : Dict[str, np.ndarray]
+        Metadata key -> (N,) array; numeric keys are float64 with NaN where
+        a state has no value, others are object arrays with None
+    """
+
+    def __init__(
+        self,
+        ids: Union[Sequence[str], np.ndarray],
+        vectors: np.ndarray,
+        columns: Dict[str, Union[Sequence[Any], np.ndarray]]
+    ):
+        if isinstance(ids, np.ndarray) and ids.dtype.kind == "U":
+            self.ids = ids.reshape(-1)
+        else:
+            self.ids = np.asarray(ids, dtype=object).reshape(-1)
+        self.vectors = np.asarray(vectors, dtype=np.float64)
+        if self.vectors.ndim != 2 or self.vectors.shape[0] != self.ids.size:
+            raise ValueError(f"Got {self.ids.size} ids but vectors of shape {self.vectors.shape}")
+        self.columns = {key: _column_array(values) for key, values in columns.items()}
+        for key, values in self.columns.items():
+            if values.size != self.ids.size:
+                raise ValueError(f"Column '{key}' has {values.size} values for {self.ids.size} states")
+
+    def __len__(self) -> int:
+        return self.ids.size
+
+    def metadata(self, i: int) -> Dict[str, Any]:
+        """Metadata dict of state i (missing values omitted)."""
+        meta = {}
+        for key, values in self.columns.items():
+            value = values[i]
+            if value is None or (values.dtype == np.float64 and np.isnan(value)):
+                continue
+            meta[key] = value.item() if isinstance(value, np.generic) else value
+        return meta
+
+
+# =============================================================================
+# Export schema
+# =============================================================================
+
+def _column_kind(values: np.ndarray) -> Optional[str]:
+    """Kind of one batch's column, or None if every value is missing."""
+    if values.dtype == np.float64:
+        return NUMERIC
+    present = [value for value in values.tolist() if value is not None]
+    if not present:
+        return None
+    return BOOLEAN if all(isinstance(value, bool) for value in present) else TEXT
+
+
+def scan_schema(batches: Iterable[RecordBatch]) -> Dict[str, Any]:
+    """
+    Schema pass of an export.
+
+    Parameters:
+    -----------
+    batches : iterable of RecordBatch
+        Every batch to be exported
+
+    Returns:
+    --------
+    Dict with 'count' (states), 'dim' (vector dimension), 'id_width'
+    (longest ID) and 'columns' ({key: kind}, in first-seen order)
+    """
+    count, dim, id_width = 0, None, 1
+    kinds: Dict[str, Optional[str]] = {}
+    for batch in batches:
+        if not len(batch):
+            continue
+        count += len(batch)
+        if dim is None:
+            dim = batch.vectors.shape[1]
+        elif batch.vectors.shape[1] != dim:
+            raise ValueError(f"Vector dimension {batch.vectors.shape[1]} does not match {dim}")
+        id_width = max(id_width, max(len(sid) for sid in batch.ids.tolist()))
+        for key, values in batch.columns.items():
+            kind, seen = _column_kind(values), kinds.get(key)
+            if seen is None or kind is None:
+                kinds[key] = seen or kind
+            elif kind != seen:
+                kinds[key] = TEXT
+    clash = {ID_COLUMN, VECTOR_COLUMN} & set(kinds)
+    if clash:
+        raise ValueError(f"Metadata keys {sorted(clash)} clash with reserved column names")
+    return {
+        "count": count,
+        "dim": dim or 0,
+        "id_width": id_width,
+        "columns": {key: kind or NUMERIC for key, kind in kinds.items()},
+    }
+
+
+def _values(values: np.ndarray, kind: str) -> List[Any]:
+    """Python values of a bool or text column (None where missing)."""
+    convert = str if kind == TEXT else bool
+    return [None if m else convert(v) for v, m in zip(values.tolist(), _missing(values))]
+
+
+# =============================================================================
+# Arrow / Parquet
+# =============================================================================
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Arrow/Parquet export: pip install pyarrow")
+
+
+def arrow_schema(schema: Dict[str, Any]) -> "pa.Schema":
+    """Arrow schema of an export schema (see scan_schema)."""
+    _require_pyarrow()
+    types = {NUMERIC: pa.float64(), BOOLEAN: pa.bool_(), TEXT: pa.string()}
+    return pa.schema(
+        [(ID_COLUMN, pa.string()), (VECTOR_COLUMN, pa.list_(pa.float64(), schema["dim"]))]
+        + [(key, types[kind]) for key, kind in schema["columns"].items()]
+    )
+
+
+def to_arrow(batch: RecordBatch, schema: Optional[Dict[str, Any]] = None) -> "pa.Table":
+    """
+    Arrow table of a record batch (vectors and numeric columns are not copied).
+
+    With an export schema, columns take its kinds and keys the batch lacks
+    become null columns; without one the schema is that of the batch.
+    """
+    _require_pyarrow()
+    if schema is None:
+        schema = scan_schema([batch])
+    target = arrow_schema(schema)
+    flat = pa.array(np.ascontiguousarray(batch.vectors).reshape(-1))
+    arrays = [
+        pa.array(batch.ids.tolist(), type=pa.string()),
+        pa.FixedSizeListArray.from_arrays(flat, schema["dim"]),
+    ]
+    for key, kind in schema["columns"].items():
+        values = batch.columns.get(key)
+        if values is None:
+            arrays.append(pa.nulls(len(batch), type=target.field(key).type))
+        elif kind == NUMERIC:
+            arrays.append(pa.array(values, mask=np.isnan(values)))
+        else:
+            arrays.append(pa.array(_values(values, kind), type=target.field(key).type))
+    return pa.Table.from_arrays(arrays, schema=target)
+
+
+def from_arrow(table: "pa.Table") -> RecordBatch:
+    """Record batch of an Arrow table (vectors without a copy when in one chunk)."""
+    vector = table.column(VECTOR_COLUMN).combine_chunks()
+    dim = vector.type.list_size
+    vectors = vector.flatten().to_numpy(zero_copy_only=False).reshape(len(vector), dim)
+    columns = {
+        name: table.column(name).to_numpy()
+        for name in table.column_names if name not in (ID_COLUMN, VECTOR_COLUMN)
+    }
+    return RecordBatch(table.column(ID_COLUMN).to_numpy(), vectors, columns)
+
+
+def _write_arrow(
+    batches: Iterable[RecordBatch],
+    path: Path,
+    schema: Dict[str, Any],
+    parquet: bool
+) -> int:
+    """Stream batches into a Parquet or Arrow IPC file, one batch at a time."""
+    target = arrow_schema(schema)
+    sink = None
+    if parquet:
+        writer = pq.ParquetWriter(str(path), target)
+    else:
+        sink = pa.OSFile(str(path), "wb")
+        writer = pa.ipc.new_file(sink, target)
+    row = 0
+    try:
+        for batch in batches:
+            if len(batch):
+                writer.write_table(to_arrow(batch, schema))
+                row += len(batch)
+    finally:
+        writer.close()
+        if sink is not None:
+            sink.close()
+    if row != schema["count"]:
+        raise ValueError(
+            f"Expected {schema['count']} states, exported {row}; collection changed during export"
+        )
+    return row
+
+
+# =============================================================================
+# Memory-mapped .npy
+# =============================================================================
+
+def _allocate(path: Path, dtype, shape) -> np.ndarray:
+    """Writable .npy file of the given shape (memory-mapped unless empty)."""
+    if 0 in shape:
+        array = np.empty(shape, dtype=dtype)
+        np.save(path, array)
+        return array
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+
+def _write_npy(batches: Iterable[RecordBatch], directory: Path, schema: Dict[str, Any]) -> int:
+    """Stream batches into preallocated .npy files, JSON-lines columns and the sidecar."""
+    count = schema["count"]
+    directory.mkdir(parents=True, exist_ok=True)
+    vectors = _allocate(directory / VECTORS_FILE, np.float64, (count, schema["dim"]))
+    ids = _allocate(directory / IDS_FILE, f"<U{schema['id_width']}", (count,))
+
+    entries = []
+    numeric: Dict[str, np.ndarray] = {}
+    text: Dict[str, Any] = {}
+    row = 0
+    try:
+        for i, (key, kind) in enumerate(schema["columns"].items()):
+            if kind == NUMERIC:
+                name = f"column_{i}.npy"
+                numeric[key] = _allocate(directory / name, np.float64, (count,))
+            else:
+                name = f"column_{i}.jsonl"
+                text[key] = open(directory / name, "w")
+            entries.append({"key": key, "kind": kind, "file": name})
+
+        for batch in batches:
+            n = len(batch)
+            if row + n > count:
+                raise ValueError(f"Collection grew past {count} states during export")
+            vectors[row:row + n] = batch.vectors
+            ids[row:row + n] = batch.ids
+            for key, column in numeric.items():
+                column[row:row + n] = batch.columns.get(key, np.nan)
+            for key, f in text.items():
+                values = batch.columns.get(key)
+                lines = [None] * n if values is None else _values(values, schema["columns"][key])
+                f.write("".join(json.dumps(value) + "\n" for value in lines))
+            row += n
+    finally:
+        for f in text.values():
+            f.close()
+    if row != count:
+        raise ValueError(f"Expected {count} states, exported {row}; collection changed during export")
+
+    for array in [vectors, ids, *numeric.values()]:
+        if isinstance(array, np.memmap):
+            array.flush()
+    with open(directory / METADATA_FILE, "w") as f:
+        json.dump({
+            "format_version": NPY_FORMAT_VERSION,
+            "count": count,
+            "dim": schema["dim"],
+            "vectors": VECTORS_FILE,
+            "ids": IDS_FILE,
+            "columns": entries,
+        }, f, indent=2)
+    return row
+
+
+def _read_npy(directory: Path, mmap: bool) -> RecordBatch:
+    with open(directory / METADATA_FILE) as f:
+        sidecar = json.load(f)
+    if sidecar.get("format_version") != NPY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported state export version: {sidecar.get('format_version')}")
+    # Empty files cannot be memory-mapped
+    mode = "r" if mmap and sidecar["count"] else None
+
+    columns: Dict[str, Any] = {}
+    for entry in sidecar["columns"]:
+        if entry["kind"] == NUMERIC:
+            columns[entry["key"]] = np.load(directory / entry["file"], mmap_mode=mode)
+        else:
+            with open(directory / entry["file"]) as f:
+                columns[entry["key"]] = [json.loads(line) for line in f]
+    return RecordBatch(
+        np.load(directory / sidecar["ids"], mmap_mode=mode),
+        np.load(directory / sidecar["vectors"], mmap_mode=mode),
+        columns
+    )
+
+
+# =============================================================================
+# Export / import
+# =============================================================================
+
+def export_states(
+    batches: Callable[[], Iterable[RecordBatch]],
+    path: Union[str, Path]
+) -> Dict[str, Any]:
+    """
+    Stream record batches to Parquet, an Arrow IPC file, or an .npy directory.
+
+    Parameters:
+    -----------
+    batches : callable
+        Returns a fresh iterable of RecordBatch on each call, e.g.
+        lambda: db.scan(). It is iterated twice, once to fix the schema and
+        once to write, holding one batch at a time
+    path : str or Path
+        Output path; the suffix picks the format (see module docstring)
+
+    Returns:
+    --------
+    Dict with 'path', 'format', 'n_states' and 'seconds'
+    """
+    path = Path(path)
+    start = time.perf_counter()
+    if path.suffix in PARQUET_SUFFIXES + ARROW_SUFFIXES:
+        _require_pyarrow()
+    schema = scan_schema(batches())
+    if path.suffix in PARQUET_SUFFIXES:
+        n_states = _write_arrow(batches(), path, schema, parquet=True)
+        fmt = "parquet"
+    elif path.suffix in ARROW_SUFFIXES:
+        n_states = _write_arrow(batches(), path, schema, parquet=False)
+        fmt = "arrow"
+    else:
+        n_states = _write_npy(batches(), path, schema)
+        fmt = "npy"
+    return {
+        "path": str(path),
+        "format": fmt,
+        "n_states": n_states,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def read_states(path: Union[str, Path], mmap: bool = True) -> RecordBatch:
+    """
+    Load an export written by export_states as one record batch.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Parquet file, Arrow IPC file, or .npy export directory
+    mmap : bool
+        Memory-map the file instead of reading it into memory. For .npy
+        exports the vectors, ids and numeric columns are then backed by the
+        files (bool and text columns are always parsed); Arrow files are
+        mapped but their record batches are concatenated; Parquet is always
+        decoded
+
+    Returns:
+    --------
+    RecordBatch
+    """
+    path = Path(path)
+    if path.suffix in PARQUET_SUFFIXES:
+        _require_pyarrow()
+        return from_arrow(pq.read_table(str(path), memory_map=mmap))
+    if path.suffix in ARROW_SUFFIXES:
+        _require_pyarrow()
+        source = pa.memory_map(str(path), "r") if mmap else pa.OSFile(str(path), "rb")
+        return from_arrow(pa.ipc.open_file(source).read_all())
+    if not path.is_dir():
+        raise ValueError(f"Not a state export: {path}")
+    return _read_npy(path, mmap)
@@ -0,0 +1,302 @@
+"""
+Uncertainty Module - Conduit Engine v0.2
+
+Monte Carlo propagation of calibration uncertainty into perspectival density.
+
+Every calibrated invariant carries a point value, a confidence level and,
+for some measures, an empirical range. Each invariant is modelled as a
+PERT (scaled beta) distribution with its mode at the calibrated value:
+- With an empirical range, the range is the support
+- Otherwise the support is value ± CONFIDENCE_HALF_WIDTH[confidence],
+  clipped to [0, 1]
+
+All states are sampled together as one (states × samples × 5) array,
+chunk by chunk, so memory stays bounded however many samples are drawn.
+
+When only a yes/no verdict is needed, interval bounds over the same
+supports give guaranteed answers at the cost of one evaluation per state.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .analysis import QuantileReducer
+from .density_models import (
+    CALIBRATION_AVAILABLE,
+    VALIDATION_CRITERIA,
+    get_formula,
+)
+
+if CALIBRATION_AVAILABLE:
+    from mapping_functions import CONFIDENCE_ORDER, get_calibration_registry
+
+
+# =============================================================================
+# Invariant Distributions
+# =============================================================================
+
+# Half-width of the assumed support when no empirical range is recorded
+CONFIDENCE_HALF_WIDTH = {
+    "THEORETICAL": 0.30,
+    "LOW": 0.20,
+    "MODERATE": 0.10,
+    "HIGH": 0.05,
+}
+
+DEFAULT_SAMPLE_CHUNK = 8192
+
+
+def invariant_supports(registry=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    PERT parameters for every calibrated state and invariant.
+
+    Parameters:
+    -----------
+    registry : CalibrationRegistry, optional
+        Defaults to get_calibration_registry()
+
+    Returns:
+    --------
+    Tuple (lo, mode, hi) of (N, 5) arrays
+    """
+    if registry is None:
+        if not CALIBRATION_AVAILABLE:
+            raise ValueError("Calibration library not available")
+        registry = get_calibration_registry()
+
+    mode = np.asarray(registry.values, dtype=np.float64)
+    half_width = np.array(
+        [CONFIDENCE_HALF_WIDTH[c.name] for c in CONFIDENCE_ORDER], dtype=np.float64
+    )[registry.value_confidence]
+    empirical = np.asarray(registry.empirical_range, dtype=np.float64)
+    has_range = ~np.isnan(empirical[..., 0])
+
+    lo = np.where(has_range, empirical[..., 0], mode - half_width)
+    hi = np.where(has_range, empirical[..., 1], mode + half_width)
+    lo = np.clip(lo, 0.0, 1.0)
+    hi = np.clip(hi, 0.0, 1.0)
+    mode = np.clip(mode, lo, hi)
+    return lo, mode, hi
+
+
+def sample_invariants(
+    lo: np.ndarray,
+    mode: np.ndarray,
+    hi: np.ndarray,
+    n_samples: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Draw PERT samples for every state at once.
+
+    Returns:
+    --------
+    np.ndarray of shape (N, n_samples, 5)
+    """
+    width = hi - lo
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.where(width > 0, 1.0 + 4.0 * (mode - lo) / width, 1.0)
+        beta = np.where(width > 0, 1.0 + 4.0 * (hi - mode) / width, 1.0)
+    n = lo.shape[0]
+    draws = rng.beta(alpha[:, None, :], beta[:, None, :], size=(n, n_samples, 5))
+    draws *= width[:, None, :]
+    draws += lo[:, None, :]
+    return draws
+
+
+# =============================================================================
+# Propagation
+# =============================================================================
+
+def propagate_uncertainty(
+    n_samples: int = 100_000,
+    version: str = "v9.2",
+    levels: Sequence[float] = (0.5, 0.9, 0.95),
+    seed: int = 0,
+    chunk_size: int = DEFAULT_SAMPLE_CHUNK,
+    registry=None
+) -> Dict[str, any]:
+    """
+    Propagate calibration uncertainty to D for every calibrated state.
+
+    Parameters:
+    -----------
+    n_samples : int
+        Samples per state (10^6 is fine: memory depends on chunk_size)
+    version : str
+        Registered formula version (default 'v9.2')
+    levels : sequence of float
+        Central credible-interval levels
+    seed : int
+        Base seed; chunk i draws from its own stream, so results do not
+        depend on how many chunks were drawn before it
+    chunk_size : int
+        Samples per state evaluated at once
+    registry : CalibrationRegistry, optional
+        Defaults to get_calibration_registry()
+
+    Returns:
+    --------
+    Dict containing:
+    - 'names': state keys in row order
+    - 'point': (N,) D at the calibrated values
+    - 'mean', 'std': (N,) Monte Carlo moments of D
+    - 'intervals': {level: (N, 2) array of [lo, hi]}
+    - 'prob_greater': (N, N) array, P(D_row > D_column)
+    - 'verdicts': {criterion: fraction of samples passing}, plus
+      'all_pass' for the fraction passing every criterion at once
+    - 'n_samples', 'version'
+    """
+    if registry is None:
+        if not CALIBRATION_AVAILABLE:
+            raise ValueError("Calibration library not available")
+        registry = get_calibration_registry()
+    if n_samples < 1 or chunk_size < 1:
+        raise ValueError("n_samples and chunk_size must be >= 1")
+
+    formula = get_formula(version)
+    lo, mode, hi = invariant_supports(registry)
+    names = tuple(registry.names)
+    n_states = len(names)
+
+    tails = sorted({t for level in levels for t in ((1 - level) / 2, (1 + level) / 2)})
+    quantiles = [QuantileReducer(quantiles=tails, relative_accuracy=1e-4) for _ in names]
+    total = np.zeros(n_states)
+    total_sq = np.zeros(n_states)
+    greater = np.zeros((n_states, n_states), dtype=np.int64)
+    criteria = [c for c in VALIDATION_CRITERIA if all(s in registry.index for s in c.states)]
+    passes = {c.name: 0 for c in criteria}
+    all_pass = 0
+
+    for chunk, start in enumerate(range(0, n_samples, chunk_size)):
+        m = min(chunk_size, n_samples - start)
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk,)))
+        samples = sample_invariants(lo, mode, hi, m, rng)
+        D = formula.batch(samples.reshape(-1, 5), validate=False).reshape(n_states, m)
+
+        total += D.sum(axis=1)
+        total_sq += np.einsum('ij,ij->i', D, D)
+        for row, reducer in enumerate(quantiles):
+            reducer.update(D[row], None, start)
+        for row in range(n_states):
+            greater[row] += np.count_nonzero(D[row] > D, axis=1)
+
+        by_name = {name: D[row] for row, name in enumerate(names)}
+        passed_all = np.ones(m, dtype=bool)
+        for criterion in criteria:
+            passed = criterion.check(by_name)
+            passes[criterion.name] += int(np.count_nonzero(passed))
+            passed_all &= passed
+        all_pass += int(np.count_nonzero(passed_all))
+
+    mean = total / n_samples
+    std = np.sqrt(np.maximum(total_sq / n_samples - mean ** 2, 0.0))
+    tail_values = np.array([[r.result()['quantiles'][t] for t in tails] for r in quantiles])
+    intervals = {
+        level: np.stack([
+            tail_values[:, tails.index((1 - level) / 2)],
+            tail_values[:, tails.index((1 + level) / 2)],
+        ], axis=1)
+        for level in levels
+    }
+
+    verdicts = {name: count / n_samples for name, count in passes.items()}
+    verdicts['all_pass'] = all_pass / n_samples
+
+    return {
+        'names': names,
+        'point': formula.batch(np.asarray(registry.values), validate=False),
+        'mean': mean,
+        'std': std,
+        'intervals': intervals,
+        'prob_greater': greater / n_samples,
+        'verdicts': verdicts,
+        'n_samples': n_samples,
+        'version': formula.version,
+    }
+
+
+# =============================================================================
+# Interval Bounds
+# =============================================================================
+
+def calibration_bounds(version: str = "v9.2", registry=None) -> Dict[str, any]:
+    """
+    Exact D bounds for every calibrated state over its whole support.
+
+    Uses the same supports as the Monte Carlo model (empirical range, or
+    value ± confidence half-width), evaluated as one batch of boxes.
+
+    Returns:
+    --------
+    Dict with 'names', 'lo' and 'hi' ((N,) arrays), and 'version'
+    """
+    if registry is None:
+        if not CALIBRATION_AVAILABLE:
+            raise ValueError("Calibration library not available")
+        registry = get_calibration_registry()
+    formula = get_formula(version)
+    lo, _, hi = invariant_supports(registry)
+    D_lo, D_hi = formula.interval(lo, hi, validate=False)
+    return {'names': tuple(registry.names), 'lo': D_lo, 'hi': D_hi, 'version': formula.version}
+
+
+def interval_verdicts(version: str = "v9.2", registry=None) -> Dict[str, Optional[bool]]:
+    """
+    Guaranteed validation verdicts across the calibration supports.
+
+    Returns:
+    --------
+    Dict mapping each criterion in VALIDATION_CRITERIA to True (passes for
+    every value in the supports), False (fails for every value) or None
+    (the supports allow both outcomes; sample to quantify)
+    """
+    bounds = calibration_bounds(version, registry)
+    by_name = {
+        name: (float(lo), float(hi))
+        for name, lo, hi in zip(bounds['names'], bounds['lo'], bounds['hi'])
+    }
+    return {
+        criterion.name: criterion.check_interval(by_name)
+        for criterion in VALIDATION_CRITERIA
+        if all(state in by_name for state in criterion.states)
+    }
+
+
+def prob_greater(result: Dict[str, any], state_a: str, state_b: str) -> float:
+    """P(D[state_a] > D[state_b]) from a propagate_uncertainty() result."""
+    names = result['names']
+    for name in (state_a, state_b):
+        if name not in names:
+            raise ValueError(f"State '{name}' not found. Available: {', '.join(names)}")
+    return float(result['prob_greater'][names.index(state_a), names.index(state_b)])
+
+
+# =============================================================================
+# Main Execution
+# =============================================================================
+
+if __name__ == "__main__":
+    result = propagate_uncertainty()
+
+    print("=" * 70)
+    print(f"D UNCERTAINTY ({result['n_samples']:,} samples per state, {result['version']})")
+    print("=" * 70)
+    print(f"{'State':<24} {'Point':>8} {'Mean':>8} {'90% interval':>22}")
+    print("-" * 70)
+    for row, name in enumerate(result['names']):
+        lo, hi = result['intervals'][0.9][row]
+        print(f"{name:<24} {result['point'][row]:>8.4f} {result['mean'][row]:>8.4f}   "
+              f"[{lo:.4f}, {hi:.4f}]")
+
+    print()
+    print(f"P(ketamine > propofol): {prob_greater(result, 'ketamine_anesthesia', 'propofol_anesthesia'):.4f}")
+    print(f"P(panic > K-hole):      {prob_greater(result, 'panic_attack', 'ketamine_anesthesia'):.4f}")
+    print()
+    print("Validation verdict stability (fraction of samples passing):")
+    guaranteed = interval_verdicts(result['version'])
+    labels = {True: "always passes", False: "always fails", None: "undetermined"}
+    for name, fraction in result['verdicts'].items():
+        bound = f"   (interval: {labels[guaranteed[name]]})" if name in guaranteed else ""
+        print(f"  {name:<28} {fraction:.4f}{bound}")
@@ -0,0 +1,784 @@
+"""
+Vector Backends - Conduit Engine v0.2
+
+Storage and nearest-neighbor search behind ConduitDB.
+
+- ChromaBackend: the persistent ChromaDB collection (approximate HNSW
+  search, persisted to disk). The default.
+- MemoryBackend: exact search over a memory-resident array. The state
+  space has only 5-6 dimensions, where an exact KD-tree (scipy) or blocked
+  brute-force NumPy search beats an ANN index and never misses a neighbor.
+
+Both report squared Euclidean distances (ChromaDB's default 'l2' space), so
+results are interchangeable.
+
+Metadata predicates use ChromaDB's `where` operators ($eq, $ne, $gt, $gte,
+$lt, $lte, $in, $and). Confidence labels compare by rank, so
+{"confidence": {"$gte": "MODERATE"}} selects MODERATE and HIGH.
+MemoryBackend answers range predicates and ordering from sorted
+secondary indexes kept up to date on every write.
+
+Created: 2026-02-06
+"""
+
+import functools
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+# Below this many states brute force beats building a KD-tree
+TREE_MIN_STATES = 4096
+
+# Distance-matrix entries per brute-force block (bounds temporary memory)
+BRUTE_FORCE_BLOCK = 1 << 22
+
+# Metadata columns MemoryBackend indexes by default
+INDEXED_COLUMNS = ("density", "confidence", "phi", "tau", "rho", "entropy", "kappa")
+
+# Columns compared by rank rather than by value, lowest first
+# (the labels of mapping_functions.CONFIDENCE_ORDER)
+ORDINAL_COLUMNS = {"confidence": ("THEORETICAL", "LOW", "MODERATE", "HIGH")}
+
+COMPARISONS = ("$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in")
+
+
+# =============================================================================
+# Predicates
+# =============================================================================
+
+def parse_where(where: Optional[Dict[str, Any]]) -> List[Tuple[str, str, Any]]:
+    """
+    Flatten a `where` filter into (key, operator, value) conditions (ANDed).
+
+    A bare value means $eq; {"$and": [...]} clauses are flattened.
+    """
+    conditions = []
+    for key, spec in (where or {}).items():
+        if key == "$and":
+            for clause in spec:
+                conditions.extend(parse_where(clause))
+            continue
+        if key.startswith("$"):
+            raise ValueError(f"Unsupported operator '{key}'. Valid: {list(COMPARISONS) + ['$and']}")
+        if not isinstance(spec, dict):
+            spec = {"$eq": spec}
+        for op, value in spec.items():
+            if op not in COMPARISONS:
+                raise ValueError(f"Unsupported operator '{op}'. Valid: {list(COMPARISONS)}")
+            if op == "$in" and not isinstance(value, (list, tuple, set)):
+                raise ValueError(f"$in expects a list, got {value!r}")
+            conditions.append((key, op, value))
+    return conditions
+
+
+def _rank(key: str, value: Any) -> Any:
+    """Comparable form of a value: its rank for ordinal columns."""
+    labels = ORDINAL_COLUMNS.get(key)
+    if labels is None:
+        return value
+    if value not in labels:
+        raise ValueError(f"Unknown {key} '{value}'. Valid: {list(labels)}")
+    return labels.index(value)
+
+
+def _satisfies(op: str, value: Any, target: Any) -> bool:
+    """Whether a stored (ranked) value meets one condition."""
+    if value is None:
+        return False
+    try:
+        if op == "$eq":
+            return value == target
+        if op == "$ne":
+            return value != target
+        if op == "$in":
+            return value in target
+        if op == "$gt":
+            return value > target
+        if op == "$gte":
+            return value >= target
+        if op == "$lt":
+            return value < target
+        return value <= target
+    except TypeError:
+        return False
+
+
+def _ordered(rows: List[int], keys: List[Any], descending: bool) -> List[int]:
+    """Rows sorted by key; rows without a (comparable) key go last."""
+    present = [(k, r) for k, r in zip(keys, rows) if k is not None]
+    missing = [r for k, r in zip(keys, rows) if k is None]
+    present.sort(key=lambda pair: pair[0], reverse=descending)
+    return [r for _, r in present] + missing
+
+
+def _page(total: int, offset: int, limit: Optional[int]) -> Tuple[int, int]:
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must be >= 0")
+    stop = total if limit is None else min(total, offset + limit)
+    return min(offset, total), stop
+
+
+class VectorBackend(ABC):
+    """
+    Interface of a ConduitDB storage backend.
+
+    Vectors are passed as (N, D) float64 arrays, metadata as one dict of
+    scalar values per row.
+    """
+
+    # Largest write accepted in one call (None: unlimited)
+    max_batch_size: Optional[int] = None
+
+    @abstractmethod
+    def upsert(self, ids: Sequence[str], vectors: np.ndarray, metadatas: Sequence[Dict[str, Any]]) -> None:
+        """Insert rows, replacing any existing row with the same ID."""
+
+    @abstractmethod
+    def update(self, ids: Sequence[str], vectors: np.ndarray, metadatas: Sequence[Dict[str, Any]]) -> None:
+        """Replace the vectors and merge the metadata of existing rows."""
+
+    @abstractmethod
+    def delete(self, ids: Sequence[str]) -> None:
+        """Remove rows by ID (unknown IDs are ignored)."""
+
+    @abstractmethod
+    def get(self, where: Dict[str, Any]) -> Dict[str, List]:
+        """
+        Rows whose metadata equals every value in `where`.
+
+        Returns:
+        --------
+        Dict with 'ids' and 'metadatas' lists
+        """
+
+    @abstractmethod
+    def query(self, vectors: np.ndarray, k: int) -> Dict[str, Any]:
+        """
+        k nearest stored rows of each query vector, nearest first.
+
+        Returns:
+        --------
+        Dict containing:
+        - 'ids': M lists of IDs
+        - 'distances': (M, k') squared Euclidean distances, k' = min(k, count)
+        - 'metadatas': M lists of metadata dicts
+        """
+
+    @abstractmethod
+    def knn(self, vectors: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        IDs and squared distances of the k nearest rows, without metadata.
+
+        The caller guarantees 0 < k <= count().
+
+        Returns:
+        --------
+        (ids, distances): (M, k) object and float64 arrays, nearest first
+        """
+
+    @abstractmethod
+    def get_by_ids(self, ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Metadata of the given rows, in the given order."""
+
+    @abstractmethod
+    def select(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Rows matching metadata predicates, ordered and paginated.
+
+        Returns:
+        --------
+        Dict with 'ids' and 'metadatas' of the page and 'total', the number
+        of matching rows
+        """
+
+    @abstractmethod
+    def scan(self, offset: int, limit: int) -> Tuple[List[str], np.ndarray, Dict[str, List[Any]]]:
+        """
+        One page of rows in storage order, column-wise.
+
+        Returns:
+        --------
+        (ids, (n, D) vectors, {key: n values, None where missing})
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored rows."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Delete every row."""
+
+
+def _empty_result(n_queries: int) -> Dict[str, Any]:
+    return {
+        "ids": [[] for _ in range(n_queries)],
+        "distances": np.empty((n_queries, 0), dtype=np.float64),
+        "metadatas": [[] for _ in range(n_queries)],
+    }
+
+
+# =============================================================================
+# ChromaDB
+# =============================================================================
+
+class ChromaBackend(VectorBackend):
+    """Persistent ChromaDB collection."""
+
+    def __init__(self, persist_directory: str, collection_name: str = "topology_space"):
+        """
+        Parameters:
+        -----------
+        persist_directory : str
+            Path where the database is persisted
+        collection_name : str
+            Collection holding the states
+        """
+        import chromadb
+
+        self.collection_name = collection_name
+        self.client = chromadb.PersistentClient(path=persist_directory)
+        self.collection = self._open_collection()
+
+    def _open_collection(self):
+        return self.client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={"description": "Conduit Monism v7.0 - Structural Only"}
+        )
+
+    @property
+    def max_batch_size(self) -> Optional[int]:
+        getter = getattr(self.client, "get_max_batch_size", None)
+        if callable(getter):
+            return getter()
+        return getattr(self.client, "max_batch_size", None)
+
+    def upsert(self, ids, vectors, metadatas) -> None:
+        self.collection.upsert(
+            ids=list(ids),
+            embeddings=np.asarray(vectors, dtype=np.float64).tolist(),
+            metadatas=list(metadatas)
+        )
+
+    def update(self, ids, vectors, metadatas) -> None:
+        self.collection.update(
+            ids=list(ids),
+            embeddings=np.asarray(vectors, dtype=np.float64).tolist(),
+            metadatas=list(metadatas)
+        )
+
+    def delete(self, ids) -> None:
+        ids = list(ids)
+        if ids:
+            self.collection.delete(ids=ids)
+
+    def get(self, where: Dict[str, Any]) -> Dict[str, List]:
+        found = self.collection.get(where=where, include=["metadatas"])
+        return {"ids": found["ids"], "metadatas": found["metadatas"]}
+
+    def query(self, vectors, k: int) -> Dict[str, Any]:
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        k = min(k, self.count())
+        if k <= 0:
+            return _empty_result(vectors.shape[0])
+        results = self.collection.query(query_embeddings=vectors.tolist(), n_results=k)
+        return {
+            "ids": results["ids"],
+            "distances": np.asarray(results["distances"], dtype=np.float64),
+            "metadatas": results["metadatas"],
+        }
+
+    def knn(self, vectors, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        results = self.collection.query(
+            query_embeddings=vectors.tolist(), n_results=k, include=["distances"]
+        )
+        ids = np.empty((vectors.shape[0], k), dtype=object)
+        ids[:] = results["ids"]
+        return ids, np.asarray(results["distances"], dtype=np.float64)
+
+    def get_by_ids(self, ids) -> List[Dict[str, Any]]:
+        ids = list(ids)
+        found = self.collection.get(ids=ids, include=["metadatas"])
+        by_id = dict(zip(found["ids"], found["metadatas"]))
+        return [by_id[sid] for sid in ids]
+
+    def select(self, where=None, order_by=None, descending=False, offset=0, limit=None) -> Dict[str, Any]:
+        # Chroma compares strings only for equality: ranges over ordinal
+        # columns become $in over the qualifying labels
+        clauses = []
+        for key, op, value in parse_where(where):
+            labels = ORDINAL_COLUMNS.get(key)
+            if labels is not None and op in ("$gt", "$gte", "$lt", "$lte"):
+                target = _rank(key, value)
+                op, value = "$in", [l for i, l in enumerate(labels) if _satisfies(op, i, target)]
+            clauses.append({key: {op: value}})
+        chroma_where = None if not clauses else clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+        found = self.collection.get(where=chroma_where, include=["metadatas"])
+        rows = list(range(len(found["ids"])))
+        if order_by is not None:
+            keys = []
+            for meta in found["metadatas"]:
+                try:
+                    keys.append(_rank(order_by, meta.get(order_by)) if order_by in meta else None)
+                except ValueError:
+                    keys.append(None)
+            rows = _ordered(rows, keys, descending)
+        start, stop = _page(len(rows), offset, limit)
+        rows = rows[start:stop]
+        return {
+            "ids": [found["ids"][r] for r in rows],
+            "metadatas": [found["metadatas"][r] for r in rows],
+            "total": len(found["ids"]),
+        }
+
+    def scan(self, offset: int, limit: int):
+        found = self.collection.get(offset=offset, limit=limit, include=["embeddings", "metadatas"])
+        n = len(found["ids"])
+        columns: Dict[str, List[Any]] = {}
+        for i, meta in enumerate(found["metadatas"]):
+            for key, value in (meta or {}).items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * n
+                column[i] = value
+        vectors = np.asarray(found["embeddings"], dtype=np.float64).reshape(n, -1)
+        return list(found["ids"]), vectors, columns
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def reset(self) -> None:
+        self.client.delete_collection(self.collection_name)
+        self.collection = self._open_collection()
+
+
+# =============================================================================
+# Memory-Resident Exact Search
+# =============================================================================
+
+class SortedIndex:
+    """
+    Secondary index of one metadata column: (key, row) pairs sorted by key.
+
+    Range lookups are two binary searches; writes insert and remove in
+    bulk, one pass over the index per write call.
+    """
+
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.float64)
+        self.rows = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.keys.size
+
+    def insert(self, rows: np.ndarray, keys: np.ndarray) -> None:
+        """Add rows (not already indexed) with their keys."""
+        if rows.size == 0:
+            return
+        order = np.lexsort((rows, keys))
+        rows, keys = rows[order], keys[order]
+        position = np.searchsorted(self.keys, keys, side="right")
+        self.keys = np.insert(self.keys, position, keys)
+        self.rows = np.insert(self.rows, position, rows)
+
+    def remove(self, rows: np.ndarray) -> None:
+        """Drop rows from the index."""
+        if rows.size == 0 or self.rows.size == 0:
+            return
+        keep = ~np.isin(self.rows, rows)
+        self.keys = self.keys[keep]
+        self.rows = self.rows[keep]
+
+    def range(self, lo=None, hi=None, lo_open: bool = False, hi_open: bool = False) -> np.ndarray:
+        """Rows with lo <= key <= hi (strict where open), in key order."""
+        start = 0 if lo is None else np.searchsorted(self.keys, lo, side="right" if lo_open else "left")
+        stop = self.keys.size if hi is None else np.searchsorted(self.keys, hi, side="left" if hi_open else "right")
+        return self.rows[start:stop]
+
+
+def _synchronized(method):
+    """Run a MemoryBackend method under the backend's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class MemoryBackend(VectorBackend):
+    """
+    Exact nearest neighbors over a memory-resident array.
+
+    Vectors live in one contiguous float64 array that grows by doubling;
+    metadata is stored column-wise (one list per key, None where a row has
+    no value). The KD-tree and the squared norms used by brute force are
+    rebuilt lazily on the first query after a write. Numeric (and ordinal)
+    values of the indexed columns are kept in SortedIndexes, updated on
+    every write. Nothing is persisted.
+
+    Thread safety: every public read and write holds one re-entrant lock,
+    so a writer thread (e.g. an IngestQueue) and readers may share the
+    backend. Results are copies and stay valid after later writes.
+    Sequences of calls are not atomic.
+    """
+
+    def __init__(
+        self,
+        tree_min_states: int = TREE_MIN_STATES,
+        leaf_size: int = 32,
+        index_columns: Sequence[str] = INDEXED_COLUMNS
+    ):
+        """
+        Parameters:
+        -----------
+        tree_min_states : int
+            Use a KD-tree (when scipy is available) from this many rows up;
+            below it, and without scipy, search by blocked brute force
+        leaf_size : int
+            KD-tree leaf size
+        index_columns : sequence of str
+            Metadata columns with a secondary index (see create_index)
+        """
+        self.tree_min_states = tree_min_states
+        self.leaf_size = leaf_size
+        self.index_columns = tuple(index_columns)
+        self._lock = threading.RLock()
+        self.reset()
+
+    @_synchronized
+    def reset(self) -> None:
+        self._vectors = np.empty((0, 0), dtype=np.float64)
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._id_array = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._indexes: Dict[str, SortedIndex] = {key: SortedIndex() for key in self.index_columns}
+        self._tree = None
+        self._norms = None
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """(count, D) view of the stored vectors."""
+        return self._vectors[:self._size]
+
+    def _check_vectors(self, vectors, n: int) -> np.ndarray:
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        if vectors.shape[0] != n:
+            raise ValueError(f"Got {n} ids but {vectors.shape[0]} vectors")
+        if self._size and vectors.shape[1] != self._vectors.shape[1]:
+            raise ValueError(
+                f"Vector dimension {vectors.shape[1]} does not match stored dimension {self._vectors.shape[1]}"
+            )
+        return vectors
+
+    def _reserve(self, n_new: int, dim: int) -> None:
+        needed = self._size + n_new
+        if self._vectors.shape[1] != dim:
+            self._vectors = np.empty((max(needed, 16), dim), dtype=np.float64)
+        elif needed > self._vectors.shape[0]:
+            grown = np.empty((max(needed, 2 * self._vectors.shape[0]), dim), dtype=np.float64)
+            grown[:self._size] = self._vectors[:self._size]
+            self._vectors = grown
+
+    def _set_metadata(self, row: int, meta: Dict[str, Any], merge: bool) -> None:
+        if not merge:
+            for column in self._columns.values():
+                column[row] = None
+        for key, value in meta.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[key] = [None] * self._size
+            column[row] = value
+
+    def _invalidate(self) -> None:
+        self._tree = None
+        self._norms = None
+
+    @staticmethod
+    def _index_key(key: str, value: Any) -> Optional[float]:
+        """Index key of a stored value, or None if it is not indexable."""
+        if key in ORDINAL_COLUMNS:
+            labels = ORDINAL_COLUMNS[key]
+            return float(labels.index(value)) if value in labels else None
+        if isinstance(value, (int, float, np.number)) and not np.isnan(value):
+            return float(value)
+        return None
+
+    def _index_rows(self, key: str, rows: np.ndarray) -> None:
+        column = self._columns.get(key)
+        if column is None:
+            return
+        pairs = [(row, self._index_key(key, column[row])) for row in rows.tolist()]
+        pairs = [(row, k) for row, k in pairs if k is not None]
+        if pairs:
+            self._indexes[key].insert(
+                np.array([row for row, _ in pairs], dtype=np.int64),
+                np.array([k for _, k in pairs], dtype=np.float64)
+            )
+
+    def _write(self, rows: List[int], vectors: np.ndarray, metadatas, merge: bool, existing: np.ndarray) -> None:
+        """Store vectors and metadata of rows and bring the indexes up to date."""
+        for index in self._indexes.values():
+            index.remove(existing)
+        for row, vector, meta in zip(rows, vectors, metadatas):
+            self._vectors[row] = vector
+            self._set_metadata(row, meta, merge)
+        touched = np.unique(np.asarray(rows, dtype=np.int64))
+        for key in self._indexes:
+            self._index_rows(key, touched)
+        self._invalidate()
+
+    @_synchronized
+    def create_index(self, key: str) -> None:
+        """Add a secondary index on a metadata column (built from current rows)."""
+        if key in self._indexes:
+            return
+        self._indexes[key] = SortedIndex()
+        self.index_columns += (key,)
+        self._index_rows(key, np.arange(self._size, dtype=np.int64))
+
+    @_synchronized
+    def upsert(self, ids, vectors, metadatas) -> None:
+        ids = list(ids)
+        vectors = self._check_vectors(vectors, len(ids))
+        metadatas = list(metadatas)
+        if len(metadatas) != len(ids):
+            raise ValueError(f"Got {len(ids)} ids but {len(metadatas)} metadata dicts")
+
+        existing = np.array(sorted({self._rows[sid] for sid in ids if sid in self._rows}), dtype=np.int64)
+        new = [i for i, sid in enumerate(ids) if sid not in self._rows]
+        self._reserve(len(new), vectors.shape[1])
+        for i in new:
+            if ids[i] in self._rows:  # repeated within this call
+                continue
+            self._rows[ids[i]] = self._size
+            self._ids.append(ids[i])
+            self._id_array = None
+            self._size += 1
+            for column in self._columns.values():
+                column.append(None)
+
+        self._write([self._rows[sid] for sid in ids], vectors, metadatas, False, existing)
+
+    @_synchronized
+    def update(self, ids, vectors, metadatas) -> None:
+        ids = list(ids)
+        vectors = self._check_vectors(vectors, len(ids))
+        missing = [sid for sid in ids if sid not in self._rows]
+        if missing:
+            raise ValueError(f"Cannot update unknown ids: {missing[:5]}")
+        rows = [self._rows[sid] for sid in ids]
+        self._write(rows, vectors, metadatas, True, np.unique(np.asarray(rows, dtype=np.int64)))
+
+    @_synchronized
+    def delete(self, ids) -> None:
+        doomed = np.unique(np.array([self._rows[sid] for sid in ids if sid in self._rows], dtype=np.int64))
+        if doomed.size == 0:
+            return
+        keep = np.ones(self._size, dtype=bool)
+        keep[doomed] = False
+        kept = np.flatnonzero(keep)
+        # Old row -> new row, for remapping the indexes
+        renumber = np.cumsum(keep) - 1
+
+        self._vectors = self._vectors[kept]
+        self._ids = [self._ids[row] for row in kept.tolist()]
+        self._rows = {sid: row for row, sid in enumerate(self._ids)}
+        self._id_array = None
+        self._columns = {key: [column[row] for row in kept.tolist()] for key, column in self._columns.items()}
+        for index in self._indexes.values():
+            index.remove(doomed)
+            index.rows = renumber[index.rows]
+        self._size = kept.size
+        self._invalidate()
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    @_synchronized
+    def count(self) -> int:
+        return self._size
+
+    @_synchronized
+    def scan(self, offset: int, limit: int):
+        stop = min(offset + limit, self._size)
+        offset = min(offset, stop)
+        columns = {key: column[offset:stop] for key, column in self._columns.items()
+                   if any(value is not None for value in column[offset:stop])}
+        return self._ids[offset:stop], self._vectors[offset:stop].copy(), columns
+
+    @_synchronized
+    def metadata(self, row: int) -> Dict[str, Any]:
+        """Metadata dict of one row."""
+        return {key: column[row] for key, column in self._columns.items() if column[row] is not None}
+
+    @_synchronized
+    def get(self, where: Dict[str, Any]) -> Dict[str, List]:
+        rows = range(self._size)
+        for key, value in where.items():
+            column = self._columns.get(key)
+            if column is None:
+                rows = []
+                break
+            rows = [row for row in rows if column[row] == value]
+        return {"ids": [self._ids[row] for row in rows], "metadatas": [self.metadata(row) for row in rows]}
+
+    def _condition_mask(self, key: str, op: str, value: Any) -> np.ndarray:
+        """Boolean row mask of one condition."""
+        mask = np.zeros(self._size, dtype=bool)
+        column = self._columns.get(key)
+        if column is None:
+            return mask
+        target = [_rank(key, v) for v in value] if op == "$in" else _rank(key, value)
+
+        index = self._indexes.get(key)
+        numeric = all(isinstance(t, (int, float)) and not isinstance(t, bool)
+                      for t in (target if op == "$in" else [target]))
+        if index is not None and numeric and op != "$ne":
+            if op == "$in":
+                for t in target:
+                    mask[index.range(t, t)] = True
+            else:
+                lo = target if op in ("$eq", "$gt", "$gte") else None
+                hi = target if op in ("$eq", "$lt", "$lte") else None
+                mask[index.range(lo, hi, lo_open=op == "$gt", hi_open=op == "$lt")] = True
+            return mask
+
+        ordinal = key in ORDINAL_COLUMNS
+        for row, stored in enumerate(column):
+            if ordinal and stored is not None:
+                stored = ORDINAL_COLUMNS[key].index(stored) if stored in ORDINAL_COLUMNS[key] else None
+            mask[row] = _satisfies(op, stored, target)
+        return mask
+
+    @_synchronized
+    def select(self, where=None, order_by=None, descending=False, offset=0, limit=None) -> Dict[str, Any]:
+        mask = np.ones(self._size, dtype=bool)
+        for key, op, value in parse_where(where):
+            mask &= self._condition_mask(key, op, value)
+
+        index = self._indexes.get(order_by) if order_by is not None else None
+        if index is not None:
+            ordered = index.rows[mask[index.rows]]
+            if descending:
+                ordered = ordered[::-1]
+            unindexed = mask.copy()
+            unindexed[index.rows] = False
+            rows = np.concatenate([ordered, np.flatnonzero(unindexed)])
+        elif order_by is not None:
+            candidates = np.flatnonzero(mask).tolist()
+            column = self._columns.get(order_by, [None] * self._size)
+            keys = [self._index_key(order_by, column[r]) if order_by in ORDINAL_COLUMNS else column[r]
+                    for r in candidates]
+            rows = np.array(_ordered(candidates, keys, descending), dtype=np.int64)
+        else:
+            rows = np.flatnonzero(mask)
+
+        start, stop = _page(rows.size, offset, limit)
+        page = rows[start:stop].tolist()
+        return {
+            "ids": [self._ids[r] for r in page],
+            "metadatas": [self.metadata(r) for r in page],
+            "total": int(rows.size),
+        }
+
+    @_synchronized
+    def search(self, vectors, k: int):
+        """
+        Row indices and squared distances of the k nearest rows, nearest first.
+
+        Returns:
+        --------
+        (rows, distances): (M, k') int64 and float64 arrays, k' = min(k, count)
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        k = min(k, self._size)
+        if k <= 0:
+            return np.empty((vectors.shape[0], 0), dtype=np.int64), np.empty((vectors.shape[0], 0))
+        if vectors.shape[1] != self._vectors.shape[1]:
+            raise ValueError(
+                f"Query dimension {vectors.shape[1]} does not match stored dimension {self._vectors.shape[1]}"
+            )
+        if SCIPY_AVAILABLE and self._size >= self.tree_min_states:
+            return self._search_tree(vectors, k)
+        return self._search_brute(vectors, k)
+
+    def _search_tree(self, vectors: np.ndarray, k: int):
+        if self._tree is None:
+            self._tree = cKDTree(self.vectors, leafsize=self.leaf_size)
+        distances, rows = self._tree.query(vectors, k=k)
+        rows = np.asarray(rows, dtype=np.int64).reshape(vectors.shape[0], k)
+        distances = np.asarray(distances).reshape(vectors.shape[0], k)
+        return rows, distances * distances
+
+    def _search_brute(self, vectors: np.ndarray, k: int):
+        stored = self.vectors
+        if self._norms is None:
+            self._norms = np.einsum("ij,ij->i", stored, stored)
+        n_queries = vectors.shape[0]
+        rows = np.empty((n_queries, k), dtype=np.int64)
+        distances = np.empty((n_queries, k), dtype=np.float64)
+        block = max(1, BRUTE_FORCE_BLOCK // self._size)
+
+        for lo in range(0, n_queries, block):
+            q = vectors[lo:lo + block]
+            # ‖x‖² - 2 q·x ranks rows like ‖q - x‖² (‖q‖² is constant per query)
+            scores = self._norms - 2.0 * (q @ stored.T)
+            if k < self._size:
+                candidates = np.argpartition(scores, k - 1, axis=1)[:, :k]
+            else:
+                candidates = np.broadcast_to(np.arange(self._size), scores.shape)
+            # Exact distances of the candidates, then order them
+            diff = stored[candidates] - q[:, None, :]
+            exact = np.einsum("ijk,ijk->ij", diff, diff)
+            order = np.argsort(exact, axis=1, kind="stable")
+            rows[lo:lo + block] = np.take_along_axis(candidates, order, axis=1)
+            distances[lo:lo + block] = np.take_along_axis(exact, order, axis=1)
+        return rows, distances
+
+    @_synchronized
+    def knn(self, vectors, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        rows, distances = self.search(vectors, k)
+        if self._id_array is None:
+            self._id_array = np.array(self._ids, dtype=object)
+        return self._id_array[rows], distances
+
+    @_synchronized
+    def get_by_ids(self, ids) -> List[Dict[str, Any]]:
+        return [self.metadata(self._rows[sid]) for sid in ids]
+
+    @_synchronized
+    def query(self, vectors, k: int) -> Dict[str, Any]:
+        rows, distances = self.search(vectors, k)
+        return {
+            "ids": [[self._ids[r] for r in row] for row in rows],
+            "distances": distances,
+            "metadatas": [[self.metadata(r) for r in row] for row in rows],
+        }
+
+
+BACKENDS = {"chroma": ChromaBackend, "memory": MemoryBackend}